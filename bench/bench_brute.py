@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#  Python benchmark                                   Date : 2026-10-18
+'''
+_______________|  bench_brute.py :: Parallel grid search of optimize.minBrute
+
+Time op.minBrute() on hw.loss_holt, the loss of optimize_holt(method=
+'brute'), for a monthly series (50 years) and a daily series (20 years),
+by increasing numbers of worker processes. The speed-up is relative to
+the serial search; results must be identical.
+
+           Usage:  $ python3 bench/bench_brute.py  [grids] [max workers]
+                   # defaults: 20 grids per parameter, all CPUs.
+                   # fecon236 must be importable, e.g. after pip install,
+                   # or from project root:  $ PYTHONPATH=. python3 bench/...
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from fecon236.oc import optimize as op
+from fecon236.tsa import holtwinters as hw
+
+
+def synth(points, freq):
+    '''Geometric random walk dataframe of given length and frequency.'''
+    index = pd.date_range('1970-01-01', periods=points, freq=freq)
+    values = 100 * np.exp(np.cumsum(np.random.RandomState(236).normal(
+        0.0003, 0.01, points)))
+    return pd.DataFrame({'Y': values}, index=index)
+
+
+def main(grids=20, maxworkers=None):
+    maxworkers = maxworkers or os.cpu_count() or 1
+    counts = sorted(set([1] + [2 ** k for k in range(1, 6)
+                               if 2 ** k <= maxworkers] + [maxworkers]))
+    print(' ::  {} x {} grid, {} CPUs.'.format(grids, grids,
+                                               os.cpu_count()))
+    for label, data in [('monthly 600', synth(600, 'MS')),
+                        ('daily 5000', synth(5000, 'B'))]:
+        serial = None
+        for workers in counts:
+            start = time.perf_counter()
+            result = op.minBrute(fun=hw.loss_holt, funarg=(data,),
+                                 boundpairs=[(0.0, 1.0), (0.0, 1.0)],
+                                 grids=grids, workers=workers)
+            secs = time.perf_counter() - start
+            if serial is None:
+                serial, best = secs, result
+            assert np.array_equal(result, best)
+            print('{:>14} {:>3} workers: {:8.3f} s  {:6.2f}x'.format(
+                label, workers, secs, serial / secs))
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(main(int(args[0]) if args else 20,
+                  int(args[1]) if len(args) > 1 else None))
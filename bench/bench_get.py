@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#  Python benchmark                                   Date : 2026-10-18
+'''
+_______________|  bench_get.py :: Throughput of fetch-parse-resample, offline.
+
+Synthetic FRED-format daily series are seeded into a replay directory,
+then served by the local stand-in server of fecon236.host.replay with
+simulated vendor latency. Each series goes through the real path:
+session fetch, fred.readfile, then fred.monthly resampling.
+The disk cache is bypassed, so every retrieval reaches the server.
+
+           Usage:  $ python3 bench/bench_get.py  [codes] [latency] [workers]
+                   # defaults: 32 codes, 0.05 seconds latency, 8 workers.
+                   # fecon236 must be importable, e.g. after pip install,
+                   # or from project root:  $ PYTHONPATH=. python3 bench/...
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  synthcsv() imported from shared benchdata module.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import sys
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from fecon236.host import fred
+from fecon236.host import replay
+from benchdata import synthcsv
+
+
+def one(code):
+    '''Fetch, parse, and resample one series.'''
+    return fred.monthly(fred.getdata_fred(code))
+
+
+def main(ncodes=32, latency=0.05, workers=8):
+    rec = tempfile.mkdtemp()
+    codes = ['SYNTH{:04d}'.format(i) for i in range(ncodes)]
+    content = synthcsv()
+    for code in codes:
+        replay.seed(rec, fred.makeURL(code), content)
+    print(' ::  {} codes, {:.3f} s latency, {:,} bytes each.'.format(
+        ncodes, latency, len(content)))
+    with replay.replaying(rec, latency=latency):
+        start = time.perf_counter()
+        for code in codes:
+            one(code)
+        serial = time.perf_counter() - start
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(one, codes))
+        pooled = time.perf_counter() - start
+    for label, secs in [('serial', serial),
+                        ('{} workers'.format(workers), pooled)]:
+        print('{:>12}: {:8.3f} s  {:8.1f} series/s'.format(
+            label, secs, ncodes / secs))
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(main(int(args[0]) if args else 32,
+                  float(args[1]) if len(args) > 1 else 0.05,
+                  int(args[2]) if len(args) > 2 else 8))
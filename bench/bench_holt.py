@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#  Python benchmark                                   Date : 2026-10-18
+'''
+_______________|  bench_holt.py :: Holt-Winters filters versus Python loop.
+
+Compare hw.holt_winters_growth(), computed as linear filters in C,
+against the reference recursion hw._holt_winters_growth_loop(),
+on a daily series as long as S&P 500 history (15,000 points).
+Also times holt() and loss_holt() which depend on it.
+
+           Usage:  $ python3 bench/bench_holt.py  [points] [repeat]
+                   # defaults: 15000 points, best of 5 repeats.
+                   # fecon236 must be importable, e.g. after pip install,
+                   # or from project root:  $ PYTHONPATH=. python3 bench/...
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import sys
+import time
+import numpy as np
+import pandas as pd
+from fecon236.tsa import holtwinters as hw
+
+
+def synthspx(points=15000):
+    '''Daily dataframe like SPX: geometric random walk from 1960.'''
+    index = pd.bdate_range('1960-01-04', periods=points)
+    values = 60 * np.exp(np.cumsum(np.random.RandomState(236).normal(
+        0.0003, 0.01, points)))
+    return pd.DataFrame({'Y': values}, index=index)
+
+
+def best(fun, repeat):
+    '''Minimum seconds of fun() over repeat calls.'''
+    secs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fun()
+        secs.append(time.perf_counter() - start)
+    return min(secs)
+
+
+def main(points=15000, repeat=5):
+    spx = synthspx(points)
+    y = spx['Y'].values
+    hw.holt_winters_growth(y[:10])
+    #  ^first call pays the deferred import of scipy.signal.
+    loop = best(lambda: hw._holt_winters_growth_loop(y), repeat)
+    filt = best(lambda: hw.holt_winters_growth(y), repeat)
+    l1, b1 = hw.holt_winters_growth(y)
+    l2, b2 = hw._holt_winters_growth_loop(y)
+    print(' ::  {:,} points, best of {} repeats.'.format(points, repeat))
+    print('{:>24}: {:10.5f} s'.format('loop', loop))
+    print('{:>24}: {:10.5f} s  {:8.1f}x'.format('filter', filt, loop / filt))
+    print('{:>24}: {:10.3g} {:10.3g}'.format(
+        'max rel. diff l, b', np.max(np.abs(l1 - l2) / np.abs(l2)),
+        np.max(np.abs(b1 - b2)) / np.max(np.abs(b2))))
+    print('{:>24}: {:10.5f} s'.format(
+        'holt()', best(lambda: hw.holt(spx), repeat)))
+    print('{:>24}: {:10.5f} s'.format(
+        'loss_holt()', best(lambda: hw.loss_holt((0.26, 0.19), spx),
+                            repeat)))
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(main(int(args[0]) if args else 15000,
+                  int(args[1]) if len(args) > 1 else 5))
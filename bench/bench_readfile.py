@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#  Python benchmark                                   Date : 2026-10-18
+'''
+_______________|  bench_readfile.py :: Rows per second of fred.readfile()
+
+Compare the fast path fred.readfile_fred() which knows FRED's DATE,VALUE
+layout, against the general fred.readfile_infer() with date inference,
+on our supplemental gzip CSV archives.
+
+           Usage:  $ python3 bench/bench_readfile.py  [archive.csv.gz ...]
+                   # Without arguments, archives used by fecon236.host.fred
+                   # are looked up in the current directory; if none are
+                   # found, a FRED-format daily archive is synthesized.
+                   # fecon236 must be importable, e.g. after pip install,
+                   # or from project root:  $ PYTHONPATH=. python3 bench/...
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import sys
+import gzip
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+from fecon236.host import fred
+
+
+archives = ['FRED-SP500_1957-2014-ARC.csv.gz',
+            'FRED-EURUSD_1971-2002-ARC.csv.gz',
+            'FRED-home-Case-Shiller_1987-2013.csv.gz']
+
+repeat = 5
+#        ^Best of repeated timings is reported.
+
+
+def synthesize(filename, rows=25000):
+    '''Write FRED-format daily gzip CSV, with "." for some missing values.'''
+    dates = pd.bdate_range('1920-01-01', periods=rows)
+    values = np.round(100 * np.exp(np.cumsum(
+        np.random.normal(0, 0.01, rows))), 4).astype(str)
+    values[np.random.uniform(size=rows) < 0.03] = '.'
+    with gzip.open(filename, 'wt') as f:
+        f.write('DATE,VALUE\n')
+        for date, value in zip(dates.strftime('%Y-%m-%d'), values):
+            f.write(date + ',' + value + '\n')
+    return filename
+
+
+def besttime(reader, filename):
+    '''Best elapsed seconds of reader over repeated runs, and rows read.'''
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = reader(filename, compress='gzip')
+        best = min(best, time.perf_counter() - start)
+    return best, len(df.index)
+
+
+def main(filenames):
+    if not filenames:
+        filenames = [f for f in archives if os.path.exists(f)]
+    if not filenames:
+        tmpdir = tempfile.mkdtemp()
+        filenames = [synthesize(os.path.join(tmpdir,
+                                             'SYNTH-daily-ARC.csv.gz'))]
+        print(' ::  No archives found here, so synthesized one.')
+    print('{:>40} {:>8} {:>12} {:>12} {:>8}'.format(
+        'archive', 'rows', 'infer r/s', 'fast r/s', 'speedup'))
+    for filename in filenames:
+        slow, rows = besttime(fred.readfile_infer, filename)
+        fast, _ = besttime(fred.readfile_fred, filename)
+        print('{:>40} {:>8d} {:>12,.0f} {:>12,.0f} {:>7.1f}x'.format(
+            os.path.basename(filename)[-40:], rows,
+            rows / slow, rows / fast, slow / fast))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
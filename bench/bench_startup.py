@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#  Python benchmark                                   Date : 2026-10-18
+'''
+_______________|  bench_startup.py :: Import time and cold start, budgeted.
+
+Short-lived workers pay for imports and the first get() every time.
+Each measurement runs in a FRESH interpreter, taking the minimum over
+repeats, and is compared against a BUDGET in seconds:
+
+  import:fecon236            import of the package itself (lazy).
+  import:<module>            import of each module in modules below.
+  get:cold                   first get() in a fresh process: imports,
+                             request to the local stand-in server of
+                             fecon236.host.replay, parsing, caching.
+  get:warm                   second get() of the same code: disk cache.
+
+           Usage:  $ python3 bench/bench_startup.py  [options]
+                   # -r, --repeat N        fresh processes per item.
+                   # -l, --latency SECS    simulated vendor latency.
+                   # -b, --budget KEY=SECS override, e.g. get:cold=2
+                   # Exit status is 1 if any budget is exceeded.
+                   # fecon236 must be importable, e.g. after pip install,
+                   # or from project root:  $ PYTHONPATH=. python3 bench/...
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  synthcsv() imported from shared benchdata module.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import ast
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+from benchdata import synthcsv
+
+
+modules = ['fecon236.tool', 'fecon236.host.fred', 'fecon236.host.qdl',
+           'fecon236.host.stock', 'fecon236.tsa.holtwinters',
+           'fecon236.dst.gaussmix', 'fecon236.visual.plots',
+           'fecon236.util.group']
+
+budgets = {'import:fecon236': 1.0,
+           'import:fecon236.tool': 1.5,
+           'import:fecon236.host.fred': 1.5,
+           'import:fecon236.host.qdl': 1.5,
+           'import:fecon236.host.stock': 2.5,
+           'import:fecon236.tsa.holtwinters': 1.5,
+           'import:fecon236.dst.gaussmix': 3.0,
+           'import:fecon236.visual.plots': 3.0,
+           'import:fecon236.util.group': 5.0,
+           'get:cold': 3.0,
+           'get:warm': 1.0}
+#         ^Seconds, generous for a laptop: meant to catch regressions,
+#          e.g. a heavy import creeping back into the package namespace.
+
+IMPORT = '''
+import time
+t0 = time.perf_counter()
+import {0}
+print(repr({{'import:{0}': time.perf_counter() - t0}}))
+'''
+
+GET = '''
+import time
+t0 = time.perf_counter()
+import fecon236 as fe
+from fecon236.host import cache, replay
+cache.CACHEDIR = {cachedir!r}
+with replay.replaying({rec!r}, latency={latency!r}, caching=True):
+    t1 = time.perf_counter()
+    fe.get('SYNTH0001')
+    t2 = time.perf_counter()
+    fe.get('SYNTH0001')
+    t3 = time.perf_counter()
+print(repr({{'get:cold': t2 - t0, 'get:warm': t3 - t2}}))
+'''
+#  get:cold includes importing fecon236, as a new worker would.
+
+
+def fresh(script):
+    '''Run script in a fresh interpreter, return its printed dictionary.'''
+    out = subprocess.check_output([sys.executable, '-c', script],
+                                  universal_newlines=True)
+    return ast.literal_eval(out.strip().splitlines()[-1])
+
+
+def measure(repeat=3, latency=0.01):
+    '''Dictionary of minimum seconds over repeat fresh processes.'''
+    from fecon236.host import fred, replay
+    best = {}
+
+    def keep(result):
+        for key, secs in result.items():
+            best[key] = min(secs, best.get(key, secs))
+
+    for _ in range(repeat):
+        for module in ['fecon236'] + modules:
+            keep(fresh(IMPORT.format(module)))
+    rec = tempfile.mkdtemp()
+    try:
+        replay.seed(rec, fred.makeURL('SYNTH0001'), synthcsv())
+        for _ in range(repeat):
+            cachedir = tempfile.mkdtemp(dir=rec)
+            keep(fresh(GET.format(cachedir=cachedir, rec=rec,
+                                  latency=latency)))
+    finally:
+        shutil.rmtree(rec, ignore_errors=True)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='bench_startup.py')
+    parser.add_argument('-r', '--repeat', type=int, default=3)
+    parser.add_argument('-l', '--latency', type=float, default=0.01)
+    parser.add_argument('-b', '--budget', action='append', default=[],
+                        metavar='KEY=SECS')
+    parser.add_argument('--json', action='store_true',
+                        help='print results as JSON only')
+    args = parser.parse_args(argv)
+    limits = dict(budgets)
+    for item in args.budget:
+        key, secs = item.split('=')
+        limits[key] = float(secs)
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    #  ^plots import without a display, e.g. on servers.
+    best = measure(args.repeat, args.latency)
+    over = [key for key in best if best[key] > limits.get(key, 1e9)]
+    if args.json:
+        print(json.dumps(best, indent=1, sort_keys=True))
+    else:
+        for key in sorted(best):
+            print('{:<36} {:8.3f} s  budget {:6.2f} s  {}'.format(
+                key, best[key], limits.get(key, float('nan')),
+                'OVER' if key in over else 'ok'))
+    if over:
+        print(' !!  Budget exceeded: ' + ', '.join(sorted(over)),
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
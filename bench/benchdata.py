@@ -0,0 +1,28 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  benchdata.py :: Synthetic data shared by bench scripts.
+
+Imported by the scripts in this directory, e.g. bench_get.py, which
+Python runs with bench/ first on sys.path:
+
+        Usage:  from benchdata import synthcsv
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version: synthcsv() from bench_get and bench_startup.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+import pandas as pd
+
+
+def synthcsv(rows=2600):
+    '''FRED-format CSV bytes of a daily series, about ten years.'''
+    dates = pd.bdate_range('2008-01-01', periods=rows)
+    values = np.round(100 * np.exp(np.cumsum(
+        np.random.normal(0, 0.01, rows))), 4).astype(str)
+    lines = ['DATE,VALUE'] + [d + ',' + v for d, v in
+                              zip(dates.strftime('%Y-%m-%d'), values)]
+    return ('\n'.join(lines) + '\n').encode('ascii')
@@ -1,5 +1,5 @@
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
-#  Python package installation                        Date : 2018-11-29
+#  Python package installation                        Date : 2026-10-18
 '''
 _______________|  fecon236/__init__.py :: Project import architecture
 
@@ -16,6 +16,14 @@ References:  https://github.com/kennethreitz/samplemod
              https://github.com/kennethreitz/setup.py
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Explicit ImportError below Python 3.7, required by PEP 562.
+2026-10-18  LAZY imports by module __getattr__, see _modules, _starred.
+2026-10-18  Add host/preload to tree map.
+2026-10-18  Add host/quota to tree map.
+2026-10-18  Add host/replay to tree map.
+2026-10-18  Add host/ahostess to tree map.
+2026-10-18  Add host/session to tree map.
+2026-10-18  Add host/cache and host/warehouse to tree map.
 2018-11-29  Add creditprof() in new rates/credit module.
 2018-06-22  Annotated TREE "map" for package directory.
 2018-06-21  Include boltzmann module as boltz.
@@ -36,36 +44,96 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import absolute_import, print_function, division
 
+import sys as _sys
+from importlib import import_module as _import_module
 import numpy as np                                                       # noqa
 import pandas as pd                                                      # noqa
 
 from fecon236.util import system                                         # noqa
-from fecon236.util import group                                          # noqa
-from fecon236 import top                                                 # noqa
-from fecon236.tool import *                                              # noqa
-
-from fecon236.host.fred import *                                         # noqa
-from fecon236.host.qdl import *                                          # noqa
-from fecon236.host.stock import *                                        # noqa
-from fecon236.host.hostess import get                                    # noqa
-
-from fecon236.visual import plots                                        # noqa
-from fecon236.visual.plots import plot, plotn, boxplot                   # noqa
-from fecon236.tsa import holtwinters as hw                               # noqa
-from fecon236.oc import optimize as op                                   # noqa
-from fecon236.dst import gaussmix as gmix                                # noqa
-from fecon236.dst.gaussmix import gemrat, gm2gem                         # noqa
-
-from fecon236.boots import bootstrap as bs                               # noqa
-from fecon236.prob import sim                                            # noqa
-from fecon236.math import matrix as mat                                  # noqa
-from fecon236.ml import learn                                            # noqa
-from fecon236.prtf import boltzmann as boltz                             # noqa
-
-from fecon236.futures.cftc import groupcotr                              # noqa
-from fecon236.econ.infl import foreinfl                                  # noqa
-from fecon236.rates.fedfunds import forefunds                            # noqa
-from fecon236.rates.credit import creditprof                             # noqa
+
+if _sys.version_info < (3, 7):
+    raise ImportError('fecon236 requires Python 3.7 or later, see setup.py,'
+                      ' e.g. for lazy imports by module __getattr__.')
+    #  Else names would fail by AttributeError without hint why.
+
+
+#  LAZY IMPORTS:  modules below are imported upon FIRST ACCESS of a name,
+#  e.g. fe.get or fe.hw, by the module __getattr__() per PEP 562,
+#  since some pull in matplotlib, sympy, statsmodels, or scipy.
+#  So "import fecon236 as fe" is fast, e.g. for short-lived batch jobs,
+#  while "from fecon236 import *" still imports everything.
+
+_modules = {'group': 'fecon236.util.group',
+            'top': 'fecon236.top',
+            'tool': 'fecon236.tool',
+            'plots': 'fecon236.visual.plots',
+            'hw': 'fecon236.tsa.holtwinters',
+            'op': 'fecon236.oc.optimize',
+            'gmix': 'fecon236.dst.gaussmix',
+            'bs': 'fecon236.boots.bootstrap',
+            'sim': 'fecon236.prob.sim',
+            'mat': 'fecon236.math.matrix',
+            'learn': 'fecon236.ml.learn',
+            'boltz': 'fecon236.prtf.boltzmann'}
+#           ^Module aliases.
+
+_names = {'get': 'fecon236.host.hostess',
+          'plot': 'fecon236.visual.plots',
+          'plotn': 'fecon236.visual.plots',
+          'boxplot': 'fecon236.visual.plots',
+          'gemrat': 'fecon236.dst.gaussmix',
+          'gm2gem': 'fecon236.dst.gaussmix',
+          'groupcotr': 'fecon236.futures.cftc',
+          'foreinfl': 'fecon236.econ.infl',
+          'forefunds': 'fecon236.rates.fedfunds',
+          'creditprof': 'fecon236.rates.credit'}
+#         ^Functions, by their module.
+
+_starred = ['fecon236.tool', 'fecon236.host.fred',
+            'fecon236.host.qdl', 'fecon236.host.stock']
+#          ^Formerly star imported: any other public name is searched
+#           there in this order, e.g. fe.diflog imports only tool.
+
+
+def _loadall():
+    '''Import everything, as the former eager star imports did.'''
+    for modname in _starred:
+        module = _import_module(modname)
+        globals().update((k, v) for k, v in vars(module).items()
+                         if not k.startswith('_'))
+    for name in list(_modules) + list(_names):
+        __getattr__(name)
+    return
+
+
+def __getattr__(name):
+    '''Import name upon first access, then keep it in package namespace.'''
+    if name == '__all__':
+        _loadall()
+        return [k for k in globals() if not k.startswith('_')]
+    elif name in _modules:
+        value = _import_module(_modules[name])
+    elif name in _names:
+        value = getattr(_import_module(_names[name]), name)
+    elif name.startswith('_'):
+        raise AttributeError("module 'fecon236' has no attribute "
+                             + repr(name))
+    else:
+        for modname in _starred:
+            module = _import_module(modname)
+            if name in vars(module):
+                value = vars(module)[name]
+                break
+        else:
+            raise AttributeError("module 'fecon236' has no attribute "
+                                 + repr(name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    '''Names loaded so far, and aliases (see _loadall for everything).'''
+    return sorted(set(globals()) | set(_modules) | set(_names))
 
 
 map = '''Annotated tree map of package directory [with module aliases]
@@ -82,11 +150,18 @@ map = '''Annotated tree map of package directory [with module aliases]
     ├── futures
     │   └── cftc.py
     ├── host
+    │   ├── ahostess.py   (Async get, Python 3.7+)
+    │   ├── cache.py   (Local disk cache)
     │   ├── fred.py
     │   ├── hostess.py
     │   ├── qdl.py
     │   ├── _ex_Quandl.py
-    │   └── stock.py
+    │   ├── preload.py   (Warm cache, see bin/preload)
+    │   ├── quota.py   (Pacing within call limits)
+    │   ├── replay.py   (Offline record and replay)
+    │   ├── session.py   (Pooled HTTP)
+    │   ├── stock.py
+    │   └── warehouse.py   (Columnar binary store)
     ├── math
     │   └── matrix.py   [mat]
     ├── ml   (Machine Learning)
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-06-17
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  cftc.py :: For futures markets under CFTC
@@ -12,6 +12,7 @@ REFERENCE
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  groupcotr() preloads all underlying CFTC reports at once.
 2018-06-17  First version: groupcotr() spin-off from util.group module.
 '''
 
@@ -38,6 +39,8 @@ def groupcotr(group=cotr4w, alpha=0):
        which is a smoothing parameter: 0 < alpha < 1 (try 0.26).
     '''
     #  For detailed derivation, see https://git.io/cotr
+    qdl.cotr_preload(group.values())
+    #  ^each CFTC report downloaded once, concurrently, then shared.
     positions = groupget(group)
     norpositions = groupfun(tool.normalize, positions)
     #  Default alpha argument will skip SMOOTHING operation...
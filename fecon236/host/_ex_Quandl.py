@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-05-23
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  _ex_Quandl.py :: fecon236 fork of Quandl API 2.8.9.
@@ -32,6 +32,12 @@ REFERENCES:
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Multiset suffixes repeated columns, merges if dates repeat.
+2026-10-18  Calls are paced within Quandl limits by host/quota.py,
+                get() accepts priority keyword, see quota module.
+2026-10-18  Multiset get() downloads concurrently, then one concat
+                replaces quadratic folding by repeated outer merge.
+2026-10-18  Download through pooled keep-alive connections of session.
 2018-05-23  _ex_Quandl.py, fecon236 fork of Quandl.py version 2.8.9.
                 Fix over 80 flake8 violations. Pass test_qdl.py.
 2016-04-22  [Ignore newly introduced complex Quandl package version 3.]
@@ -43,12 +49,17 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import (print_function, division, absolute_import,
                         unicode_literals)
+import io
 import pickle
+import threading
 import datetime
 import json
 import pandas as pd
 import re
 from dateutil import parser
+from concurrent.futures import ThreadPoolExecutor
+from fecon236.host import quota
+from fecon236.host import session
 
 try:
     from urllib.error import HTTPError  # Python 3
@@ -65,6 +76,13 @@ except ImportError:
 QUANDL_API_URL = 'https://www.quandl.com/api/v1/'
 VERSION = '2.8.7'
 #         ^2.8.9 removed push(), but failed to update VERSION variable.
+MULTISET_WORKERS = 4
+#                  ^Concurrent downloads for a list of datasets.
+_tokenlock = threading.Lock()
+#            ^Serializes authtoken.p access by concurrent downloads.
+QUOTA_MAXWAIT = 900
+#               ^Seconds a call may wait for quota, see host/quota.py,
+#                beyond which CallLimitExceeded is raised instead.
 
 
 def get(dataset, **kwargs):
@@ -83,6 +101,8 @@ def get(dataset, **kwargs):
         either `numpy` for a numpy ndarray or `pandas`. Default: `pandas`
     :param bool verbose: print output text to stdout? Default is False.
     :param str text: Deprecated. Use `verbose` instead.
+    :param int priority: Queue priority when pacing calls within quota,
+        see host/quota.py, e.g. quota.HIGH. Default: quota.NORMAL
     :returns: :class:`pandas.DataFrame` or :class:`numpy.ndarray`
 
     Note that Pandas expects timeseries data to be sorted ascending for most
@@ -108,22 +128,7 @@ def get(dataset, **kwargs):
 
     # Array
     elif type(dataset) == list:
-        multiple_dataset_dataframe = pd.DataFrame()
-        for i in dataset:
-            try:
-                d = get(i, **kwargs)
-            except DatasetNotFound:
-                d = pd.DataFrame({'NOT FOUND': []})
-
-            # format dataset name for column name
-            specific_column_name = i.split('.')[0].replace('/', '.')
-            d.rename(columns=lambda x: specific_column_name + ' - ' + x,
-                     inplace=True)
-            multiple_dataset_dataframe = pd.merge(multiple_dataset_dataframe,
-                                                  d, right_index=True,
-                                                  left_index=True,
-                                                  how='outer')
-        return multiple_dataset_dataframe
+        return _getmultiset(dataset, **kwargs)
 
     # If wrong format
     else:
@@ -139,6 +144,7 @@ def get(dataset, **kwargs):
                 verbose = True
         else:
             verbose = bool(kwargs['text'])
+    priority = kwargs.pop('priority', quota.NORMAL)
     auth_token = _getauthtoken(kwargs.pop('authtoken', ''), verbose)
     trim_start = _parse_dates(kwargs.pop('trim_start', None))
     trim_end = _parse_dates(kwargs.pop('trim_end', None))
@@ -152,14 +158,16 @@ def get(dataset, **kwargs):
     if returns == 'url':
         return url      # for test purpose
     try:
-        urldata = _download(url)
+        urldata = _download(url, priority)
         if verbose and verbose != 'no':
             print("Returning Dataframe for ", dataset)
 
     # Error catching
     except HTTPError as e:
         # API limit reached
-        if str(e) == 'HTTP Error 403: Forbidden':
+        if str(e) in ['HTTP Error 403: Forbidden',
+                      'HTTP Error 429: Too Many Requests']:
+            quota.exhausted()
             error = 'API daily call limit exceeded.'
             raise CallLimitExceeded(error)
 
@@ -209,7 +217,10 @@ def search(query, source=None, page=1, authtoken=None,
         url += '&source_code=' + source
     # Page to be searched
     url += '&page=' + str(page)
-    text = urlopen(url).read().decode("utf-8")
+    if not quota.acquire(quota.NORMAL, QUOTA_MAXWAIT):
+        raise CallLimitExceeded('Quandl quota would be exceeded, '
+                                'see quota.usage()')
+    text = session.fetch(url).decode("utf-8")
     data = json.loads(text)
     try:
         datasets = data['docs']
@@ -234,6 +245,44 @@ def search(query, source=None, page=1, authtoken=None,
     return datalist
 
 
+# Multiset: fetch datasets concurrently, then align all frames at once.
+# (Folding by repeated outer merge copied the growing frame each time.)
+# Repeated column names, e.g. from a repeated dataset, get suffix .1, .2
+# Repeated dates cannot be aligned by concat, so then merge as formerly.
+def _getmultiset(datasets, **kwargs):
+    def one(i):
+        try:
+            d = get(i, **kwargs)
+        except DatasetNotFound:
+            d = pd.DataFrame({'NOT FOUND': []},
+                             index=pd.DatetimeIndex([], name='Date'))
+        # format dataset name for column name
+        specific_column_name = i.split('.')[0].replace('/', '.')
+        return d.rename(columns=lambda x: specific_column_name + ' - ' + x)
+
+    if not datasets:
+        return pd.DataFrame()
+    workers = max(1, min(MULTISET_WORKERS, len(datasets)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(one, datasets))
+    seen = {}
+    for d in frames:
+        names = []
+        for name in d.columns:
+            repeat = seen.get(name, 0)
+            seen[name] = repeat + 1
+            names.append(name + '.' + str(repeat) if repeat else name)
+        d.columns = names
+    if all(d.index.is_unique for d in frames):
+        return pd.concat(frames, axis=1, join='outer').sort_index()
+    multiple_dataset_dataframe = frames[0]
+    for d in frames[1:]:
+        multiple_dataset_dataframe = pd.merge(multiple_dataset_dataframe,
+                                              d, right_index=True,
+                                              left_index=True, how='outer')
+    return multiple_dataset_dataframe
+
+
 # format date, if None returns None
 def _parse_dates(date):
     if date is None:
@@ -250,8 +299,13 @@ def _parse_dates(date):
 
 
 # Download data into pandas dataframe
-def _download(url):
-    dframe = pd.read_csv(url, index_col=0, parse_dates=True)
+def _download(url, priority=quota.NORMAL):
+    if not quota.acquire(priority, QUOTA_MAXWAIT):
+        raise CallLimitExceeded('Quandl quota would be exceeded, '
+                                'see quota.usage()')
+    content = session.fetch(url)
+    #         ^shared keep-alive connections, raises HTTPError as urlopen.
+    dframe = pd.read_csv(io.BytesIO(content), index_col=0, parse_dates=True)
     return dframe
 
 
@@ -276,6 +330,11 @@ def _pushcodetest(code):
 
 def _getauthtoken(token, text):
     """Return and save API token to a pickle file for reuse."""
+    with _tokenlock:
+        return _getauthtoken_unlocked(token, text)
+
+
+def _getauthtoken_unlocked(token, text):
     try:
         savedtoken = pickle.load(open('authtoken.p', 'rb'))
     except IOError:
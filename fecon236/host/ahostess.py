@@ -0,0 +1,141 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  ahostess.py :: Asynchronous counterpart of hostess.get()
+
+hostess.get() blocks until its series arrives. Here aget() can be awaited
+from Jupyter or an asyncio service without blocking the event loop,
+and aget_many() retrieves dozens of series concurrently:
+
+        Usage:  df = await aget(fred.d4xau)
+                dfs = await aget_many([fred.d4xau, qdl.w4cotr_xau],
+                                      timeout=60)
+                #     ^dictionary of dataframes keyed by code.
+
+- Vendor ORDER follows hostess.vendor(code): a likely Quandl code goes
+  to Quandl first, instead of first failing at FRED as get() does.
+- HEDGED vendors: if the first vendor fails, or has not answered within
+  ahedge seconds, the other vendor is queried concurrently, and the
+  first successful answer is taken, as in stock.hedged().
+- TIMEOUT in seconds applies to each code (None waits indefinitely),
+  and asyncio.TimeoutError is raised, or returned by aget_many()
+  if return_exceptions=True.
+- CANCELLATION of the awaiting task is immediate for the event loop.
+  However, a download already running in its worker thread cannot be
+  interrupted: it completes in the background, and is then discarded.
+
+The blocking retrievals run in a thread pool, so the network layer
+(host/session.py) and the local disk cache (host/cache.py) are shared
+with the synchronous functions.
+
+ Dependencies:  Python 3.7 or later, as for the package (see setup.py),
+                e.g. asyncio.get_running_loop() and asyncio.run().
+                Still imported separately from the rest of the package.
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Hedge the other vendor upon slow response, as in stock.py.
+2026-10-18  Use asyncio.get_running_loop() within coroutine.
+2026-10-18  First version: aget() and aget_many().
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import asyncio
+import functools
+from asyncio import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from fecon236.util import system
+from fecon236.host.hostess import vendor
+
+
+alimit = 8
+#        ^Default maximum number of concurrent retrievals in aget_many().
+
+ahedge = 10
+#        ^Default seconds before the other vendor is also queried.
+
+
+def _getters(code, maxi=0):
+    '''List of blocking retrieval functions for code, in vendor order.'''
+    #  Deferred imports, for the same reason as in hostess.get().
+    import fecon236.host.fred
+    import fecon236.host.qdl
+    import fecon236.host.stock
+    args = (code, maxi) if maxi else (code,)
+    if vendor(code) == 'stock':
+        return [functools.partial(fecon236.host.stock.getstock, *args)]
+    getfred = functools.partial(fecon236.host.fred.getfred, code)
+    getqdl = functools.partial(fecon236.host.qdl.getqdl, *args)
+    if vendor(code) == 'quandl':
+        return [getqdl, getfred]
+    else:
+        return [getfred, getqdl]
+
+
+async def _aget(code, maxi, executor, hedge):
+    '''Await retrieval of code in executor, hedging vendors in order.'''
+    loop = asyncio.get_running_loop()
+    #      ^Python 3.7+, unlike get_event_loop() never creates a loop.
+    getters = _getters(code, maxi)
+    if len(getters) == 1:
+        #  Stock failure reports its real cause, as in hostess.get().
+        return await loop.run_in_executor(executor, getters[0])
+    pending = set()
+    try:
+        while True:
+            if getters:
+                pending.add(loop.run_in_executor(executor, getters.pop(0)))
+            if not pending:
+                raise ValueError('INVALID symbol string or code variable.')
+                #                 ^every vendor failed.
+            done, pending = await asyncio.wait(
+                pending, timeout=hedge if getters else None,
+                return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+            #  ^a slow vendor answers in background, and is discarded.
+
+
+async def aget(code, maxi=0, timeout=None, executor=None, hedge=None):
+    '''Asynchronous hostess.get(): await dataframe for code.
+       timeout in seconds, else asyncio.TimeoutError is raised.
+       executor defaults to the event loop's default thread pool.
+       hedge in seconds (default ahedge) before the other vendor is
+       also queried, as it is at once if the first vendor fails.
+    '''
+    if hedge is None:
+        hedge = ahedge
+    return await asyncio.wait_for(_aget(code, maxi, executor, hedge),
+                                  timeout)
+
+
+async def aget_many(codes, maxi=0, timeout=None, limit=alimit,
+                    return_exceptions=False):
+    '''Await dictionary of dataframes for codes, retrieved concurrently.
+       At most limit retrievals run at once; timeout applies per code.
+       If return_exceptions is True, a failed code maps to its
+       exception, instead of the first failure being raised.
+    '''
+    codes = list(codes)
+    semaphore = asyncio.Semaphore(limit)
+    executor = ThreadPoolExecutor(max_workers=limit)
+
+    async def one(code):
+        async with semaphore:
+            return await aget(code, maxi, timeout, executor)
+
+    try:
+        results = await asyncio.gather(*[one(code) for code in codes],
+                                       return_exceptions=return_exceptions)
+    finally:
+        executor.shutdown(wait=False)
+        #  ^never block the event loop, e.g. upon cancellation.
+    return dict(zip(codes, results))
+
+
+if __name__ == "__main__":
+    system.endmodule()
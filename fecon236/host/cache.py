@@ -0,0 +1,290 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  cache.py :: Local disk cache for downloaded series.
+
+Repeated retrievals of the same series, e.g. by re-running a notebook
+or a batch job, should not pay the network and parsing cost every time.
+Downloads are stored in a local cache directory, keyed by vendor and code,
+and served from disk until they EXPIRE.
+
+        Usage:  df = cache.fetch('fred', fredcode, download)
+                #                               ^callable, no arguments,
+                #                                used only upon cache miss.
+
+- Time-to-live depends on the FREQUENCY of the series, since a quarterly
+  series does not need to be checked as often as a daily series.
+  The frequency is inferred once from the index when the series is stored.
+- Cache size is capped by MAXBYTES: least recently used (LRU) entries
+  are evicted first.
+- Bypass: set CACHING = False to disable the cache globally,
+  or use refresh=True to force a new download (which updates the cache).
+- Directory defaults to ~/.fecon236/cache but can be set by
+  the environment variable FECON236_CACHE, or by CACHEDIR directly.
+
+The cache index is a small JSON file which records for each entry:
+when it was stored and last accessed, its size in bytes, and its
+frequency class. Deleting the cache directory is always safe.
+A cache hit only READS the index: access times are kept in memory and
+written with the next store() or evict(), else by flush() at exit.
+
+Entries are stored in the columnar binary format of the warehouse module,
+so a cache hit is a memory-mapped read without any text parsing.
+Supplemental archives are likewise converted once by readarchive().
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Defer access times of cache hits to store, evict, or flush.
+2026-10-18  Store entries by warehouse module, add readarchive().
+2026-10-18  First version: disk cache for fred.getdata_fred().
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import re
+import json
+import time
+import atexit
+import threading
+import numpy as np
+import pandas as pd
+from fecon236.util import system
+from fecon236.host import warehouse
+
+
+CACHING = True
+#         ^Global switch: False bypasses the cache entirely.
+
+CACHEDIR = os.environ.get('FECON236_CACHE',
+                          os.path.join(os.path.expanduser('~'),
+                                       '.fecon236', 'cache'))
+
+MAXBYTES = 256 * 1024 * 1024
+#          ^Cap on total size of cached files, LRU eviction beyond.
+
+#  TIME-TO-LIVE in seconds, keyed by frequency class of the series:
+ttl_secs = {'d': 43200,        # daily:      12 hours
+            'w': 86400,        # weekly:      1 day
+            'm': 259200,       # monthly:     3 days
+            'q': 604800,       # quarterly:   7 days
+            'a': 2592000}      # annual:     30 days
+
+_indexfile = 'index.json'
+_lock = threading.RLock()
+#       ^Reentrant lock guards the index, e.g. for concurrent downloads.
+_accessed = {}
+#           ^Pending access times of cache hits, keyed by path of entry.
+
+
+def freqclass(dataframe):
+    '''Classify frequency of dataframe by minimum index delta: d, w, m, q, a.
+    >>> freqclass(pd.DataFrame({'Y': [1., 2.]},
+    ...           index=pd.to_datetime(['2018-01-01', '2018-02-01'])))
+    'm'
+    '''
+    if len(dataframe.index) < 2:
+        return 'd'
+        #      ^Too short to tell, so be conservative.
+    nanosecs = np.diff(dataframe.index.values).min()
+    days = nanosecs / np.timedelta64(1, 'D')
+    if days < 3:
+        return 'd'
+    elif days < 20:
+        return 'w'
+    elif days < 60:
+        return 'm'
+    elif days < 200:
+        return 'q'
+    else:
+        return 'a'
+
+
+def keyname(vendor, code):
+    '''Create filename-safe cache key from vendor and code.
+    >>> keyname('qdl', 'CFTC/GC_FO_ALL')
+    'qdl_CFTC_GC_FO_ALL'
+    '''
+    return vendor + '_' + re.sub(r'[^A-Za-z0-9_.-]', '_', code)
+
+
+def _path(key):
+    '''Full path of cached warehouse directory for given key.'''
+    return os.path.join(CACHEDIR, key)
+
+
+def _loadindex():
+    '''Read cache index from disk, empty dict if unavailable.'''
+    try:
+        with open(os.path.join(CACHEDIR, _indexfile)) as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+    for key, entry in index.items():
+        entry['accessed'] = max(entry['accessed'],
+                                _accessed.get(_path(key), 0))
+    return index
+
+
+def _saveindex(index):
+    '''Write cache index to disk atomically.'''
+    path = os.path.join(CACHEDIR, _indexfile)
+    tmp = path + '.' + str(os.getpid()) + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(index, f, indent=0, sort_keys=True)
+    os.replace(tmp, path)
+    #  ^Atomic, so readers never see a partial index.
+    for key in index:
+        _accessed.pop(_path(key), None)
+    #  ^Pending access times, merged by _loadindex(), are now on disk.
+
+
+def load(vendor, code, maxage=None):
+    '''Load cached dataframe if present and fresh, else return None.
+       maxage in seconds overrides the frequency based time-to-live.
+    '''
+    key = keyname(vendor, code)
+    with _lock:
+        index = _loadindex()
+        entry = index.get(key)
+        if entry is None:
+            return None
+        if maxage is None:
+            maxage = ttl_secs.get(entry['freq'], ttl_secs['d'])
+        now = time.time()
+        if now - entry['stored'] > maxage:
+            return None
+            #  Expired, but file is kept until overwritten or evicted.
+        try:
+            dataframe = warehouse.load(_path(key))
+        except Exception:
+            dataframe = None
+        if dataframe is None:
+            del index[key]
+            _accessed.pop(_path(key), None)
+            _saveindex(index)
+            return None
+            #  Corrupt or missing file is treated as a cache miss.
+        _accessed[_path(key)] = now
+        #  ^Index is NOT rewritten upon a hit, see flush().
+    return dataframe
+
+
+def flush():
+    '''Write pending access times of cache hits to the index.'''
+    prefix = os.path.join(CACHEDIR, '')
+    with _lock:
+        pending = [path for path in _accessed if path.startswith(prefix)]
+        if pending and os.path.isdir(CACHEDIR):
+            _saveindex(_loadindex())
+        for path in pending:
+            _accessed.pop(path, None)
+            #  ^Including entries no longer in the index.
+    return
+
+
+atexit.register(flush)
+#  ^So LRU order survives the process, e.g. a batch of cache hits.
+
+
+def store(vendor, code, dataframe):
+    '''Store dataframe in cache, then evict least recently used if needed.'''
+    key = keyname(vendor, code)
+    with _lock:
+        if not os.path.isdir(CACHEDIR):
+            os.makedirs(CACHEDIR)
+        path = _path(key)
+        warehouse.save(path, dataframe)
+        now = time.time()
+        index = _loadindex()
+        index[key] = {'stored': now, 'accessed': now,
+                      'bytes': warehouse.nbytes(path),
+                      'freq': freqclass(dataframe)}
+        _saveindex(index)
+        evict()
+    return
+
+
+def evict(maxbytes=None):
+    '''Delete least recently used entries until total size <= maxbytes.'''
+    if maxbytes is None:
+        maxbytes = MAXBYTES
+    with _lock:
+        index = _loadindex()
+        total = sum(entry['bytes'] for entry in index.values())
+        if total <= maxbytes:
+            return
+        lru = sorted(index, key=lambda k: index[k]['accessed'])
+        for key in lru:
+            if total <= maxbytes:
+                break
+            total -= index[key]['bytes']
+            del index[key]
+            try:
+                warehouse.delete(_path(key))
+            except OSError:
+                pass
+        _saveindex(index)
+    return
+
+
+def clear(vendor=None):
+    '''Remove cached entries, optionally only those of a given vendor.'''
+    with _lock:
+        index = _loadindex()
+        for key in list(index):
+            if vendor is None or key.startswith(vendor + '_'):
+                del index[key]
+                try:
+                    warehouse.delete(_path(key))
+                except OSError:
+                    pass
+        if os.path.isdir(CACHEDIR):
+            _saveindex(index)
+    return
+
+
+def status():
+    '''Summary dataframe of cache entries sorted by last access.'''
+    index = _loadindex()
+    df = pd.DataFrame(list(index.values()), index=list(index.keys()),
+                      columns=['freq', 'bytes', 'stored', 'accessed'])
+    for col in ['stored', 'accessed']:
+        df[col] = pd.to_datetime(df[col], unit='s')
+    return df.sort_values('accessed', ascending=False)
+
+
+def fetch(vendor, code, download, refresh=False):
+    '''Serve dataframe from cache, else call download() and store result.
+       download is a callable without arguments which returns a dataframe.
+       refresh=True forces download, then the cache is updated.
+    '''
+    if not CACHING:
+        return download()
+    if not refresh:
+        dataframe = load(vendor, code)
+        if dataframe is not None:
+            return dataframe
+    dataframe = download()
+    try:
+        store(vendor, code, dataframe)
+    except Exception as e:
+        #  An unwritable cache should never prevent data retrieval:
+        system.warn('cache.store failed: ' + str(e))
+    return dataframe
+
+
+def readarchive(filename, reader):
+    '''Read supplemental archive file, e.g. gzip CSV, via binary copy.
+       reader(filename) parses the archive upon first use or change.
+       Archives are not subject to time-to-live or LRU eviction.
+    '''
+    if not CACHING:
+        return reader(filename)
+    path = os.path.join(CACHEDIR, 'archive',
+                        keyname('arc', os.path.basename(filename)))
+    with _lock:
+        return warehouse.readarchive(filename, reader, path)
+
+
+if __name__ == "__main__":
+    system.endmodule()
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-12-10
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  fred.py :: FRED database into pandas.
@@ -18,6 +18,12 @@ Some series are synthetically created using raw data from FRED.
 Also we may extend their past history, but your working directory
 must contain our supplemental CSV files.
 
+Downloads are kept in a local disk cache, see host/cache.py,
+so repeated requests for the same fredcode are served from disk
+until the cached series expires; getdata_fred(fredcode, refresh=True)
+forces a new download. For nightly updates of many series,
+refresh_many(fredcodes) transfers only the latest observations.
+
 REFERENCES:
 
 - pandas, http://pandas.pydata.org/pandas-docs/stable/computation.html
@@ -30,6 +36,21 @@ REFERENCES:
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  getdata_fred() tags index.freq once, so that resample_main()
+                skips conversion, and index_delta_secs() a full scan.
+2026-10-18  index_delta_secs() results kept in small LRU, not on index.
+2026-10-18  index_delta_secs() cached on index; resample_main() skips
+                data already tagged at target frequency by index.freq.
+2026-10-18  Download through pooled keep-alive connections of session.
+2026-10-18  readfile() takes fast path readfile_fred() for FRED's layout,
+                else falls back on readfile_infer(), the former method.
+2026-10-18  Add refresh_fred() and refresh_many() for incremental
+                update of cached series by downloading only the tail.
+2026-10-18  Read gzip CSV archives via binary warehouse copy.
+2026-10-18  Synthetic fredcodes as graph of nodes, see fred_nodes,
+                so getfred() downloads shared leaves once, concurrently.
+2026-10-18  Serve getdata_fred() from local disk cache, see cache module.
+                Spin-off download_fred() as the network primitive.
 2018-12-10  Include more fredcodes for Treasury bonds.
 2018-05-14  Gracefully deprecate plotfred().
 2018-05-13  Eliminate lazy abbreviations, clarify comments.
@@ -41,17 +62,16 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import absolute_import, print_function, division
 
-try:
-    from urllib.request import urlopen
-    #    ^for python3
-except ImportError:
-    from urllib2 import urlopen
-    #    ^for python2   # py2rm
-
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from fecon236 import tool as tool
 from fecon236.util import system as system
+from fecon236.host import cache
+from fecon236.host import session
 from fecon236.tsa import holtwinters as hw
 
 
@@ -207,11 +227,49 @@ def readfile(filename, separator=',', compress=None):
     #  If separator is space, use '\s+' since regex will work.
     #  compress will take 'gzip' or 'bzip' as value.
     #
+    #  2026-10-18 Fast path for FRED's fixed layout, see readfile_fred(),
+    #             falling back on general parsing if the layout differs.
+    if hasattr(filename, 'read'):
+        content = filename.read()
+        #  Buffer a stream, e.g. from a socket, so it can be read twice:
+        filename = io.StringIO(content) if isinstance(content, str) \
+            else io.BytesIO(content)
+    try:
+        return readfile_fred(filename, separator, compress)
+    except (ValueError, TypeError):
+        if hasattr(filename, 'seek'):
+            filename.seek(0)
+        return readfile_infer(filename, separator, compress)
+
+
+def readfile_fred(filename, separator=',', compress=None):
+    '''Read CSV in FRED's DATE,VALUE layout as pandas dataframe, FAST.
+       Dates must be ISO YYYY-MM-DD, and values numerical or "."
+       (FRED's indicator of missing value), else ValueError is raised.
+    '''
+    #  Knowing the layout avoids date format inference, and the separate
+    #  pass of numeric conversion: the C parser yields float64 directly.
+    dataframe = pd.read_csv(filename, sep=separator,
+                            compression=compress,
+                            header=0, names=['T', 'Y'],
+                            dtype={'T': str, 'Y': np.float64},
+                            na_values=['.'])
+    #                       Header on FRED's first line was: DATE, VALUE
+    index = pd.DatetimeIndex(pd.to_datetime(dataframe['T'].values,
+                                            format='%Y-%m-%d'), name='T')
+    #       ^explicit format raises ValueError on any other date layout.
+    values = dataframe['Y'].fillna(method='pad').values
+    #                      ^NaN replaced by fill forward in single pass.
+    return pd.DataFrame({'Y': values}, index=index)
+
+
+def readfile_infer(filename, separator=',', compress=None):
+    '''Read file (CSV default) as pandas dataframe, inferring dates.'''
+    #  General path for files not in FRED's fixed layout.
     dataframe = pd.read_csv(filename, sep=separator,
                             compression=compress,
                             index_col=0, parse_dates=True,
                             header=0, names=['T', 'Y'])
-    #                       Header on FRED's first line was: DATE, VALUE
     #
     #  Numeric conversion is critical for math ops between dataframes!
     #        (Not necessary for plotting, seemingly auto-converted?)
@@ -235,6 +293,12 @@ def readfile(filename, separator=',', compress=None):
     #       thus .dropna() is unnecessary.
 
 
+def _readgzip(filename):
+    '''Read our gzip compressed CSV archive files.'''
+    #  Archives are converted once to binary by cache.readarchive().
+    return readfile(filename, compress='gzip')
+
+
 def makeURL(fredcode):
     '''Create http address to access FRED's CSV files.'''
     #         Validated July 2014.
@@ -242,21 +306,63 @@ def makeURL(fredcode):
         + fredcode + '/downloaddata/' + fredcode + '.csv'
 
 
+def download_fred(fredcode):
+    '''Download CSV file from FRED and read it as pandas DATAFRAME.'''
+    #  2015-12-05 fredcsv = urllib2.urlopen(makeURL(fredcode))
+    #                Change import style for python3 compatibility.
+    #  2026-10-18 Shared keep-alive connections, see host/session.py
+    content = session.fetch(makeURL(fredcode))
+    return readfile(io.BytesIO(content))
+
+
 #  N.B. -  getdata_fred is a vital helper for MORE GENERAL getfred BELOW.
 #          It's the best primitive to get raw FRED data.
 
-def getdata_fred(fredcode):
-    '''Download CSV file from FRED and read it as pandas DATAFRAME.'''
+def getdata_fred(fredcode, refresh=False):
+    '''Get raw FRED data as pandas DATAFRAME, using local disk cache.
+       refresh=True bypasses the cache for a new download.
+    '''
     #  2014-08-11 former name "getdataframe".
-    #  2015-12-05 fredcsv = urllib2.urlopen(makeURL(fredcode))
-    #                Change import style for python3 compatibility.
-    fredcsv = urlopen(makeURL(fredcode))
-    return readfile(fredcsv)
+    #  2026-10-18 Cached, see host/cache.py for time-to-live and eviction.
+    dataframe = cache.fetch('fred', fredcode,
+                            lambda: download_fred(fredcode), refresh)
+    #  2026-10-18 Frequency tag inferred once here, e.g. 'MS' for monthly
+    #             series, and kept by pandas through dropna, arithmetic,
+    #             and copies; None if irregular, e.g. daily with holidays.
+    if dataframe.index.freq is None and len(dataframe.index) > 2:
+        dataframe.index = pd.DatetimeIndex(dataframe.index, freq='infer')
+    return dataframe
+
+
+deltas_max = 32
+#            ^Number of indexes whose index_delta_secs() is remembered.
+_deltas = OrderedDict()
+#         ^LRU: (id, length, first, last) of index -> (index, secs).
+_deltalock = threading.Lock()
 
 
 def index_delta_secs(dataframe):
     '''Find minimum in seconds between index values.'''
-    nanosecs_timedelta64 = np.diff(dataframe.index.values).min()
+    #  2026-10-18 Results for the last deltas_max indexes are kept:
+    #             since an index is immutable, the value remains valid
+    #             for every frame sharing that index, e.g. arithmetic
+    #             results, so a chain of conversions scans it only once.
+    #             The entry holds the index itself, so its id cannot be
+    #             reused by another index while the entry exists.
+    index = dataframe.index
+    key = (id(index), len(index))
+    if len(index):
+        key += (index[0], index[-1])
+    with _deltalock:
+        entry = _deltas.get(key)
+        if entry is not None and entry[0] is index:
+            _deltas.move_to_end(key)
+            return entry[1]
+    values = index.values
+    if index.freq is not None:
+        values = values[:14]
+        #  ^Regular, so min delta occurs within first year, e.g. February.
+    nanosecs_timedelta64 = np.diff(values).min()
     #  Picked min() over median() to conserve memory;      ^^^^^!
     #  also avoids missing values issue,
     #  e.g. weekend or holidays gaps for daily data.
@@ -265,9 +371,12 @@ def index_delta_secs(dataframe):
     secs = secs_timedelta64.astype(np.float32)
     if secs == 0.0:
         system.warn('Index contains duplicate, min delta was 0.')
-        return secs
-    else:
-        return secs
+    with _deltalock:
+        _deltas[key] = (index, secs)
+        _deltas.move_to_end(key)
+        while len(_deltas) > deltas_max:
+            _deltas.popitem(last=False)
+    return secs
 
     #  There are OTHER METHODS to get the FREQUENCY of a dataframe:
     #       e.g.  df.index.freq  OR  df.index.freqstr ,
@@ -313,6 +422,16 @@ def resample_main(dataframe, rule, secs):
     #  rule is the offset string or object representing target conversion,
     #       e.g. 'B', 'MS', or 'QS-OCT' to be compatible with FRED.
     #  secs should be the maximum seconds expected for rule frequency.
+    #
+    #  2026-10-18 Frequency tag: pandas sets index.freq on resampled
+    #  output, and keeps it through operations preserving regularity.
+    #  If the data is already at rule frequency, resampling float data
+    #  would change nothing, so converting again is just a copy.
+    #  getdata_fred() tags raw FRED frames, so e.g. monthly(get(m4code))
+    #  takes this fast path too.
+    if dataframe.index.freqstr == rule and \
+            all(dtype == np.float64 for dtype in dataframe.dtypes):
+        return dataframe.copy()
     if index_delta_secs(dataframe) < secs:
         df = dataframe.resample(rule, closed='left', label='left').median()
         #    how='median' for DOWNSAMPLING deprecated as of pandas 0.18
@@ -355,14 +474,19 @@ def quarterly(dataframe):
     return resample_main(dataframe, 'QS-OCT', secs93days)
 
 
-def getm4eurusd(fredcode=d4eurusd):
-    '''Make monthly EURUSD, and try to prepend 1971-2002 archive.'''
+#  N.B. -  Helpers named _prepend_* and _mix_* below take dataframes already
+#          downloaded, so that the synthetic fredcodes in fred_nodes can
+#          share their inputs; the get* functions are retained for users.
+
+def _prepend_eurusd(eurusd):
+    '''Make monthly EURUSD from daily, and try to prepend 1971-2002 archive.'''
     #  Synthetic euro is the average between
     #                 DEM fixed at 1.95583 and
     #                 FRF fixed at 6.55957.
-    eurnow = monthly(getdata_fred(fredcode))
+    eurnow = monthly(eurusd)
     try:
-        eurold = readfile('FRED-EURUSD_1971-2002-ARC.csv.gz', compress='gzip')
+        eurold = cache.readarchive('FRED-EURUSD_1971-2002-ARC.csv.gz',
+                                   _readgzip)
         eurall = eurold.combine_first(eurnow)
         #               ^appends dataframe
         print(' ::  EURUSD synthetically goes back monthly to 1971.')
@@ -372,13 +496,16 @@ def getm4eurusd(fredcode=d4eurusd):
     return eurall
 
 
-def getspx(fredcode=d4spx):
-    '''Make daily S&P 500 series, and try to prepend 1957-archive.'''
-    #  Fred is currently licensed for only 10 years worth,
-    #  however, we have a local copy of 1957-2014 daily data.
-    spnow = getdata_fred(fredcode)
+def getm4eurusd(fredcode=d4eurusd):
+    '''Make monthly EURUSD, and try to prepend 1971-2002 archive.'''
+    return _prepend_eurusd(getdata_fred(fredcode))
+
+
+def _prepend_spx(spnow):
+    '''Prepend 1957-archive to daily S&P 500 series, if archive is found.'''
     try:
-        spold = readfile('FRED-SP500_1957-2014-ARC.csv.gz', compress='gzip')
+        spold = cache.readarchive('FRED-SP500_1957-2014-ARC.csv.gz',
+                                  _readgzip)
         spall = spold.combine_first(spnow)
         #             ^appends dataframe
         print(' ::  S&P 500 prepend successfully goes back to 1957.')
@@ -388,15 +515,18 @@ def getspx(fredcode=d4spx):
     return spall
 
 
-def gethomepx(fredcode=m4homepx):
-    '''Make Case-Shiller 20-city, and try to prepend 1987-2000 10-city.'''
-    #  Fred's licensing may change since source is S&P,
-    #  however, we have a local copy of 1987-2013 monthly SA data.
-    hpnow = getdata_fred('SPCS20RSA')
-    #                          20-city home price index back to 2000-01-01.
+def getspx(fredcode=d4spx):
+    '''Make daily S&P 500 series, and try to prepend 1957-archive.'''
+    #  Fred is currently licensed for only 10 years worth,
+    #  however, we have a local copy of 1957-2014 daily data.
+    return _prepend_spx(getdata_fred(fredcode))
+
+
+def _prepend_homepx(hpnow):
+    '''Prepend 1987-2000 10-city to Case-Shiller 20-city, in dollars.'''
     try:
-        hpold = readfile('FRED-home-Case-Shiller_1987-2013.csv.gz',
-                         compress='gzip')
+        hpold = cache.readarchive('FRED-home-Case-Shiller_1987-2013.csv.gz',
+                                  _readgzip)
         #                ^includes 10-city index from 1987-2000.
         #                 Current correlation with 20-city: 0.998
         #                 Thus the mashup is justified.
@@ -414,37 +544,50 @@ def gethomepx(fredcode=m4homepx):
     return hpall * dollarindex
 
 
-def getinflations(inflations=ml_infl):
-    '''Normalize and average all inflation measures.'''
+def gethomepx(fredcode=m4homepx):
+    '''Make Case-Shiller 20-city, and try to prepend 1987-2000 10-city.'''
+    #  Fred's licensing may change since source is S&P,
+    #  however, we have a local copy of 1987-2013 monthly SA data.
+    return _prepend_homepx(getdata_fred('SPCS20RSA'))
+    #                          20-city home price index back to 2000-01-01.
+
+
+def _mix_inflations(*inflations):
+    '''Normalize and average dataframes of inflation measures.'''
     #  We will take the average of indexes after their
     #  current value is set to 1 for equal weighting.
-    inflsum = getdata_fred(inflations[0])
-    inflsum = inflsum / float(tool.tailvalue(inflsum))
-    for i in inflations[1:]:
-        infl = getdata_fred(i)
-        infl = infl / float(tool.tailvalue(infl))
-        inflsum += infl
+    inflsum = inflations[0] / float(tool.tailvalue(inflations[0]))
+    for infl in inflations[1:]:
+        inflsum += infl / float(tool.tailvalue(infl))
     return inflsum / len(inflations)
 
 
+def getinflations(inflations=ml_infl):
+    '''Normalize and average all inflation measures.'''
+    frames = getdata_many(inflations)
+    return _mix_inflations(*[frames[i] for i in inflations])
+
+
+def _deflator(infl):
+    '''Invert inflation dataframe into a de-inflation multiplier.'''
+    lastin = tool.tailvalue(infl)
+    return float(lastin) / infl
+    #           Think inverted inflation:-)
+
+
 def getdeflator(inflation=m4infl):
     '''Construct a de-inflation dataframe suitable as multiplier.'''
     #  Usually we encounter numbers which have been deflated to dollars
     #  of some arbitrary year (where the value is probably 100).
     #  Here we set the present to 1, while past values have increasing
     #     multiplicative "returns" which will yield current dollars.
-    infl = getfred(inflation)
-    lastin = tool.tailvalue(infl)
-    return float(lastin) / infl
-    #           Think inverted inflation:-)
+    return _deflator(getfred(inflation))
 
 
-def getm4infleu():
-    '''Normalize and average Eurozone Consumer Prices.'''
+def _mix_infleu(cpiall):
+    '''Normalize Holt-Winters levels of Eurozone Consumer Prices.'''
     #  FRED carries only NSA data from Eurostat,
     #  so we shall use Holt-Winters levels.
-    cpiall = getdata_fred('CP0000EZ17M086NEST')
-    #                        ^for 17 countries.
     holtall = hw.holtlevel(cpiall)
     normall = holtall / float(tool.tailvalue(holtall))
     return normall
@@ -457,116 +600,260 @@ def getm4infleu():
     #  return (normall + normcore) / 2.0
 
 
-def getfred(fredcode):
-    '''Retrieve from FRED in dataframe format, INCL. SPECIAL CASES.'''
-    #    We can SYNTHESIZE a FREDCODE by use of string equivalent arg:
-    if fredcode == m4gdpus:
-        df = monthly(getdata_fred(q4gdpus))
-    elif fredcode == m4gdpusr:
-        df = getfred(m4defl) * getfred(m4gdpus)
-    elif fredcode == m4debt:
-        df = monthly(getdata_fred(q4debt))
-    elif fredcode == m4workers:
-        workfrac = getdata_fred(m4emppop) / 100.
-        pop = getdata_fred(m4pop)
-        df = workfrac * pop
-    elif fredcode == m4homepx:
-        df = gethomepx()
-
-    elif fredcode == d4defl:
-        df = daily(getdeflator())
-    elif fredcode == m4defl:
-        df = getdeflator()
-    elif fredcode == m4infl:
-        df = getinflations()
-
-    elif fredcode == m4gdpeur:
-        mgdpeu = monthly(getdata_fred(q4gdpeu)) / 1000.
-        df = getfred(m4defleu) * mgdpeu
-    elif fredcode == m4infleu:
-        df = getm4infleu()
-    elif fredcode == m4defleu:
-        df = getdeflator(m4infleu)
-
-    elif fredcode == d4eurjpy:
-        eurusd = getdata_fred(d4eurusd)
-        usdjpy = getdata_fred(d4usdjpy)
-        df = eurusd * usdjpy
-    elif fredcode == m4usdjpy:
-        df = monthly(getdata_fred(d4usdjpy))
-    elif fredcode == m4eurusd:
-        df = getm4eurusd()
-    elif fredcode == m4eurjpy:
-        eurusd = getfred(m4eurusd)
-        usdjpy = getfred(m4usdjpy)
-        df = eurusd * usdjpy
-    elif fredcode == m4xau:
-        df = monthly(getdata_fred(d4xau))
-    elif fredcode == m4xaueur:
-        xauusd = getfred(m4xau)
-        eurusd = getfred(m4eurusd)
-        df = xauusd / eurusd
-    elif fredcode == m4xaujpy:
-        xauusd = getfred(m4xau)
-        usdjpy = getfred(m4usdjpy)
-        df = xauusd * usdjpy
-    elif fredcode == m4xaurtb:
-        usdrtb = getdata_fred(m4usdrtb)
-        xauusd = getfred(m4xau) / 1000.
-        df = usdrtb * xauusd
-
-    elif fredcode == d4ff30:
-        df = hw.ema(getdata_fred(d4ff), 0.0645)
-        #       exponential moving avg.   ^"30-day"
-    elif fredcode == d4zero10:
-        bond10 = getdata_fred(d4bond10)
-        df = tool.zeroprice(bond10, zero10dur)
-    elif fredcode == m4zero10:
-        df = monthly(getfred(d4zero10))
-    elif fredcode == d4curve:
-        bond10 = getdata_fred(d4bond10)
-        bills = getdata_fred(d4bills)
-        df = bond10 - bills
-    elif fredcode == d4bei:
-        bond10 = getdata_fred(d4bond10)
-        tips10 = getdata_fred(d4tips10)
-        df = bond10 - tips10
-    elif fredcode == m4bei:
-        bond10 = getdata_fred(m4bond10)
-        tips10 = getdata_fred(m4tips10)
-        df = bond10 - tips10
-    elif fredcode == m4inflbei:
-        inflpc = tool.pcent(getfred(m4infl), 12)  # YoY% form
-        df = (inflpc + getfred(m4bei)) / 2.
-        #  ^average of backward and forward looking inflation!
-
-    elif fredcode == d4spx:
-        df = getspx()
-    elif fredcode == m4spx:
-        df = monthly(getspx())
-    elif fredcode == m4spxrtb:
-        usdrtb = getdata_fred(m4usdrtb)
-        spxusd = getfred(m4spx) / 1000.
-        df = usdrtb * spxusd
-    elif fredcode == q4spx:
-        df = quarterly(getspx())
-
-    elif fredcode == d4oil:
-        brent = getdata_fred(d4brent)
-        wti = getdata_fred(d4wti)
-        df = (brent + wti) / 2.
-    elif fredcode == m4oil:
-        df = monthly(getfred(d4oil))
-    elif fredcode == d4gas:
-        df = daily(getdata_fred('GASREGW'))
-        #           ^weekly DoE survey, USD/gallon + tax, NSA
+def getm4infleu():
+    '''Normalize and average Eurozone Consumer Prices.'''
+    return _mix_infleu(getdata_fred('CP0000EZ17M086NEST'))
+    #                                  ^for 17 countries.
 
+
+#  ============================================ SYNTHETIC fredcode GRAPH ====
+#
+#  We can SYNTHESIZE a FREDCODE by use of string equivalent arg.
+#  Each synthetic fredcode is a NODE: (function, [inputs]) where the
+#  function takes the input dataframes as positional arguments, in order.
+#  An input is either another node, or else a raw fredcode (a LEAF)
+#  downloaded by getdata_fred. A node which lists its own code as input,
+#  e.g. d4spx, refers to the raw FRED series which it then extends.
+#
+#  getfred() first collects all leaves needed for a request, downloads
+#  each distinct leaf just once (concurrently), then evaluates the nodes.
+#  So m4xaueur and m4eurjpy share their EURUSD within one request.
+
+def _mul(x, y):
+    return x * y
+
+
+def _div(x, y):
+    return x / y
+
+
+def _sub(x, y):
+    return x - y
+
+
+def _avg(x, y):
+    return (x + y) / 2.
+
+
+def _per1000(x, y):
+    return x * (y / 1000.)
+
+
+fred_nodes = {
+    m4gdpus:   (monthly, [q4gdpus]),
+    m4gdpusr:  (_mul, [m4defl, m4gdpus]),
+    m4debt:    (monthly, [q4debt]),
+    m4workers: (lambda emppop, pop: (emppop / 100.) * pop,
+                [m4emppop, m4pop]),
+    m4homepx:  (_prepend_homepx, ['SPCS20RSA']),
+    #                              ^20-city home price index since 2000.
+
+    d4defl:    (daily, [m4defl]),
+    m4defl:    (_deflator, [m4infl]),
+    m4infl:    (_mix_inflations, ml_infl),
+
+    m4gdpeur:  (lambda defleu, gdpeu: defleu * (monthly(gdpeu) / 1000.),
+                [m4defleu, q4gdpeu]),
+    m4infleu:  (_mix_infleu, ['CP0000EZ17M086NEST']),
+    #                           ^for 17 countries.
+    m4defleu:  (_deflator, [m4infleu]),
+
+    d4eurjpy:  (_mul, [d4eurusd, d4usdjpy]),
+    m4usdjpy:  (monthly, [d4usdjpy]),
+    m4eurusd:  (_prepend_eurusd, [d4eurusd]),
+    m4eurjpy:  (_mul, [m4eurusd, m4usdjpy]),
+    m4xau:     (monthly, [d4xau]),
+    m4xaueur:  (_div, [m4xau, m4eurusd]),
+    m4xaujpy:  (_mul, [m4xau, m4usdjpy]),
+    m4xaurtb:  (_per1000, [m4usdrtb, m4xau]),
+
+    d4ff30:    (lambda ff: hw.ema(ff, 0.0645), [d4ff]),
+    #             exponential moving avg.   ^"30-day"
+    d4zero10:  (lambda bond10: tool.zeroprice(bond10, zero10dur),
+                [d4bond10]),
+    m4zero10:  (monthly, [d4zero10]),
+    d4curve:   (_sub, [d4bond10, d4bills]),
+    d4bei:     (_sub, [d4bond10, d4tips10]),
+    m4bei:     (_sub, [m4bond10, m4tips10]),
+    m4inflbei: (lambda infl, bei: (tool.pcent(infl, 12) + bei) / 2.,
+                [m4infl, m4bei]),
+    #          ^average of backward (YoY%) and forward looking inflation!
+
+    d4spx:     (_prepend_spx, [d4spx]),
+    m4spx:     (monthly, [d4spx]),
+    m4spxrtb:  (_per1000, [m4usdrtb, m4spx]),
+    q4spx:     (quarterly, [d4spx]),
+
+    d4oil:     (_avg, [d4brent, d4wti]),
+    m4oil:     (monthly, [d4oil]),
+    d4gas:     (daily, ['GASREGW'])
+    #                    ^weekly DoE survey, USD/gallon + tax, NSA
+}
+
+fredworkers = 4
+#             ^Maximum number of concurrent downloads of leaves.
+
+
+def _isleaf(code, node):
+    '''Is code, appearing as input of node, a raw fredcode?'''
+    return code == node or code not in fred_nodes
+
+
+def fred_leaves(fredcode):
+    '''Set of raw fredcodes required to synthesize given fredcode.
+    >>> sorted(fred_leaves(m4xaueur))
+    ['DEXUSEU', 'GOLDPMGBD228NLBM']
+    '''
+    leaves = set()
+    visited = set()
+    pending = [fredcode]
+    while pending:
+        node = pending.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        if node not in fred_nodes:
+            leaves.add(node)
+            continue
+        for code in fred_nodes[node][1]:
+            if _isleaf(code, node):
+                leaves.add(code)
+            else:
+                pending.append(code)
+    return leaves
+
+
+def getdata_many(fredcodes, workers=fredworkers):
+    '''Dictionary of raw dataframes for fredcodes, downloaded concurrently.'''
+    fredcodes = sorted(set(fredcodes))
+    if workers > 1 and len(fredcodes) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers,
+                                                len(fredcodes))) as pool:
+            futures = {code: pool.submit(getdata_fred, code)
+                       for code in fredcodes}
+            return {code: futures[code].result() for code in fredcodes}
+    else:
+        return {code: getdata_fred(code) for code in fredcodes}
+
+
+def _evaluate(fredcode, frames, memo):
+    '''Evaluate fredcode given downloaded leaf frames, memoizing nodes.'''
+    if fredcode not in memo:
+        if fredcode in fred_nodes:
+            function, inputs = fred_nodes[fredcode]
+            args = [frames[code] if _isleaf(code, fredcode)
+                    else _evaluate(code, frames, memo) for code in inputs]
+            memo[fredcode] = function(*args).dropna()
+        else:
+            memo[fredcode] = frames[fredcode].dropna()
+    return memo[fredcode]
+    #      ^NO NULLS finally, esp. for synthetics derived from
+    #       overlapping indexes, noting that in general:
+    #       readfile does fillna with pad beforehand.
+
+
+def getfred(fredcode, workers=fredworkers):
+    '''Retrieve from FRED in dataframe format, INCL. SPECIAL CASES.
+       Synthetic fredcodes are resolved by fred_nodes, where each
+       underlying FRED series is downloaded only once per request.
+    '''
+    frames = getdata_many(fred_leaves(fredcode), workers)
+    return _evaluate(fredcode, frames, {})
+
+
+#  ================================================ INCREMENTAL REFRESH ===
+#  FRED series only grow at the tail, except for occasional revisions
+#  of the most recent observations. So instead of the entire history,
+#  refresh_fred() requests only observations since the last few cached
+#  dates (the overlap), and merges them into the cached series.
+
+fredoverlap = 5
+#             ^Number of trailing cached observations requested again,
+#              so that their revisions overwrite the cached values.
+
+
+def makeURL_since(fredcode, start=None):
+    '''Create http address for FRED observations from start date onwards.
+    >>> makeURL_since('DFF', '2018-12-03')[-36:]
+    'fredgraph.csv?id=DFF&cosd=2018-12-03'
+    '''
+    url = 'https://fred.stlouisfed.org/graph/fredgraph.csv?id=' + fredcode
+    if start is not None:
+        url += '&cosd=' + start
+        #      ^Observation start date, format YYYY-MM-DD.
+    return url
+
+
+def download_fred_since(fredcode, start=None):
+    '''Download FRED observations from start date (all if None).
+       Returns tuple: (dataframe, number of bytes transferred).
+    '''
+    content = session.fetch(makeURL_since(fredcode, start))
+    return readfile(io.BytesIO(content)), len(content)
+
+
+def refresh_fred(fredcode, overlap=fredoverlap):
+    '''Update cached raw FRED series by downloading only its tail.
+       The last overlap cached observations are requested again,
+       so revised values overwrite cached values. Regardless of
+       time-to-live, the merged series is stored back in the cache.
+       Returns dictionary reporting what changed.
+    '''
+    cached = cache.load('fred', fredcode, maxage=float('inf'))
+    #                                     ^expired entries are fine here.
+    if cached is None or len(cached.index) == 0:
+        start = None
+    else:
+        start = cached.index[-min(overlap, len(cached.index))]
+        start = start.strftime('%Y-%m-%d')
+    tail, nbytes = download_fred_since(fredcode, start)
+    tail = tail.dropna()
+    #      ^leading missing values cannot be padded within tail,
+    #       so there the cached values are kept.
+    if start is None:
+        merged = tail
+        appended = len(tail.index)
+        revised = 0
+    else:
+        common = tail.index.intersection(cached.index)
+        revised = int((tail.loc[common, 'Y']
+                       != cached.loc[common, 'Y']).sum())
+        appended = int((tail.index > cached.index[-1]).sum())
+        merged = tail.combine_first(cached)
+        #        ^tail takes precedence wherever both have values.
+    cache.store('fred', fredcode, merged)
+    return {'appended': appended, 'revised': revised, 'bytes': nbytes,
+            'rows': len(merged.index), 'start': start,
+            'last': None if len(merged.index) == 0
+            else merged.index[-1].strftime('%Y-%m-%d')}
+
+
+def refresh_many(fredcodes, workers=fredworkers, overlap=fredoverlap):
+    '''Incremental refresh of fredcodes concurrently, see refresh_fred().
+       Synthetic fredcodes are expanded into their underlying leaves.
+       Returns dataframe report indexed by raw fredcode; a failed
+       refresh is reported in column "error" without stopping the rest.
+    '''
+    leaves = set()
+    for fredcode in fredcodes:
+        leaves |= fred_leaves(fredcode)
+    leaves = sorted(leaves)
+
+    def one(code):
+        try:
+            return refresh_fred(code, overlap)
+        except Exception as e:
+            return {'error': str(e)}
+
+    if workers > 1 and len(leaves) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers,
+                                                len(leaves))) as pool:
+            reports = list(pool.map(one, leaves))
     else:
-        df = getdata_fred(fredcode)
-    return df.dropna()
-    #        ^NO NULLS finally, esp. for synthetics derived from
-    #         overlapping indexes, noting that in general:
-    #         readfile does fillna with pad beforehand.
+        reports = [one(code) for code in leaves]
+    columns = ['appended', 'revised', 'bytes', 'rows', 'start', 'last',
+               'error']
+    return pd.DataFrame(reports, index=leaves, columns=columns)
 
 
 def plotfred(data, title='tmp', maxi=87654321):
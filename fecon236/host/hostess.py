@@ -1,9 +1,12 @@
-#  Python Module for import                           Date : 2018-06-18
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  hostess.py :: Brings together fecon236 host modules
 
+For non-blocking retrieval, see aget() in ahostess.py (Python 3.7+).
+
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Add vendor() to classify codes, e.g. for concurrency limits.
 2018-06-18  Circular dependency HACK [Endnotes]: put imports inside get()
                 and avoid "from" import syntax there. Fix #3
 2018-06-15  Faster get() by exploiting startswith('s4'). Pass flake8.
@@ -17,6 +20,25 @@ from __future__ import absolute_import, print_function, division
 from fecon236.util import system
 
 
+def vendor(code):
+    '''Identify the likely vendor for code: 'stock', 'quandl', or 'fred'.
+       Only a cheap string inspection, nothing is downloaded;
+       get() itself still falls back from FRED to Quandl.
+    >>> [vendor(c) for c in ['s4spy', 'CFTC/GC_FO_ALL', 'f4xau15z', 'DFF']]
+    ['stock', 'quandl', 'quandl', 'fred']
+    '''
+    if code.startswith('s4'):
+        return 'stock'
+    elif '/' in code or code[:2] in ['f4', 'w4', 'd7']:
+        return 'quandl'
+    elif code.startswith('m4spx_1871'):
+        return 'quandl'
+    else:
+        return 'fred'
+    #  FRED codes never contain "/" whereas Quandl codes always do,
+    #  except for our own synthetic quandlcodes defined in qdl module.
+
+
 def get(code, maxi=0):
     '''Unifies getfred, getqdl, and getstock for data retrieval.
     code is fredcode, quandlcode, futures slang, or stock slang.
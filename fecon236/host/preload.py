@@ -0,0 +1,168 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  preload.py :: Warm the local cache with named series.
+
+Interactive sessions should not wait for the network. Here every series
+NAMED in the host modules, e.g. fred.d4xau or qdl.w4cotr_xau, is
+retrieved once by get(), so that their downloads land in the local disk
+cache (host/cache.py) and later retrievals are served from disk.
+
+        Usage:  report = preload()                   # all named codes.
+                report = preload(['d4xau', 'm4cpi'])  # by name or code.
+
+    From shell:  $ ./bin/preload --workers 8         # e.g. from cron.
+                 $ ./bin/preload --list
+
+- Named codes are module variables whose name begins with a frequency
+  prefix: d4, d7, w4, m4, q4 (see namedcodes). Synonyms are loaded once.
+- Series are retrieved concurrently by at most "workers" threads,
+  subject to the per-vendor limits of util/group.py vendorlimits.
+- The report dataframe gives, per code: vendor, rows, membytes of the
+  retrieved dataframe in memory, seconds of latency, and error (empty
+  if none). The shell command also totals the bytes actually
+  downloaded, and exits with status 1 if any series failed.
+- Synthetic codes are computed from their underlying series,
+  which are the ones stored in the cache, e.g. the CFTC reports
+  behind w4cotr_* (see qdl.qmemo_get).
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Report column "bytes" renamed "membytes", its actual meaning.
+2026-10-18  First version, with command line interface for bin/preload.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import re
+import sys
+import time
+import argparse
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import qdl
+from fecon236.host import session
+from fecon236.host.hostess import get, vendor
+
+
+preworkers = 8
+#            ^Default maximum number of concurrent retrievals.
+
+prefixes = ['d4', 'd7', 'w4', 'm4', 'q4']
+#          ^Name prefixes of series to preload, by frequency.
+
+modules = [fred, qdl]
+#         ^Host modules whose named codes are preloaded.
+
+
+def namedcodes(names=None):
+    '''Ordered dictionary of name to code for named series in modules.
+       names restricts to those names; synonyms of a code are dropped.
+    >>> list(namedcodes(['d4xau', 'd4xauusd', 'w4cotr_xau']).items())
+    [('d4xau', 'GOLDPMGBD228NLBM'), ('w4cotr_xau', 'w4cotr_xau')]
+    '''
+    pattern = re.compile('^(' + '|'.join(prefixes) + ')[a-z0-9_]*$')
+    named = OrderedDict()
+    seen = set()
+    for module in modules:
+        variables = vars(module)
+        for name in sorted(variables):
+            code = variables[name]
+            if not pattern.match(name) or not isinstance(code, str):
+                continue
+            if names is not None and name not in names:
+                continue
+            if code not in seen:
+                seen.add(code)
+                named[name] = code
+    return named
+
+
+def preload(codes=None, workers=preworkers, maxi=0, verbose=False):
+    '''Retrieve codes into the local cache, return report dataframe.
+       codes may be given by name (see namedcodes) or directly as code;
+       None preloads every named code.
+    '''
+    from fecon236.util.group import vendorlimits
+    #  ^Deferred, since util.group imports the heavier tsa modules.
+    if codes is None:
+        codes = list(namedcodes().values())
+    else:
+        named = namedcodes(codes)
+        codes = [named.get(c, c) for c in codes]
+    gates = {v: threading.BoundedSemaphore(n)
+             for v, n in vendorlimits.items()}
+
+    def one(code):
+        row = {'code': code, 'vendor': vendor(code), 'rows': 0,
+               'membytes': 0, 'secs': 0.0, 'error': ''}
+        with gates[row['vendor']]:
+            start = time.time()
+            try:
+                df = get(code, maxi)
+                row['rows'] = len(df.index)
+                row['membytes'] = int(df.memory_usage(index=True).sum())
+            except Exception as exc:
+                row['error'] = type(exc).__name__ + ': ' + str(exc)
+            row['secs'] = round(time.time() - start, 3)
+        if verbose:
+            print(' ::  {:<18} {:>9,} membytes {:>8.3f} s  {}'.format(
+                code, row['membytes'], row['secs'], row['error']))
+        return row
+
+    if workers > 1 and len(codes) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers,
+                                                len(codes))) as pool:
+            rows = list(pool.map(one, codes))
+    else:
+        rows = [one(code) for code in codes]
+    report = pd.DataFrame(rows, columns=['code', 'vendor', 'rows',
+                                         'membytes', 'secs', 'error'])
+    return report.set_index('code')
+
+
+def main(argv=None):
+    '''Command line interface, see bin/preload. Returns exit status.'''
+    parser = argparse.ArgumentParser(
+        prog='preload',
+        description='Preload named fecon236 series into the local cache.')
+    parser.add_argument('codes', nargs='*',
+                        help='names or codes, default: all named codes')
+    parser.add_argument('-w', '--workers', type=int, default=preworkers,
+                        help='concurrent retrievals (default: %(default)s)')
+    parser.add_argument('-l', '--list', action='store_true',
+                        help='list named codes, then exit')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='print only failures and summary')
+    args = parser.parse_args(argv)
+    if args.list:
+        for name, code in namedcodes().items():
+            print('{:<18} {}'.format(name, code))
+        return 0
+    downloaded = []
+
+    def recorder(url, content):
+        downloaded.append(len(content))
+        #  ^list.append is atomic, so safe across threads.
+
+    session.recorders.append(recorder)
+    start = time.time()
+    try:
+        report = preload(args.codes or None, args.workers,
+                         verbose=not args.quiet)
+    finally:
+        session.recorders.remove(recorder)
+    failed = report[report['error'] != '']
+    for code, row in failed.iterrows():
+        print(' !!  FAILED ' + code + ': ' + row['error'], file=sys.stderr)
+    print(' ::  Preloaded {} of {} series in {:.1f} s, {:,} bytes '
+          'downloaded.'.format(len(report) - len(failed), len(report),
+                               time.time() - start, sum(downloaded)))
+    return 1 if len(failed) else 0
+
+
+if __name__ == "__main__":
+    system.endmodule()
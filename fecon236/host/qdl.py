@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-05-23
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  qdl.py :: Access Quandl data vendors using fecon236.
@@ -50,6 +50,9 @@ calls per 10 minutes, and a limit of 50,000 calls per day. Premium data
 subscribers have a limit of 5,000 calls per 10 minutes, and a limit of 720,000
 calls per day.  Dataset calls are rate-limited to 2,000 calls per 10 minutes.
 
+Our calls are paced to stay within these limits by host/quota.py,
+where quota.usage() reports the current budget.
+
 All API requests must be made using HTTPS. Requests made over HTTP will fail.
 
 
@@ -178,6 +181,17 @@ REFERENCES:
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  qmemo_get() and getqdl() share disk cache key, see qmaxi.
+2026-10-18  qmemo_get() raw datasets also served from local cache module.
+2026-10-18  _spx_1871() returns a copy to every caller.
+2026-10-18  cotr_get() returns a copy, never the memoized report.
+2026-10-18  Vectorize freqM2MS(), skip resampling if already monthly.
+2026-10-18  Shiller m4spx_1871_* share memoized MULTPL series,
+                add getm4spx_1871_all() for all three at once.
+2026-10-18  CFTC reports kept in-process by qmemo_get(), loaded once and
+                concurrently for all COTR indicators by cotr_positions().
+2026-10-18  Note on pacing of calls within limits by quota module.
+2026-10-18  Vanilla getqdl() series are served from local cache module.
 2018-05-23  qdl.py, fecon236 fork. Edit intro. Pass flake8 and test_qdl.
                 Fix imports. Deprecate plotqdl() and holtqdl.
                 Rename quandl() as _qget() for future clarity.
@@ -186,10 +200,15 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import absolute_import, print_function, division
 
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 
 from fecon236 import tool
 from fecon236.util import system
+from fecon236.host import cache
 from fecon236.host.fred import monthly   # For freqM2MS.
 from fecon236.host import _ex_Quandl as qdlapi
 
@@ -252,83 +271,183 @@ def setQuandlToken(API_key):
     return
 
 
-def cotr_get(futures='GC', type='FO'):
-    '''Get CFTC Commitment of Traders Report COTR.'''
+#  ================================================ IN-PROCESS STORE ====
+#  Raw datasets shared by several derived series, e.g. the CFTC reports
+#  behind our COTR indicators, are kept here for qmemo_secs, so that
+#  each is downloaded only once per session; a download in flight is
+#  shared by concurrent requests for the same quandlcode.
+#  Raw datasets are also kept in the local disk cache, so that later
+#  sessions, e.g. after bin/preload, need not download them again.
+
+qmaxi = 87654321
+#       ^Default maxi of getqdl(), so arbitrarily large as to get all rows.
+qmemo_secs = 3600
+#            ^Time-to-live in seconds of the in-process store.
+qworkers = 4
+#          ^Maximum number of concurrent downloads for a batch.
+
+_qmemo = {}
+#        ^quandlcode -> (time stored, Future of raw dataframe).
+_qlock = threading.Lock()
+
+
+def qmemo(key, compute):
+    '''Result of compute() kept in the in-process store under key.'''
+    now = time.time()
+    with _qlock:
+        entry = _qmemo.get(key)
+        if entry is not None and now - entry[0] < qmemo_secs:
+            future, owner = entry[1], False
+        else:
+            future, owner = Future(), True
+            _qmemo[key] = (now, future)
+    if owner:
+        try:
+            future.set_result(compute())
+        except Exception as e:
+            with _qlock:
+                _qmemo.pop(key, None)
+                #  ^failures are not kept.
+            future.set_exception(e)
+    return future.result()
+
+
+def qmemo_get(quandlcode):
+    '''Raw dataframe for quandlcode via the in-process store.'''
+    return qmemo(quandlcode, lambda: cache.fetch(
+        'qdl', quandlcode + '@' + str(qmaxi),
+        lambda: _qget(quandlcode, rows=qmaxi)))
+    #  ^Same disk cache entry as vanilla getqdl() with default maxi.
+
+
+def qmemo_many(quandlcodes, workers=qworkers):
+    '''Dictionary of raw dataframes, downloaded concurrently if needed.'''
+    quandlcodes = list(quandlcodes)
+    if workers > 1 and len(quandlcodes) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers,
+                                                len(quandlcodes))) as pool:
+            frames = list(pool.map(qmemo_get, quandlcodes))
+    else:
+        frames = [qmemo_get(code) for code in quandlcodes]
+    return dict(zip(quandlcodes, frames))
+
+
+def qmemo_clear():
+    '''Empty the in-process store.'''
+    with _qlock:
+        _qmemo.clear()
+    return
+
+
+def cotr_code(futures='GC', type='FO'):
+    '''Quandl code of CFTC Commitment of Traders Report COTR.
+    >>> cotr_code('GC')
+    'CFTC/GC_FO_ALL'
+    '''
     #  Report for futures only requested by type "F".
     #  Report for both futures and options requested by type "FO".
     #  e.g. 'CFTC/GC_FO_ALL' for CFTC COTR: Gold futures and options.
     #
     #  Traders' option positions are computed on a futures-equivalent basis
     #  using delta factors supplied by the exchanges.
-    quandlcode = 'CFTC/' + futures + '_' + type + '_ALL'
-    return _qget(quandlcode)
+    return 'CFTC/' + futures + '_' + type + '_ALL'
+
+
+def cotr_get(futures='GC', type='FO'):
+    '''Get CFTC Commitment of Traders Report COTR.'''
+    return qmemo_get(cotr_code(futures, type)).copy()
+    #                                          ^Caller may modify it,
+    #  e.g. tool.todf renames in place, but the memoized report is shared.
+
+
+def cotr_positions(futures_list, type='FO'):
+    '''Market positions for futures_list from CFTC COTR, one column each.
+       Reports are loaded once, concurrently, then aligned by date.
+    '''
+    futures_list = list(futures_list)
+    reports = qmemo_many([cotr_code(f, type) for f in futures_list])
+    longs = {}
+    shorts = {}
+    for futures in futures_list:
+        cotr = reports[cotr_code(futures, type)]
+        #  For directionality we use these categories:
+        if 'Asset Manager Longs' in cotr.columns:
+            longs[futures] = cotr['Asset Manager Longs']
+            shorts[futures] = cotr['Asset Manager Shorts']
+            #  "Leveraged Funds" for FINANCIALS appear short-term, whereas
+            #  "Asset Manager" takes longer term perspective.
+        else:
+            longs[futures] = cotr['Money Manager Longs']
+            shorts[futures] = cotr['Money Manager Shorts']
+            #  "Money Manager" for COMMODITIES.
+            #  The report is structured differently than financials.
+    longs = pd.DataFrame(longs, columns=futures_list)
+    shorts = pd.DataFrame(shorts, columns=futures_list)
+    #                _Scale-free between 0 and 1 indicating bullishness.
+    return longs / (longs + shorts)
 
 
 def cotr_position(futures='GC'):
     '''Extract market position from CFTC Commitment of Traders Report.'''
-    cotr = cotr_get(futures)
     #  Report for both futures and options requested by implicit "FO".
-    #
-    #  For directionality we use these categories:
-    try:
-        longs = cotr['Asset Manager Longs']
-        shorts = cotr['Asset Manager Shorts']
-        #  "Leveraged Funds" for FINANCIALS appear short-term, whereas
-        #  "Asset Manager" takes longer term perspective.
-    except Exception:
-        longs = cotr['Money Manager Longs']
-        shorts = cotr['Money Manager Shorts']
-        #  "Money Manager" for COMMODITIES.
-        #  The report is structured differently than financials.
-        #
-    #                _Scale-free between 0 and 1 indicating bullishness.
-    return tool.todf(longs / (longs + shorts))
+    return tool.todf(cotr_positions([futures])[futures])
+
+
+#  COTR indicators as average reading between two contracts:
+#      quandlcode: ([futures, futures], inverted relative to quotation?)
+cotr_indicators = {
+    w4cotr_xau:      ([f4xau], False),
+    w4cotr_usd:      ([f4jpy, f4eur], True),
+    #                  ^We ignore USD index DX from ICE.
+    w4cotr_metals:   ([f4xau, f4xag], False),
+    #                  Gold and Silver Comex.
+    w4cotr_bonds:    ([f4bond10, f4libor], False),
+    #                  TY is 10-years, ED Eurodollar strips.
+    w4cotr_equities: ([f4spx, f4spes], False)}
+#                      SP better for options reading,
+#                      minis ES better for reading futures.
+
+
+def cotr_preload(quandlcodes):
+    '''Load all CFTC reports needed for COTR indicators, concurrently.'''
+    futures_list = []
+    for code in quandlcodes:
+        if code in cotr_indicators:
+            futures_list += cotr_indicators[code][0]
+    qmemo_many([cotr_code(f) for f in sorted(set(futures_list))])
+    return
+
+
+def cotr_indicator(quandlcode):
+    '''Market position indicator for quandlcode in cotr_indicators.'''
+    futures_list, inverted = cotr_indicators[quandlcode]
+    positions = cotr_positions(futures_list)
+    position = positions.sum(axis=1, skipna=False) / len(futures_list)
+    #                                ^NaN unless all contracts reported.
+    if inverted:
+        #  Inverts position relative to quotation styles.
+        position = 1 - position
+    return tool.todf(position)
 
 
 def cotr_position_usd():
     '''Market position for USD from COTR of JY and EC.'''
-    #  We ignore USD index DX from ICE.
-    pos1 = cotr_position('JY')
-    #                      JPY futures.
-    pos2 = cotr_position('EC')
-    #                      EUR futures.
-    #
-    #                  _Inverts position relative to quotation styles.
-    #                      _Average reading between two contracts.
-    return tool.todf(1 - ((pos1 + pos2) / 2.0))
+    return cotr_indicator(w4cotr_usd)
 
 
 def cotr_position_metals():
     '''Market position for precious metals from COTR of GC and SI.'''
-    pos1 = cotr_position('GC')
-    #                      Gold Comex
-    pos2 = cotr_position('SI')
-    #                      Silver Comex
-    #
-    #                  _Average reading between two contracts.
-    return tool.todf((pos1 + pos2) / 2.0)
+    return cotr_indicator(w4cotr_metals)
 
 
 def cotr_position_bonds():
     '''Market position for bonds from COTR of TY and ED.'''
-    pos1 = cotr_position('TY')
-    #                      TY is 10-years.
-    pos2 = cotr_position('ED')
-    #                      Eurodollar strips.
-    #
-    #                  _Average reading between two contracts.
-    return tool.todf((pos1 + pos2) / 2.0)
+    return cotr_indicator(w4cotr_bonds)
 
 
 def cotr_position_equities():
     '''Market position for equities from COTR of both SP and ES.'''
-    pos1 = cotr_position('SP')
-    #                      SP better for options reading.
-    pos2 = cotr_position('ES')
-    #                      Minis better for reading futures.
-    #
-    #                  _Average reading between two contracts.
-    return tool.todf((pos1 + pos2) / 2.0)
+    return cotr_indicator(w4cotr_equities)
 
 
 #   DICTIONARY to translate our futures slang to vendor code:
@@ -436,15 +555,24 @@ def freqM2MS(dataframe):
     '''Change Monthly dates to (FRED-compatible) Month Start frequency.'''
     #  FRED uses first day of month 'MS' to index that month's data,
     #  whereas Quandl data *may* use varying end of month dates.
-    df = dataframe.set_index(pd.DatetimeIndex(
-                             [i.replace(day=1) for i in dataframe.index]))
-    df.index = df.index.normalize()
-    #  Thus converted to midnight (normalize) first day of month.
-    df.index.name = 'T'
+    #
+    #  2026-10-18 Vectorized: truncation to month by numpy datetime64[M]
+    #             replaces per-element replace(day=1), and is midnight
+    #             (normalized) first day of month by construction.
+    months = dataframe.index.values.astype('datetime64[M]')
+    index = pd.DatetimeIndex(months.astype('datetime64[ns]'), name='T')
     #             ... but rename your columns elsewhere.
+    df = dataframe.set_index(index)
     #  Quandl *may* not infer frequency in its transmitted dataframes.
     #  So lastly, resampling converts index freq from None to 'MS'
-    #  which may be necessary to align operations between dataframes:
+    #  which may be necessary to align operations between dataframes.
+    #  FAST PATH: if months are already consecutive and all values are
+    #  float, resampling would not change anything except freq itself.
+    steps = np.diff(months.view(np.int64))
+    if len(steps) and (steps == 1).all() and \
+            all(dtype == np.float64 for dtype in df.dtypes):
+        df.index = pd.DatetimeIndex(index, freq='MS')
+        return df
     return monthly(df)
 
 
@@ -452,21 +580,34 @@ def freqM2MS(dataframe):
 #  esp. for underlying sources of reconstructed data.
 
 
-def getm4spx_1871_p():
-    '''Retrieve nominal monthly Shiller S&P500 price, starting 1871.'''
-    price = freqM2MS(_qget('MULTPL/SP500_REAL_PRICE_MONTH'))
-    #                           ^But they meant NOMINAL!
+#  Underlying monthly MULTPL series, converted once by freqM2MS:
+spx_1871_codes = {
+    'price': 'MULTPL/SP500_REAL_PRICE_MONTH',
+    #                    ^But they meant NOMINAL!
     #  Their inflation-adjusted monthly series is called
     #        MULTPL/SP500_INFLADJ_MONTH
-    #  Alternative: official YALE/SPCOMP, but 9 months latency!
-    return tool.todf(price)
+    'ratio': 'MULTPL/SP500_PE_RATIO_MONTH',
+    'yield': 'MULTPL/SP500_DIV_YIELD_MONTH'}
+#  Alternative: official YALE/SPCOMP, but 9 months latency!
+
+
+def _spx_1871(name):
+    '''Monthly MULTPL series by name in spx_1871_codes, memoized.
+       Returns a copy, since callers may modify it, e.g. tool.todf.
+    '''
+    code = spx_1871_codes[name]
+    return qmemo(code + '@MS', lambda: freqM2MS(qmemo_get(code))).copy()
+
+
+def getm4spx_1871_p():
+    '''Retrieve nominal monthly Shiller S&P500 price, starting 1871.'''
+    return tool.todf(_spx_1871('price'))
 
 
 def getm4spx_1871_e():
     '''Retrieve nominal monthly Shiller S&P500 earnings, starting 1871.'''
-    ratio = freqM2MS(_qget('MULTPL/SP500_PE_RATIO_MONTH'))
+    ratio = _spx_1871('ratio')
     #  Gets price/earnings ratio, so solve for 12-month earnings.
-    #  Alternative: official YALE/SPCOMP, but 9 months latency!
     price = getm4spx_1871_p()
     earn = tool.div(price, ratio)
     return tool.todf(earn)
@@ -474,16 +615,26 @@ def getm4spx_1871_e():
 
 def getm4spx_1871_d():
     '''Retrieve nominal monthly Shiller S&P500 dividends, starting 1871.'''
-    dyield = freqM2MS(_qget('MULTPL/SP500_DIV_YIELD_MONTH'))
+    dyield = _spx_1871('yield')
     #  Gets dividend yield in percentage form,
     #  but we want just plain dividends over previous 12 months.
-    #  Alternative: official YALE/SPCOMP, but 9 months latency!
     dyield = tool.todf(tool.div(dyield, 100))
     price = getm4spx_1871_p()
     return tool.todf(dyield * price)
 
 
-def getqdl(quandlcode, maxi=87654321):
+def getm4spx_1871_all():
+    '''Shiller S&P500 nominal price, earnings, dividends in one frame.
+       Each underlying series is downloaded once, concurrently.
+    '''
+    qmemo_many(spx_1871_codes.values())
+    df = pd.concat([getm4spx_1871_p(), getm4spx_1871_e(),
+                    getm4spx_1871_d()], axis=1)
+    df.columns = ['Price', 'Earnings', 'Dividends']
+    return df
+
+
+def getqdl(quandlcode, maxi=qmaxi):
     '''Retrieve from Quandl in dataframe format, INCL. SPECIAL CASES.
             maxi is just arbitrarily large as default,
                  useful to limit data to last maxi rows,
@@ -491,16 +642,8 @@ def getqdl(quandlcode, maxi=87654321):
                  but NOT used in all cases below.
     We can SYNTHESIZE a quandlcode by use of string equivalent arg.
     '''
-    if quandlcode == w4cotr_xau:
-        df = cotr_position(f4xau)
-    elif quandlcode == w4cotr_metals:
-        df = cotr_position_metals()
-    elif quandlcode == w4cotr_usd:
-        df = cotr_position_usd()
-    elif quandlcode == w4cotr_bonds:
-        df = cotr_position_bonds()
-    elif quandlcode == w4cotr_equities:
-        df = cotr_position_equities()
+    if quandlcode in cotr_indicators:
+        df = cotr_indicator(quandlcode)
 
     elif quandlcode == m4spx_1871_p:
         df = getm4spx_1871_p()
@@ -513,8 +656,9 @@ def getqdl(quandlcode, maxi=87654321):
         df = getfut(quandlcode)
 
     else:
-        df = _qget(quandlcode, rows=maxi)
-    #                 ^just the vanilla series... so
+        df = cache.fetch('qdl', quandlcode + '@' + str(maxi),
+                         lambda: _qget(quandlcode, rows=maxi))
+    #                 ^just the vanilla series (cached)... so
     # for "transformation" and "collapse" (resampling),
     #                  call _qget() directly.
     #
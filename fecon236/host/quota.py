@@ -0,0 +1,170 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  quota.py :: Token-bucket scheduler for vendor call limits.
+
+Quandl allows registered users 2,000 calls per 10 minutes and 50,000
+calls per day (see qdl module). Exceeding either limit fails with
+CallLimitExceeded, which can ruin a large run such as groupcotr().
+Here every Quandl call first acquires a token, so calls are QUEUED and
+PACED to stay within quota, while running at full speed below it.
+
+        Usage:  quota.acquire()            # blocks until a call is allowed.
+                quota.acquire(quota.HIGH)  # served before waiting LOW ones.
+                quota.usage()              # current budget per limit.
+
+- Each limit (calls per period) is a TOKEN BUCKET: capacity of BURST
+  fraction of the calls, refilled at the rate of the remaining calls
+  over the period. So a burst is served at once, yet in ANY window of
+  the period at most the limit of calls is made.
+- PRIORITY: waiting calls are served lowest number first (HIGH=0),
+  then in order of arrival.
+- Budgets are kept per process; upon a limit reported by the vendor,
+  exhausted() empties the buckets, so that calls resume only gradually.
+- ENFORCE = False disables pacing entirely; configure() sets limits,
+  e.g. for premium subscribers: [('10min', 5000, 600),
+                                 ('day', 720000, 86400)]
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Drop python2 fallback of _clock(), since Python 3.7 is required.
+2026-10-18  First version: Quandl calls are scheduled in _ex_Quandl.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import time
+import heapq
+import itertools
+import threading
+from fecon236.util import system
+
+
+HIGH, NORMAL, LOW = 0, 5, 9
+#                   ^Priorities: lower number is served first.
+
+ENFORCE = True
+#         ^Global switch: False lets every call through at once.
+
+BURST = 0.1
+#       ^Fraction of each limit available at once as burst.
+
+limits = [('10min', 2000, 600),
+          ('day', 50000, 86400)]
+#         ^(label, calls, period in seconds) for registered Quandl users.
+
+_buckets = []
+_queue = []
+#        ^Heap of waiting tickets: (priority, sequence number).
+_sequence = itertools.count()
+_cond = threading.Condition()
+#       ^Guards buckets and queue; waiters sleep until the next token.
+
+
+def _clock():
+    '''Monotonic time in seconds.'''
+    return time.monotonic()
+
+
+def configure(newlimits=None):
+    '''Set limits as list of (label, calls, period), and reset budgets.'''
+    global limits
+    with _cond:
+        if newlimits is not None:
+            limits = list(newlimits)
+        now = _clock()
+        del _buckets[:]
+        for label, calls, period in limits:
+            capacity = max(1.0, BURST * calls)
+            _buckets.append({'label': label, 'calls': calls,
+                             'period': period, 'capacity': capacity,
+                             'rate': max(calls - capacity, 1.0) / period,
+                             'tokens': capacity, 'stamp': now, 'used': 0})
+        _cond.notify_all()
+    return
+
+
+def _refill(now):
+    for b in _buckets:
+        b['tokens'] = min(b['capacity'],
+                          b['tokens'] + (now - b['stamp']) * b['rate'])
+        b['stamp'] = now
+    return
+
+
+def _waitsecs():
+    '''Seconds until every bucket holds a whole token, 0 if ready.'''
+    wait = 0.0
+    for b in _buckets:
+        if b['tokens'] < 1:
+            wait = max(wait, (1 - b['tokens']) / b['rate'])
+    return wait
+
+
+def acquire(priority=NORMAL, timeout=None):
+    '''Block until a call is allowed within all limits, then take it.
+       Returns True, or False if timeout in seconds expired first.
+    '''
+    if not ENFORCE:
+        return True
+    ticket = (priority, next(_sequence))
+    with _cond:
+        if not _buckets:
+            configure()
+        deadline = None if timeout is None else _clock() + timeout
+        heapq.heappush(_queue, ticket)
+        while True:
+            now = _clock()
+            wait = None
+            if _queue[0] == ticket:
+                _refill(now)
+                wait = _waitsecs()
+                if wait == 0:
+                    for b in _buckets:
+                        b['tokens'] -= 1
+                        b['used'] += 1
+                    heapq.heappop(_queue)
+                    _cond.notify_all()
+                    #  ^next in queue becomes head.
+                    return True
+            if deadline is not None:
+                if now >= deadline:
+                    _queue.remove(ticket)
+                    heapq.heapify(_queue)
+                    _cond.notify_all()
+                    return False
+                wait = deadline - now if wait is None \
+                    else min(wait, deadline - now)
+            _cond.wait(wait)
+
+
+def exhausted():
+    '''Vendor reported a limit: empty all buckets, so calls are paced.'''
+    with _cond:
+        if not _buckets:
+            configure()
+        _refill(_clock())
+        for b in _buckets:
+            b['tokens'] = min(b['tokens'], 0.0)
+    return
+
+
+def usage():
+    '''Current budget per limit: used calls, remaining tokens, refill time.
+       The key 'queued' counts calls currently waiting.
+    '''
+    with _cond:
+        if not _buckets:
+            configure()
+        _refill(_clock())
+        report = {'queued': len(_queue)}
+        for b in _buckets:
+            report[b['label']] = {
+                'limit': b['calls'], 'period': b['period'],
+                'used': b['used'], 'available': int(b['tokens']),
+                'refill_secs': round((b['capacity'] - b['tokens'])
+                                     / b['rate'], 3)}
+        return report
+
+
+if __name__ == "__main__":
+    system.endmodule()
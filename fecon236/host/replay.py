@@ -0,0 +1,225 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  replay.py :: Record and replay vendor responses offline.
+
+The host modules normally talk to live services, so tests and timings
+of get() depend on the network. Here responses are RECORDED once into
+a directory, then REPLAYED by a small local HTTP server which stands in
+for FRED and Quandl, with configurable latency:
+
+        Usage:  with replay.recording('rec'):
+                    df = get(fred.d4xau)          # live, and recorded.
+
+                with replay.replaying('rec', latency=0.05):
+                    df = get(fred.d4xau)          # offline, deterministic.
+
+- HTTP responses fetched through host/session.py are keyed by their path
+  and query, excluding authentication tokens and the host, so recordings
+  do not contain secrets and one server stands in for every vendor.
+  Requests without a recording are answered by 404 Not Found.
+- Stock quotes via pandas-datareader build their URLs from the current
+  time, so instead whole dataframes are recorded, see saveframe().
+- The local disk cache is bypassed while replaying unless caching=True,
+  so that replayed data never enters the user's cache.
+- seed() writes a response directly, e.g. for synthetic benchmarks.
+
+Layout of directory:  http/index.json    key -> file name and full url,
+                      http/*.dat         response bodies,
+                      frames/            warehouse directories.
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Drop python2 imports, since Python 3.7 is required.
+2026-10-18  First version: record, seed, serve, and replay.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import json
+import time
+import hashlib
+import threading
+import contextlib
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from fecon236.util import system
+from fecon236.host import cache
+from fecon236.host import session
+from fecon236.host import warehouse
+
+
+secretkeys = ['auth_token', 'api_key', 'apikey', 'token']
+#            ^Query fields excluded from keys, and never recorded.
+
+RECORDDIR = None
+#           ^Directory where frames are recorded, see recording().
+REPLAYDIR = None
+#           ^Directory where frames are replayed, see replaying().
+
+_lock = threading.Lock()
+#       ^Guards the index of recorded responses.
+
+
+def urlkey(url):
+    '''Key of url for recording: path and sorted query, without secrets.
+    >>> urlkey('https://www.quandl.com/api/v1/datasets/X/Y.csv?b=2&a=1')
+    '/api/v1/datasets/X/Y.csv?a=1&b=2'
+    >>> urlkey('/api/v1/datasets/X/Y.csv?auth_token=SECRET&a=1')
+    '/api/v1/datasets/X/Y.csv?a=1'
+    '''
+    parts = urlsplit(url)
+    fields = sorted((k, v) for k, v in parse_qsl(parts.query)
+                    if k not in secretkeys)
+    return parts.path + ('?' + urlencode(fields) if fields else '')
+
+
+def _httpdir(directory):
+    return os.path.join(directory, 'http')
+
+
+def _readindex(directory):
+    '''Index of recorded responses in directory, empty if absent.'''
+    try:
+        with open(os.path.join(_httpdir(directory), 'index.json')) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def seed(directory, url, content):
+    '''Save content (bytes) as the recorded response for url.'''
+    key = urlkey(url)
+    name = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20] + '.dat'
+    path = _httpdir(directory)
+    with _lock:
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        with open(os.path.join(path, name), 'wb') as f:
+            f.write(content)
+        index = _readindex(directory)
+        parts = urlsplit(url)
+        index[key] = {'file': name,
+                      'url': parts.scheme + '://' + parts.netloc + key}
+        tmp = os.path.join(path, 'index.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(index, f, indent=0, sort_keys=True)
+        os.replace(tmp, os.path.join(path, 'index.json'))
+    return
+
+
+def lookup(directory, url):
+    '''Recorded response for url as bytes, else None.'''
+    entry = _readindex(directory).get(urlkey(url))
+    if entry is None:
+        return None
+    with open(os.path.join(_httpdir(directory), entry['file']), 'rb') as f:
+        return f.read()
+
+
+def saveframe(vendor, code, dataframe):
+    '''Record dataframe retrieved from vendor, if recording.'''
+    if RECORDDIR is not None:
+        warehouse.save(os.path.join(RECORDDIR, 'frames',
+                                    cache.keyname(vendor, code)), dataframe)
+    return
+
+
+def loadframe(vendor, code):
+    '''Replayed dataframe for vendor and code, else None.
+       While replaying, a missing recording raises IOError,
+       just as a live retrieval would fail without network.
+    '''
+    if REPLAYDIR is None:
+        return None
+    dataframe = warehouse.load(os.path.join(REPLAYDIR, 'frames',
+                                            cache.keyname(vendor, code)))
+    if dataframe is None:
+        raise IOError(' !!  replay: no recording for ' + code)
+    return dataframe
+
+
+@contextlib.contextmanager
+def recording(directory):
+    '''Record every response and frame retrieved within the context.'''
+    global RECORDDIR
+
+    def recorder(url, content):
+        seed(directory, url, content)
+
+    session.recorders.append(recorder)
+    former, RECORDDIR = RECORDDIR, directory
+    try:
+        yield directory
+    finally:
+        session.recorders.remove(recorder)
+        RECORDDIR = former
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    '''Threads, so concurrent clients and kept-alive connections work.'''
+    daemon_threads = True
+
+
+def serve(directory, port=0, latency=0.0):
+    '''Start local HTTP server replaying recordings in directory.
+       latency in seconds delays every response, simulating a vendor.
+       Returns server, whose url attribute is its address;
+       stop it by server.shutdown() then server.server_close().
+    '''
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        #                  ^keep-alive, as vendors do.
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            content = lookup(directory, self.path)
+            if content is None:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/csv')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = _Server(('127.0.0.1', port), Handler)
+    server.url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+@contextlib.contextmanager
+def replaying(directory, latency=0.0, caching=False):
+    '''Within the context, host modules retrieve from recordings only.
+       Yields the local server, see serve().
+    '''
+    global REPLAYDIR
+    server = serve(directory, latency=latency)
+    formerdir, REPLAYDIR = REPLAYDIR, directory
+    formerurl, session.REDIRECT = session.REDIRECT, server.url
+    formercaching, cache.CACHING = cache.CACHING, caching
+    session.configure()
+    #  ^fresh connection pool for the local server.
+    try:
+        yield server
+    finally:
+        REPLAYDIR = formerdir
+        session.REDIRECT = formerurl
+        cache.CACHING = formercaching
+        session.configure()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    system.endmodule()
@@ -0,0 +1,157 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  session.py :: Pooled HTTP session for host downloads.
+
+Opening a new TCP+TLS connection for every series dominates the latency
+of small downloads. All host modules therefore share a single session
+which keeps connections ALIVE in a pool per host, so a group download
+of many series reuses a handful of connections.
+
+        Usage:  content = session.fetch(url)
+                #         ^bytes of response body, already decompressed.
+
+- Connection pool size, timeouts, and retries are set by POOLSIZE,
+  TIMEOUT, and RETRIES, or by configure() which rebuilds the session.
+- Responses are requested with gzip transfer encoding.
+- Status codes >= 400 raise urllib's HTTPError, as urlopen would,
+  so that callers may keep their error handling, e.g. _ex_Quandl.
+- REDIRECT sends every request to another host, keeping path and query,
+  and each callable in recorders sees every response: both are used by
+  host/replay.py for offline record and replay.
+
+ Dependencies:  requests (installed along with pandas-datareader).
+                If unavailable, urllib is used without pooling.
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Drop python2 imports, since Python 3.7 is required.
+2026-10-18  Add REDIRECT and recorders for host/replay.py
+2026-10-18  First version: shared by fred, _ex_Quandl, and stock.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import io
+import gzip
+import zlib
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+from fecon236.util import system
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+    #  ^fallback on urllib.
+
+
+POOLSIZE = 16
+#          ^Maximum number of connections kept alive per host.
+
+TIMEOUT = (10, 60)
+#         ^Seconds to connect, and to wait for data while reading.
+
+RETRIES = 2
+#         ^Retries upon failed connection, not upon HTTP error status.
+
+HEADERS = {'Accept-Encoding': 'gzip, deflate',
+           'User-Agent': 'fecon236'}
+
+REDIRECT = None
+#          ^If set, e.g. 'http://127.0.0.1:8236', requests go to that
+#           host instead, keeping path and query of the original url.
+
+recorders = []
+#           ^Callables as recorder(url, content), after each response.
+
+_session = None
+_lock = threading.Lock()
+#       ^Guards creation of the shared session by concurrent threads.
+
+
+def configure(poolsize=None, timeout=None, retries=None):
+    '''Change settings, then rebuild the shared session upon next use.'''
+    global POOLSIZE, TIMEOUT, RETRIES, _session
+    with _lock:
+        if poolsize is not None:
+            POOLSIZE = poolsize
+        if timeout is not None:
+            TIMEOUT = timeout
+        if retries is not None:
+            RETRIES = retries
+        if _session is not None:
+            _session.close()
+        _session = None
+    return
+
+
+def getsession():
+    '''Shared requests.Session with connection pool, else None.'''
+    global _session
+    if requests is None:
+        return None
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOLSIZE,
+                                  pool_maxsize=POOLSIZE,
+                                  max_retries=RETRIES)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+            _session.headers.update(HEADERS)
+        return _session
+
+
+def _fetch_urllib(url, timeout):
+    '''Fallback fetch by urllib, one connection per request.'''
+    request = Request(url, headers=HEADERS)
+    if isinstance(timeout, tuple):
+        timeout = max(timeout)
+        #         ^urllib takes a single timeout.
+    response = urlopen(request, timeout=timeout)
+    content = response.read()
+    encoding = response.info().get('Content-Encoding', '')
+    if encoding == 'gzip':
+        content = gzip.GzipFile(fileobj=io.BytesIO(content)).read()
+    elif encoding == 'deflate':
+        content = zlib.decompress(content)
+    return content
+
+
+def redirect(url):
+    '''Replace scheme and host of url by REDIRECT, if set.
+    >>> redirect('https://fred.stlouisfed.org/graph/fredgraph.csv?id=DFF')
+    'https://fred.stlouisfed.org/graph/fredgraph.csv?id=DFF'
+    '''
+    if REDIRECT is None:
+        return url
+    parts = urlsplit(url)
+    return REDIRECT.rstrip('/') + parts.path \
+        + ('?' + parts.query if parts.query else '')
+
+
+def fetch(url, timeout=None):
+    '''Content of url as bytes, using the shared pooled session.
+       HTTPError is raised for status codes >= 400.
+    '''
+    if timeout is None:
+        timeout = TIMEOUT
+    session = getsession()
+    if session is None:
+        content = _fetch_urllib(redirect(url), timeout)
+    else:
+        response = session.get(redirect(url), timeout=timeout)
+        if response.status_code >= 400:
+            raise HTTPError(url, response.status_code, response.reason,
+                            response.headers, None)
+        content = response.content
+    for recorder in recorders:
+        recorder(url, content)
+    return content
+
+
+if __name__ == "__main__":
+    system.endmodule()
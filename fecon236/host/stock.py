@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-06-04
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  stock.py :: Access stock quotes for fecon236
@@ -13,6 +13,15 @@ see https://github.com/rsvp/fecon235/issues/7 for details.
                 #             ^begin with s4, then
                 #              append stock SYMBOL in lower case.
 
+                dfs = stock_many(['s4spy', 's4gld'])
+                #     ^dictionary of ALL columns, retrieved concurrently.
+
+- Full OHLCV frames are cached (see host/cache.py), so any col requested
+  later from stock_one() is served without another download.
+- HEDGED vendors: if the primary vendor has not answered within
+  stock_hedge seconds, or fails, the next vendor in stock_vendors is
+  queried concurrently, and the first successful answer is taken.
+
  Dependencies:  pandas-datareader (for pandas>=0.17)
 
 REFERENCES
@@ -25,6 +34,11 @@ REFERENCES
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  hedged() raises ValueError if stock_vendors is empty.
+2026-10-18  Add stock_many(). Vendors are hedged upon slow response.
+2026-10-18  download_stock() frames can be recorded and replayed.
+2026-10-18  DataReader uses pooled connections of session module.
+2026-10-18  stock_all() is served from local cache module.
 2018-05-23  Rename to stock.py, fecon236 fork. Fix imports, pass flake8.
 2017-02-06  yi_stocks.py, fecon235 v5.18.0312, https://git.io/fecon235
                 pandas<=0.17 supported in fecon235.
@@ -33,15 +47,27 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 from __future__ import absolute_import, print_function, division
 
 import datetime                # pddata dependency.
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import pandas_datareader.data as pddata
 from fecon236 import tool
 from fecon236.util import system
+from fecon236.host import cache
+from fecon236.host import replay
+from fecon236.host import session
 
 
 #      __________ Favorite ABBREVIATIONS as variables:
 s4spx = 's4spy'            # Largest S&P500 ETF.
 
 
+stock_vendors = [('yahoo', 'Yahoo Finance'), ('google', 'Google Finance')]
+#               ^(pandas-datareader source, name) in order of preference.
+stock_hedge = 10
+#             ^Seconds to wait on a vendor before also asking the next.
+stock_workers = 4
+#               ^Default maximum number of concurrent downloads.
+
+
 def stock_decode(slang):
     '''Validate and translate slang string into vendor stock code.
        Our short slang must be in all lower case starting with s4,
@@ -69,6 +95,12 @@ def stock_all(slang, maxi=3650):
 
     maxi is set to default of ten years past data.
     '''
+    return cache.fetch('stock', slang + '@' + str(maxi),
+                       lambda: download_stock(slang, maxi))
+
+
+def download_stock(slang, maxi=3650):
+    '''Download ALL columns for single stock, see stock_all().'''
     #       Typical:  start = datetime.datetime(2013, 1, 20)
     #       but we just want the most current window of data.
     now = datetime.datetime.now()
@@ -78,17 +110,75 @@ def stock_all(slang, maxi=3650):
     #             Date offsets are chronological days,
     #             NOT trading days.
     symbol = stock_decode(slang)
-    #
-    #        MAIN: use Yahoo Finance before Google Finance:
-    try:
-        df = pddata.DataReader(symbol, 'yahoo',  start, end)
-        print(" ::  Retrieved from Yahoo Finance: " + symbol)
-    except Exception:
-        df = pddata.DataReader(symbol, 'google', start, end)
-        print(" ::  Retrieved from Google Finance: " + symbol)
+    df = replay.loadframe('stock', slang)
+    if df is not None:
+        return df
+        #  ^offline replay of recorded frame, see host/replay.py
+    df = hedged(symbol, start, end)
+    replay.saveframe('stock', slang, df)
     return df
 
 
+def _datareader(symbol, source, start, end):
+    '''Download from single source by pandas-datareader.'''
+    return pddata.DataReader(symbol, source, start, end,
+                             session=session.getsession())
+
+
+def hedged(symbol, start, end, hedge=None):
+    '''Download symbol from stock_vendors, hedging a slow or failed one.
+       The next vendor is queried once the previous ones have failed,
+       or have not answered within hedge seconds (default stock_hedge).
+       The first successful answer is returned, else last error is raised.
+       ValueError is raised if stock_vendors is empty.
+    '''
+    if hedge is None:
+        hedge = stock_hedge
+    queued = list(stock_vendors)
+    if not queued:
+        raise ValueError('stock_vendors is empty, cannot download ' + symbol)
+    pending = {}
+    error = None
+    pool = ThreadPoolExecutor(max_workers=len(queued))
+    try:
+        while True:
+            if queued:
+                source, name = queued.pop(0)
+                pending[pool.submit(_datareader, symbol, source,
+                                    start, end)] = name
+            if not pending:
+                raise error
+                #     ^every vendor failed.
+            done, _ = wait(pending, timeout=hedge if queued else None,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    df = future.result()
+                except Exception as exc:
+                    error = exc
+                    continue
+                print(" ::  Retrieved from " + name + ": " + symbol)
+                return df
+    finally:
+        pool.shutdown(wait=False)
+        #  ^a slow vendor answers in background, and is discarded.
+
+
+def stock_many(slangs, maxi=3650, workers=stock_workers):
+    '''Dictionary of ALL columns for stocks in slangs, keyed by slang.
+       Stocks are retrieved concurrently by at most workers threads.
+    '''
+    slangs = list(slangs)
+    if workers > 1 and len(slangs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers,
+                                                len(slangs))) as pool:
+            futures = {slang: pool.submit(stock_all, slang, maxi)
+                       for slang in slangs}
+            return {slang: futures[slang].result() for slang in slangs}
+    return {slang: stock_all(slang, maxi) for slang in slangs}
+
+
 def stock_one(slang, maxi=3650, col='Close'):
     '''slang string retrieves SINGLE column for said stock.
         Available col include: Open, High, Low, Close, Volume
@@ -0,0 +1,168 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  warehouse.py :: Columnar binary store for time series.
+
+Text formats like CSV must be parsed on every read, which dominates the
+cost of loading decades of daily data. Here a dataframe with a time index
+and numerical columns is stored column-wise in binary form:
+
+    T.npy     int64 timestamps, nanoseconds since the Unix epoch,
+    V.npy     float64 values of shape (rows, columns), Fortran order,
+              so that each column is contiguous on disk,
+    meta.json column names and dtypes, index name, and the names of
+              the above files.
+
+Reading uses numpy MEMORY MAPPING, so the dataframe is built without
+parsing or copying: pages are read lazily by the operating system.
+The map is copy-on-write, so the returned dataframe can be modified
+freely without ever changing the files on disk. Columns which were not
+float64, e.g. integer Volume of stocks, are cast back to their dtype,
+and column labels keep their type if it is str, int, or float,
+so a cache hit returns the same dataframe as the download.
+
+        Usage:  warehouse.save(path, df)
+                df = warehouse.load(path)  # None if absent.
+
+Each path is a directory. The cache module keeps its entries as warehouse
+directories, and readarchive() converts our supplemental gzip CSV archives
+(e.g. FRED-SP500_1957-2014-ARC.csv.gz) once, then reads the binary copy.
+
+Parquet or Feather would need pyarrow, an extra dependency, whereas
+the .npy format is part of numpy and supports memory mapping directly.
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Keep column dtypes and label types in meta.json.
+2026-10-18  First version: storage format for the cache module.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import json
+import time
+import numpy as np
+import pandas as pd
+from fecon236.util import system
+
+
+_metafile = 'meta.json'
+
+
+def _label(column):
+    '''Column label as stored in meta.json: kept if JSON-able scalar.'''
+    if isinstance(column, bool) or not isinstance(column,
+                                                  (str, int, float)):
+        return str(column)
+    return column
+
+
+def save(path, dataframe, source=None):
+    '''Save dataframe with DatetimeIndex and numerical columns to path.
+       source is optional JSON-able info kept in meta.json for provenance.
+    '''
+    if not isinstance(dataframe.index, pd.DatetimeIndex):
+        raise TypeError(' !!  warehouse requires DatetimeIndex.')
+    if dataframe.index.tz is not None:
+        raise TypeError(' !!  warehouse requires timezone-naive index.')
+    values = np.asfortranarray(dataframe.values, dtype=np.float64)
+    #        ^raises ValueError if some column is not numerical.
+    times = dataframe.index.values.astype('datetime64[ns]').view(np.int64)
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    #  Fresh file names for every save, so that a concurrent reader
+    #  never sees T and V from different saves: meta.json is replaced
+    #  atomically last, and only then are the former files removed.
+    stamp = '{:.6f}'.format(time.time()).replace('.', '') \
+        + '-' + str(os.getpid())
+    meta = {'T': 'T-' + stamp + '.npy', 'V': 'V-' + stamp + '.npy',
+            'columns': [_label(c) for c in dataframe.columns],
+            'dtypes': [str(d) for d in dataframe.dtypes],
+            'index': dataframe.index.name, 'source': source}
+    np.save(os.path.join(path, meta['T']), times)
+    np.save(os.path.join(path, meta['V']), values)
+    old = _readmeta(path)
+    tmp = os.path.join(path, _metafile + '.' + stamp + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(path, _metafile))
+    if old is not None:
+        for name in [old['T'], old['V']]:
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+    return
+
+
+def _readmeta(path):
+    '''Read meta.json dictionary at path, else None.'''
+    try:
+        with open(os.path.join(path, _metafile)) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def load(path):
+    '''Load dataframe from path by memory mapping, else None if absent.'''
+    meta = _readmeta(path)
+    if meta is None:
+        return None
+    times = np.load(os.path.join(path, meta['T']), mmap_mode='c')
+    values = np.load(os.path.join(path, meta['V']), mmap_mode='c')
+    #                                               ^copy-on-write.
+    index = pd.DatetimeIndex(times.view('datetime64[ns]'),
+                             name=meta['index'])
+    dataframe = pd.DataFrame(values, index=index, columns=meta['columns'],
+                             copy=False)
+    dtypes = meta.get('dtypes', [])
+    #        ^Absent in former saves, which were all float64.
+    if any(d != 'float64' for d in dtypes):
+        #  Only then copy, else values remain memory-mapped:
+        dataframe = pd.DataFrame({k: values[:, k].astype(d) for k, d in
+                                  enumerate(dtypes)}, index=index)
+        dataframe.columns = meta['columns']
+    return dataframe
+
+
+def nbytes(path):
+    '''Total size in bytes of the files stored at path.'''
+    meta = _readmeta(path)
+    if meta is None:
+        return 0
+    return sum(os.path.getsize(os.path.join(path, name))
+               for name in [meta['T'], meta['V'], _metafile])
+
+
+def delete(path):
+    '''Remove directory at path with all its contents.'''
+    if not os.path.isdir(path):
+        return
+    for name in os.listdir(path):
+        os.remove(os.path.join(path, name))
+    os.rmdir(path)
+    return
+
+
+def readarchive(filename, reader, path):
+    '''Read supplemental archive file by its binary copy at path.
+       The copy is (re)made by reader(filename) whenever the archive
+       changes, as detected by its size and modification time;
+       IOError is raised if the archive itself is not found.
+    '''
+    info = os.stat(filename)
+    stamp = [info.st_size, int(info.st_mtime)]
+    meta = _readmeta(path)
+    if meta is not None and meta.get('source') == stamp:
+        return load(path)
+    dataframe = reader(filename)
+    try:
+        save(path, dataframe, source=stamp)
+    except Exception as e:
+        system.warn('warehouse.readarchive could not save: ' + str(e))
+    return dataframe
+
+
+if __name__ == "__main__":
+    system.endmodule()
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-05-29
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  optimize.py :: Convex optimization given noisy data.
@@ -50,18 +50,30 @@ General strategy:
     a singe method must be selected.  However, our optimize() is a sequence of
     methods which starts from brute to refined, in above order.
 
+PARALLEL grid search: minBrute(..., workers=8) splits the grid into
+contiguous chunks evaluated by worker processes. The function and its
+funarg (e.g. data) are sent ONCE to each process, not per evaluation.
+Function "fun" must be picklable, i.e. defined at module level.
+An existing executor, e.g. concurrent.futures.ProcessPoolExecutor,
+may be given instead, in which case they are sent once per chunk.
+
 REFERENCES:
 - Mathematical optimization using scipy
   http://www.scipy-lectures.org/advanced/mathematical_optimization
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Note that parallel minBrute() requires scipy 1.3 or later.
+2026-10-18  minBrute() and optimize() search grid by parallel processes.
 2018-05-29  optimize.py, fecon236 fork. Pass flake8, fix imports.
 2016-04-08  ys_optimize.py, fecon235 v5.18.0312, https://git.io/fecon235
 '''
 
 from __future__ import absolute_import, print_function, division
 
+import os
+import numpy as np
 import scipy.optimize as sop
+from concurrent.futures import ProcessPoolExecutor
 from fecon236.util import system
 
 
@@ -79,20 +91,70 @@ DISPLAY = 0
 #  Please see tests/test_optimize.py which also serves as a TUTORIAL.
 
 
-def minBrute(fun, boundpairs, funarg=(), grids=20):
+_brutefun = None
+#           ^Function evaluated by a worker process, set once per process.
+
+
+def _brute_init(fun):
+    '''Initializer of worker process: keep function with its funarg.'''
+    global _brutefun
+    _brutefun = fun
+
+
+def _brute_chunk(points):
+    return [_brutefun(x) for x in points]
+
+
+def _brute_chunk_with(fun, points):
+    return [fun(x) for x in points]
+
+
+def _chunkmap(workers, executor=None):
+    '''Map-like callable for scipy brute: grid points are split into
+       contiguous chunks, a few per worker for load balance,
+       and values are returned in order of the grid.
+    '''
+    def mapper(fun, iterable):
+        points = list(iterable)
+        bounds = np.linspace(0, len(points),
+                             min(len(points), 4 * workers) + 1).astype(int)
+        chunks = [points[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_brute_init,
+                                     initargs=(fun,)) as pool:
+                results = list(pool.map(_brute_chunk, chunks))
+        else:
+            futures = [executor.submit(_brute_chunk_with, fun, c)
+                       for c in chunks]
+            results = [f.result() for f in futures]
+        return [value for result in results for value in result]
+    return mapper
+
+
+def minBrute(fun, boundpairs, funarg=(), grids=20, workers=1, executor=None):
     '''Minimization by brute force grid search.
            fun is our function to minimize, given parameters for optimization.
            boundpairs is a list of (min, max) pairs for fun parameters.
            funarg is a tuple of supplemental arguments for fun.
            grids are number of steps are taken in each direction.
+           workers > 1 evaluates the grid by as many processes
+           (-1 for all CPUs), or by executor if given:
+           requires scipy 1.3 or later, see require.txt.
     '''
     #  http://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.brute.html
     boundpairs = tuple(boundpairs)
     #  boundpairs actually must be a tuple consisting of (min,max) tuples.
     if DISPLAY:
         print(" ::  Display for minBrute() ... ")
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    options = {}
+    if workers > 1 or executor is not None:
+        options['workers'] = _chunkmap(workers, executor)
+        #  scipy wraps fun with funarg, which our map sends to processes.
     result = sop.brute(func=fun, args=funarg, ranges=boundpairs, Ns=grids,
-                       finish=None, full_output=DISPLAY)
+                       finish=None, full_output=DISPLAY, **options)
     #                  finish default is "fmin" (Nelder-Mead),
     #                  which may not respect boundpairs !!!
     #                  https://github.com/scipy/scipy/issues/1613
@@ -152,7 +214,8 @@ def minBroyden(fun, initial, funarg=(), boundpairs=None):
     return result[0]
 
 
-def optimize(fun, initialpairs, funarg=(), grids=20):
+def optimize(fun, initialpairs, funarg=(), grids=20, workers=1,
+             executor=None):
     '''Optimize by grid search, Nelder-Mead simplex, and L-BFGS-B methods.
        First a broad global search, followed by coarse non-gradient method,
        then refined quasi-Newton method by approximate low-rank Hessian.
@@ -160,6 +223,7 @@ def optimize(fun, initialpairs, funarg=(), grids=20):
            funarg is a tuple of supplemental arguments for fun.
            initialpairs is a list of (min, max) pairs for fun parameters.
            grids are number of steps are taken in each direction.
+           workers and executor parallelize the grid, see minBrute().
        However, here we are intentionally NOT CONSTRAINED by initialpairs.
     '''
     #  The argument initialpairs can be just our preliminary wild guess.
@@ -168,7 +232,7 @@ def optimize(fun, initialpairs, funarg=(), grids=20):
     #  along to other algorithms which will ignore any strict bounds
     #  if the minimization can be improved.
     brute = minBrute(fun=fun, funarg=funarg, boundpairs=initialpairs,
-                     grids=grids)
+                     grids=grids, workers=workers, executor=executor)
     if DISPLAY:
         print(brute)
         brute = brute[0]
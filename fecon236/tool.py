@@ -18,6 +18,7 @@ causing problems upon: from numpy import *
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Defer import of statsmodels to regressformula().
 2018-11-29  Add median(), mad(), and madmen() for robust rescaling.
 2018-07-08  Modify kurtfun() with population argument.
 2018-07-07  Add std() with population argument for ddof.
@@ -30,7 +31,6 @@ from __future__ import absolute_import, print_function, division
 
 import numpy as np
 import pandas as pd
-import statsmodels.formula.api as smf
 from fecon236.util import system
 
 
@@ -266,6 +266,8 @@ def regressformula(df, formula):
     #        - result.rsquared is also available.
     #        - result.aic is Akaike Information Criterion AIC.
     #
+    import statsmodels.formula.api as smf
+    #  ^Deferred: slow import, needed only for regression.
     return smf.ols(formula=formula, data=df).fit()
 
 
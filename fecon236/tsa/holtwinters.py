@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-06-16
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  holtwinters.py :: Holt-Winters time-series functions.
@@ -39,6 +39,13 @@ REFERENCES:
 
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  adaptive_holt() raises ValueError unless tol > 0, coarse >= 2.
+2026-10-18  Add adaptive_holt(), coarse-to-fine, for optimize_holt().
+2026-10-18  Add HoltState for O(1) online updates, see holtstate().
+2026-10-18  Add holt_many() and holtforecast_many() for group frames.
+2026-10-18  Add loss_holt_batch() for whole grid, used by optimize_holt().
+2026-10-18  holt_winters_growth() as linear filters by scipy.signal.
+2026-10-18  Defer import of optimize module (scipy) to optimize_holt().
 2018-06-16  Absort Holt-Winters functions from top.py, esp. forecast().
 2018-05-31  ABSORB opt_holt module to estimate optimal alpha and beta.
 2018-05-11  Fix imports.
@@ -56,18 +63,49 @@ from fecon236.util import system
 from fecon236.tool import todf, tailvalue
 from fecon236.host.hostess import get
 
-#  To estimate optimal alpha and beta, see === section:
-from fecon236.oc import optimize as op
-#  Assuming that DISPLAY=0 at optimize module.
-
 #  Holt-Winters DEFAULT parameters:
 hw_alpha = 0.26      # Based on robust optimization in Gelper 2007,
 hw_beta = 0.19       # for Gaussian, fat tail, and outlier data.
 
 
 def holt_winters_growth(y, alpha=hw_alpha, beta=hw_beta):
-    '''Helper for Holt-Winters growth (linear) model using numpy arrays.'''
+    '''Helper for Holt-Winters growth (linear) model using numpy arrays.
+       Computed as linear filters, see _holt_winters_growth_loop()
+       for the equivalent recursion, and ENDNOTES for the derivation.
+    '''
     #  N.B. -  SEASONAL variant of Holt-Winters is omitted.
+    from scipy.signal import lfilter, lfiltic
+    #  ^Deferred, since scipy.signal is slow to import.
+    y = np.asarray(y, dtype=np.float64).ravel()
+    #                   ^else a single column dataframe gives 2-d array.
+    l = np.empty(y.size)   # noqa \ Level array.
+    b = np.empty(y.size)   # Smoothed one-step growths.
+    l[0] = y[0]            # Initialize level.
+    b[0] = 0               # Algorithmically the correct guess if beta=0.
+    if beta == 0:
+        #  Growth stays 0, so level is first order, e.g. for ema();
+        #  this also avoids the unit root cancelled in the general case.
+        zi = lfiltic([alpha], [1.0, alpha - 1], [l[0]])
+        l[1:] = lfilter([alpha], [1.0, alpha - 1], y[1:], zi=zi)[0]
+        b[1:] = 0
+        return [l, b]
+    #       Common denominator (poles) of both filters:
+    den = [1.0, -(2 - alpha - alpha * beta), 1 - alpha]
+    #       Level:  numerator, then state given l[-1] = l[0] and x[0] = y[0]
+    #       reproduce l[1] of the recursion.
+    num = [alpha, -alpha * (1 - beta)]
+    zi = lfiltic(num, den, [l[0], l[0]], [y[0]])
+    l[1:] = lfilter(num, den, y[1:], zi=zi)[0]
+    #       Growth:  b[-1] = b[0] = 0.
+    num = [alpha * beta, -alpha * beta]
+    zi = lfiltic(num, den, [0.0, 0.0], [y[0]])
+    b[1:] = lfilter(num, den, y[1:], zi=zi)[0]
+    #       l, b are arrays.
+    return [l, b]
+
+
+def _holt_winters_growth_loop(y, alpha=hw_alpha, beta=hw_beta):
+    '''Reference recursion for holt_winters_growth(), slow Python loop.'''
     N = y.size             # y should be a numpy array.
     #                        0 < alpha and beta < 1
     alphac = 1 - alpha     # Complements of alpha and beta
@@ -105,6 +143,67 @@ def holt(data, alpha=hw_alpha, beta=hw_beta):
     return holtdf
 
 
+def holt_winters_many(Y, alpha=hw_alpha, beta=hw_beta):
+    '''holt_winters_growth() for K series at once, as columns of Y.
+       Y is a numpy array of shape (N, K); alpha and beta are scalars,
+       or arrays of K parameters, one per column. Missing values (NaN)
+       are skipped per column, as holt() drops them, so each column
+       starts at its first valid value. Returns [l, b] of shape (N, K),
+       with NaN where Y is missing.
+    '''
+    Y = np.asarray(Y, dtype=np.float64)
+    if Y.ndim == 1:
+        Y = Y.reshape(-1, 1)
+    N, K = Y.shape
+    alphas = np.broadcast_to(np.asarray(alpha, dtype=np.float64), (K,))
+    betas = np.broadcast_to(np.asarray(beta, dtype=np.float64), (K,))
+    alphac = 1 - alphas
+    betac = 1 - betas
+    l = np.full((N, K), np.nan)  # noqa
+    b = np.full((N, K), np.nan)
+    level = np.full(K, np.nan)   # Current state per column,
+    grow = np.zeros(K)           # NaN level until first valid value.
+    for i in range(N):
+        y = Y[i]
+        valid = ~np.isnan(y)
+        start = valid & np.isnan(level)
+        new = (alphas * y) + (alphac * (level + grow))
+        new[start] = y[start]
+        #  Same recursion as _holt_winters_growth_loop(), per column:
+        update = valid & ~start
+        grow[update] = ((betas * (new - level)) + (betac * grow))[update]
+        level[valid] = new[valid]
+        l[i, valid] = level[valid]
+        b[i, valid] = grow[valid]
+    return [l, b]
+
+
+def holt_many(dataframe, alpha=hw_alpha, beta=hw_beta):
+    '''Holt-Winters growth model for every column of dataframe at once.
+       alpha and beta are scalars, or sequences with one per column.
+       Returns [Level, Growth] dataframes aligned with the given one.
+    '''
+    l, b = holt_winters_many(dataframe.values, alpha, beta)
+    level = pd.DataFrame(l, index=dataframe.index, columns=dataframe.columns)
+    grow = pd.DataFrame(b, index=dataframe.index, columns=dataframe.columns)
+    return [level, grow]
+
+
+def holtforecast_many(dataframe, h=12, alpha=hw_alpha, beta=hw_beta):
+    '''Forecasts h periods ahead for every column of dataframe at once.
+       Same as holtforecast() of holt() per column: row 0 is the last
+       actual point, then row i is the last Level plus i times Growth.
+    '''
+    level, grow = holt_many(dataframe, alpha, beta)
+    #  Last valid values per column, as each column may end differently:
+    last = dataframe.apply(lambda col: col.loc[col.last_valid_index()])
+    l = level.ffill().iloc[-1].values        # noqa
+    b = grow.ffill().iloc[-1].values
+    steps = np.arange(1, h + 1).reshape(-1, 1)
+    forecasts = np.vstack([last.values, l + (b * steps)])
+    return pd.DataFrame(forecasts, columns=dataframe.columns)
+
+
 def holtlevel(data, alpha=hw_alpha, beta=hw_beta):
     '''Just smoothed Level dataframe from Holt-Winters growth model.'''
     #  Useful to filter out seasonals, e.g. see X-11 method:
@@ -172,6 +271,98 @@ def plotholt(holtdf, h=12):
     return
 
 
+class HoltState(object):
+    '''Online Holt-Winters filter: O(1) update per new observation.
+       Holds the latest level and growth, so a forecast is refreshed
+       without reprocessing the history as holt() does. Picklable.
+
+        Usage:  state = holtstate(data)            # or from_holt(holtdf)
+                state.update(1402.5, timestamp)    # per new tick,
+                state.forecast(12)                 # as holtforecast().
+    '''
+    __slots__ = ('level', 'growth', 'alpha', 'beta', 'y', 'last')
+
+    def __init__(self, level, growth=0.0, alpha=hw_alpha, beta=hw_beta,
+                 y=None, last=None):
+        self.level = float(level)
+        self.growth = float(growth)
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.y = self.level if y is None else float(y)
+        #        ^last actual observation, first row of forecast().
+        self.last = last
+        #           ^timestamp of last observation, if known.
+
+    @classmethod
+    def from_holt(cls, holtdf, alpha=hw_alpha, beta=hw_beta):
+        '''State at the end of a holt() workout dataframe.
+           alpha and beta should be those given to holt().
+        '''
+        y, level, growth = holtdf.values[-1].tolist()
+        return cls(level, growth, alpha, beta, y, holtdf.index[-1])
+
+    def update(self, y, when=None):
+        '''Filter one new observation y, optionally at timestamp when.
+           Missing y is skipped, as holt() drops it; an observation not
+           later than the last timestamp is ignored, e.g. a resent tick.
+        '''
+        y = float(y)
+        if y != y:
+            return self
+            #  ^NaN
+        if when is not None and self.last is not None and when <= self.last:
+            return self
+        #  Same recursion as _holt_winters_growth_loop():
+        level = (self.alpha * y) + ((1 - self.alpha)
+                                    * (self.level + self.growth))
+        self.growth = (self.beta * (level - self.level)) \
+            + ((1 - self.beta) * self.growth)
+        self.level = level
+        self.y = y
+        if when is not None:
+            self.last = when
+        return self
+
+    def update_many(self, ys, whens=None):
+        '''Filter observations in order: array, list, or dataframe
+           (whose index provides the timestamps).
+        '''
+        if isinstance(ys, (pd.DataFrame, pd.Series)):
+            whens = ys.index
+            ys = np.asarray(ys.values, dtype=np.float64).ravel()
+        if whens is None:
+            for y in ys:
+                self.update(y)
+        else:
+            for y, when in zip(ys, whens):
+                self.update(y, when)
+        return self
+
+    def forecast(self, h=12):
+        '''Forecast ahead h periods, same dataframe as holtforecast().'''
+        forecasts = [self.y] + [self.level + (self.growth * (i+1))
+                                for i in range(h)]
+        return todf(forecasts, 'Forecast')
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return ('HoltState(level={!r}, growth={!r}, alpha={!r}, beta={!r}, '
+                'y={!r}, last={!r})').format(
+                    self.level, self.growth, self.alpha, self.beta,
+                    self.y, self.last)
+
+
+def holtstate(data, alpha=hw_alpha, beta=hw_beta):
+    '''HoltState seeded by holt() over the history in data.'''
+    return HoltState.from_holt(holt(data, alpha, beta), alpha, beta)
+
+
 def ema(y, alpha=0.20):
     '''EXPONENTIAL MOVING AVERAGE using traditional weight arg.'''
     #  y could be a dataframe.
@@ -182,7 +373,9 @@ def ema(y, alpha=0.20):
 
 # ============================= ROBUST OPTIMAL ESTIMATION of alpha and beta ===
 '''
-We shall rely on optimize.minBrute() to find optimal alpha and beta:
+We shall rely on a grid search to find optimal alpha and beta:
+by default, loss_holt_batch() evaluates the whole grid in one pass,
+otherwise optimize.minBrute() calls loss_holt() at each grid point.
 
 - minBrute() from optimize module: non-convex problem: GLOBAL optimizers:
     If your problem does NOT admit a unique local minimum (which can be hard
@@ -247,26 +440,166 @@ def loss_holt(params, *args):
     return np.median(np.absolute(error[10:]))
 
 
+holt_batchsize = 2 ** 23
+#                ^Maximum elements, data points times parameter pairs,
+#                 of the array held by loss_holt_batch(): 64 MB.
+
+
+def loss_holt_batch(data, alphas, betas):
+    '''loss_holt() for many parameter pairs at once, as numpy array.
+       alphas and betas are broadcast together, and their shape is kept,
+       so given a meshgrid of parameters, the LOSS SURFACE is returned.
+       Only the 1-step ahead forecasts are stored, at most holt_batchsize
+       elements at a time, so pairs are processed in chunks if needed.
+    '''
+    y = todf(data).values.ravel()
+    alphas, betas = np.broadcast_arrays(np.asarray(alphas, dtype=np.float64),
+                                        np.asarray(betas, dtype=np.float64))
+    shape = alphas.shape
+    alphas = alphas.ravel()
+    betas = betas.ravel()
+    N = y.size
+    losses = np.empty(alphas.size)
+    chunk = max(1, holt_batchsize // N)
+    for start in range(0, alphas.size, chunk):
+        alpha = alphas[start:start+chunk]
+        beta = betas[start:start+chunk]
+        alphac = 1 - alpha
+        betac = 1 - beta
+        level = np.full(alpha.size, y[0])
+        grow = np.zeros(alpha.size)
+        fore = np.empty((N, alpha.size))
+        #      ^fore[i] = level + grow, forecast of y[i+1] at time i.
+        fore[0] = level
+        for i in range(1, N):
+            new = (alpha * y[i]) + (alphac * fore[i-1])
+            grow = (beta * (new - level)) + (betac * grow)
+            level = new
+            np.add(level, grow, out=fore[i])
+        #  In place, forecasts become absolute errors as in loss_holt():
+        error = fore[:-1]
+        np.subtract(y[1:, None], error, out=error)
+        np.absolute(error, out=error)
+        #  Ignore the first ten errors due to initialization warm-up:
+        losses[start:start+chunk] = np.median(error[10:], axis=0)
+    return losses.reshape(shape)
+
+
+holt_coarse = 11
+#             ^Points per parameter of the first grid in adaptive_holt().
+holt_keep = 3
+#           ^Local minima of the coarse grid refined by adaptive_holt().
+holt_tol = 0.01
+#          ^Spacing, in units of parameter, where adaptive_holt() stops.
+
+
+def adaptive_holt(dataframe, alphas=(0.0, 1.0), betas=(0.0, 1.0),
+                  tol=holt_tol, keep=holt_keep, coarse=holt_coarse):
+    '''Coarse-to-fine search for loss_holt() minimum, within bounds.
+       Returns [alpha, beta, evaluations], the latter being the number
+       of parameter pairs whose loss was computed.
+       A coarse grid is evaluated first, and its "keep" best LOCAL minima
+       are refined, since the median loss is not smooth and may have
+       several basins. Each level evaluates 5 by 5 grids spanning the
+       neighbouring cells around those points at half the previous
+       spacing, then keeps the best "keep" points found so far, until
+       spacing is at most tol. Points lie on one lattice, so none is
+       evaluated twice: about 200 evaluations by default, versus 2500
+       for optimize_holt(grids=50), for at least as fine a resolution.
+       ValueError is raised unless tol > 0 and coarse >= 2.
+    '''
+    if not tol > 0:
+        raise ValueError('tol must be positive.')
+    if coarse < 2:
+        raise ValueError('coarse grid needs at least 2 points.')
+    lows = np.array([alphas[0], betas[0]], dtype=np.float64)
+    spans = np.array([alphas[1] - alphas[0], betas[1] - betas[0]],
+                     dtype=np.float64)
+    levels = 0
+    while spans.max() / ((coarse - 1) * 2 ** levels) > tol:
+        levels += 1
+    step = 2 ** levels
+    cells = (coarse - 1) * step
+    #  Integer coordinates (i, j) on the finest lattice of "cells"
+    #  intervals per parameter, so the coarse grid has spacing "step".
+    losses = {}
+
+    def evaluate(points):
+        points = [p for p in set(points) if p not in losses]
+        if points:
+            ij = np.array(points, dtype=np.float64)
+            params = lows + spans * ij / cells
+            for p, loss in zip(points, loss_holt_batch(
+                    dataframe, params[:, 0], params[:, 1])):
+                losses[p] = loss
+        return
+
+    evaluate([(i * step, j * step) for i in range(coarse)
+              for j in range(coarse)])
+    surface = np.array([[losses[(i * step, j * step)]
+                         for j in range(coarse)] for i in range(coarse)])
+    padded = np.pad(surface, 1, mode='constant', constant_values=np.inf)
+    minima = [(i, j) for i in range(coarse) for j in range(coarse)
+              if surface[i, j] <= padded[i:i+3, j:j+3].min()]
+    minima.sort(key=lambda p: (surface[p], p))
+    #  ^Ties on a plateau favour smaller alpha, then beta, as minBrute.
+    centers = [(i * step, j * step) for i, j in minima[:keep]]
+    while step > 1:
+        step //= 2
+        window = [(i * step, j * step) for i in range(-2, 3)
+                  for j in range(-2, 3)]
+        evaluate([(ci + di, cj + dj) for ci, cj in centers
+                  for di, dj in window
+                  if 0 <= ci + di <= cells and 0 <= cj + dj <= cells])
+        centers = sorted(losses, key=lambda p: (losses[p], p))[:keep]
+    i, j = centers[0]
+    alpha, beta = lows + spans * np.array([i, j]) / cells
+    return [alpha, beta, len(losses)]
+
+
 #  NOTICE: TUPLE "funarg" is used to specify arguments to function "fun"
 #          which are NOT the parameters to be optimized (e.g. data).
 #          Gotcha: Remember a single-element tuple must include
 #          that mandatory comma: (alone,)
 
 
-def optimize_holt(dataframe, grids=50, alphas=(0.0, 1.0), betas=(0.0, 1.0)):
+def optimize_holt(dataframe, grids=50, alphas=(0.0, 1.0), betas=(0.0, 1.0),
+                  method='grid', workers=1, tol=holt_tol):
     '''Optimize Holt-Winters parameters alpha and beta for given data.
        The alphas and betas are boundaries of respective explored regions.
        Function interpolates "grids" from its low bound to its high bound,
        inclusive. Final output: [alpha, beta, losspc, median absolute loss]
-       TIP: narrow down alphas and betas using optimize_holt iteratively.
+       TIP: narrow down alphas and betas using optimize_holt iteratively,
+       or automatically by method 'adaptive', see adaptive_holt(),
+       which ignores grids and refines down to spacing tol.
+       method 'grid' evaluates the whole grid by loss_holt_batch(),
+       'brute' calls loss_holt() per grid point by optimize.minBrute(),
+       using as many processes as workers.
     '''
-    if grids > 49:
-        system.warn("Optimizing Holt-Winters alphabetaloss may take TIME!")
-        #  Exploring loss at all the grids is COMPUTATIONALLY INTENSE
-        #  due to holt(), especially if the primary data is very large.
-        #  Tip: truncate dataframe to recent data.
-    result = op.minBrute(fun=loss_holt, funarg=(dataframe,),
-                         boundpairs=[alphas, betas], grids=grids)
+    if method == 'grid':
+        grid = np.meshgrid(np.linspace(alphas[0], alphas[1], grids),
+                           np.linspace(betas[0], betas[1], grids),
+                           indexing='ij')
+        surface = loss_holt_batch(dataframe, *grid)
+        k = np.argmin(surface)
+        #   ^first minimum in same order as minBrute, alpha major.
+        result = np.array([grid[0].flat[k], grid[1].flat[k]])
+    elif method == 'adaptive':
+        result = np.array(adaptive_holt(dataframe, alphas, betas, tol)[:2])
+    elif method == 'brute':
+        if grids > 49:
+            system.warn("Optimizing Holt-Winters alphabetaloss may take TIME!")
+            #  Exploring loss at all the grids is COMPUTATIONALLY INTENSE
+            #  due to holt(), especially if the primary data is very large.
+            #  Tip: truncate dataframe to recent data.
+        from fecon236.oc import optimize as op
+        #  ^Deferred, since scipy.optimize is slow to import.
+        #   Assuming that DISPLAY=0 at optimize module.
+        result = op.minBrute(fun=loss_holt, funarg=(dataframe,),
+                             boundpairs=[alphas, betas], grids=grids,
+                             workers=workers)
+    else:
+        raise ValueError("method must be 'grid', 'adaptive', or 'brute'.")
     #  result is a numpy array, so convert to list:
     alpha, beta = list(result)
     #  Compute loss, given optimal parameters:
@@ -330,3 +663,23 @@ if __name__ == "__main__":
 #  makridakis_p65 = np.array([143, 152, 161, 139, 137, 174, 142, 141, 162,
 #                            180, 164, 171, 206, 193, 207, 218, 229, 225, 204,
 #                            227, 223, 242, 239, 266])
+
+
+#  __________ holt_winters_growth() as LINEAR FILTERS, derivation:
+#
+#  Recursion:  l[i] = alpha*y[i] + (1-alpha)*(l[i-1] + b[i-1])
+#              b[i] = beta*(l[i] - l[i-1]) + (1-beta)*b[i-1]
+#
+#  In terms of the lag operator z, the second equation gives
+#  B = beta*(1-z)*L / (1-(1-beta)*z), and eliminating B from the first:
+#
+#      L*(1 - (2-alpha-alpha*beta)*z + (1-alpha)*z**2)
+#                               = Y*(alpha - alpha*(1-beta)*z)
+#      B*(same denominator)     = Y*(alpha*beta - alpha*beta*z)
+#
+#  Both are IIR filters which scipy.signal.lfilter runs in C.
+#  Initial state: l[-1] = l[0] = y[0] and b[-1] = b[0] = 0 make the
+#  filters reproduce l[1] and b[1] of the recursion exactly.
+#  Poles approach z=1 as alpha and beta approach 0, yet agreement with
+#  the loop stays within rounding error (relative 1e-9 for alpha and
+#  beta near 0.001), see tests/test_holtwinters.py
@@ -1,9 +1,12 @@
-#  Python Module for import                           Date : 2018-06-17
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  group.py :: Group utilities
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  groupholtf() forecasts all columns at once by hw.holt_many().
+2026-10-18  groupget() downloads concurrently by bounded thread pool,
+                subject to per-vendor concurrency limits.
 2018-06-17  Spin-off groupcotr() to futures.cftc module.
 2018-06-16  Move covdiflog() to math.matrix module.
 2018-06-14  Spin-off group stuff from top.py.
@@ -12,10 +15,12 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import absolute_import, print_function, division
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from fecon236 import tool
 from fecon236.util import system
 from fecon236.host import fred
-from fecon236.host.hostess import get
+from fecon236.host.hostess import get, vendor
 from fecon236.dst.gaussmix import gemrat
 from fecon236.tsa import holtwinters as hw
 
@@ -35,13 +40,37 @@ world4d = {'America': 's4spy', 'Europe': 's4ezu',
 #         representing EQUITIES worldwide plus gold.
 
 
-def groupget(ggdic=group4d, maxi=0):
-    '''Retrieve and create group dataframe, given group dictionary.'''
+#  CONCURRENT DOWNLOADS:  groupget() fetches members by a thread pool,
+#  so wall time approaches that of the slowest series, not their sum.
+groupworkers = 8
+#              ^Default maximum number of concurrent downloads.
+vendorlimits = {'fred': 8, 'quandl': 4, 'stock': 2}
+#              ^Per-vendor cap on concurrent downloads, see hostess.vendor()
+
+
+def groupget(ggdic=group4d, maxi=0, workers=groupworkers):
+    '''Retrieve and create group dataframe, given group dictionary.
+       Members are downloaded concurrently by at most "workers" threads,
+       also subject to vendorlimits; workers=1 downloads sequentially.
+    '''
     #  Since dictionaries are unordered, create SORTED list of keys:
     keys = [key for key in sorted(ggdic)]
     #  Download individual dataframes as values into a dictionary:
-    dfdic = {key: get(ggdic[key], maxi) for key in keys}
-    #           ^Illustrates dictionary comprehension.
+    if workers > 1 and len(keys) > 1:
+        gates = {v: threading.BoundedSemaphore(n)
+                 for v, n in vendorlimits.items()}
+
+        def gatedget(code):
+            with gates[vendor(code)]:
+                return get(code, maxi)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(keys))) as pool:
+            futures = {key: pool.submit(gatedget, ggdic[key]) for key in keys}
+            dfdic = {key: futures[key].result() for key in keys}
+            #  result() re-raises any download error in the calling thread.
+    else:
+        dfdic = {key: get(ggdic[key], maxi) for key in keys}
+        #           ^Illustrates dictionary comprehension.
     #  Paste together dataframes into one large sorted dataframe:
     groupdf = tool.paste([dfdic[key] for key in keys])
     #  Name the columns:
@@ -115,17 +144,11 @@ def groupgemrat(groupdf, yearly=256, order=False, n=2):
 
 
 def groupholtf(groupdf, h=12, alpha=hw.hw_alpha, beta=hw.hw_beta):
-    '''Holt-Winters forecasts h-periods ahead from group dataframe.'''
-    forecasts = []
-    keys = list(groupdf.columns)
-    for k in keys:
-        kdf = tool.todf(groupdf[k])
-        holtdf = hw.holt(kdf, alpha, beta)
-        forecastdf = hw.holtforecast(holtdf, h)
-        forecasts.append(forecastdf)
-    keysdf = tool.paste(forecasts)
-    keysdf.columns = keys
-    return keysdf
+    '''Holt-Winters forecasts h-periods ahead from group dataframe.
+       alpha and beta may also be sequences, one per column.
+    '''
+    #  All columns are smoothed at once, see hw.holt_winters_many():
+    return hw.holtforecast_many(groupdf, h, alpha, beta)
 
 
 if __name__ == "__main__":
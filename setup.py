@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
-#  Python package installation                        Date : 2018-06-20
+#  Python package installation                        Date : 2026-10-18
 '''
 _______________|  fecon236/setup.py :: Installation via setuptools.
 
@@ -43,6 +43,8 @@ VERSION in play:  Use "pip show fecon236"
      CLASSIFERS:  https://pypi.python.org/pypi?%3Aaction=list_classifiers
 
 CHANGE LOG  For latest version, see https://git.io/fecon236
+2026-10-18  Require Python 3.7+, e.g. for host modules and lazy imports.
+2026-10-18  Point to require.txt for minimum versions, e.g. scipy.
 2018-06-20  Change development status from alpha to stable.
 2018-06-02  Add PROJECTURL and edit project_urls.
 2018-05-24  Support markdown by appending "content_type" incantations.
@@ -94,6 +96,8 @@ PROJECTURL = 'https://github.com/MathSci/' + PROJECT
 REQUIRED = []
 #          ^Leave EMPTY instead of relying on --no-deps
 #           (We do not want conflicts with conda installations.)
+#           MINIMUM versions are declared in require.txt instead,
+#           e.g. scipy>=1.3 for parallel optimize.minBrute().
 
 
 with open('README.md') as f:
@@ -126,7 +130,7 @@ setup(
     long_description_content_type="text/markdown",
     author='Mathematical Sciences Group',
     author_email='MathSci-github@googlegroups.com',
-    python_requires='>=2.7.0',
+    python_requires='>=3.7',
     url=PROJECTURL,
     project_urls={
         'Source': PROJECTURL,
@@ -152,10 +156,9 @@ setup(
         'Intended Audience :: Financial and Insurance Industry',
         'Natural Language :: English',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: Implementation :: CPython'
     ],
 )
@@ -0,0 +1,128 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_ahostess.py :: Test fecon236 host.ahostess module
+
+Offline: vendor functions are replaced by slow local fakes, so that
+concurrency, vendor order, timeout, and cancellation can be observed.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test hedged vendors in aget().
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import time
+import asyncio
+import pytest
+from os import sep
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import qdl
+from fecon236.host.ahostess import aget, aget_many
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+xau = fred.readfile('tests' + sep + 'zdata-xau-13hj-c30.csv')
+
+
+@pytest.fixture
+def fakes(monkeypatch):
+    '''Slow fakes of getfred and getqdl which record their calls.'''
+    calls = []
+
+    def getfred(code):
+        calls.append(('fred', code))
+        time.sleep(0.2)
+        if code.startswith('BAD') or '/' in code:
+            raise ValueError('not at FRED')
+        return xau
+
+    def getqdl(code, maxi=0):
+        calls.append(('qdl', code))
+        time.sleep(0.2)
+        if code.startswith('BAD'):
+            raise ValueError('not at Quandl')
+        return xau
+
+    monkeypatch.setattr(fred, 'getfred', getfred)
+    monkeypatch.setattr(qdl, 'getqdl', getqdl)
+    return calls
+
+
+def test_ahostess_fecon236_aget_many_concurrent(fakes):
+    '''Eight retrievals of 0.2 seconds each overlap in time.'''
+    codes = ['CODE' + str(i) for i in range(8)]
+    start = time.time()
+    dfs = asyncio.run(aget_many(codes, limit=8))
+    assert time.time() - start < 1.0
+    assert sorted(dfs) == codes
+    assert all(df.equals(xau) for df in dfs.values())
+
+
+def test_ahostess_fecon236_aget_vendor_order(fakes):
+    '''Quandl code goes to Quandl first; FRED failure falls back.'''
+    asyncio.run(aget('CHRIS/CME_GC1'))
+    assert fakes == [('qdl', 'CHRIS/CME_GC1')]
+    del fakes[:]
+    with pytest.raises(ValueError):
+        asyncio.run(aget('BADCODE'))
+    assert fakes == [('fred', 'BADCODE'), ('qdl', 'BADCODE')]
+
+
+def test_ahostess_fecon236_aget_hedged(fakes, monkeypatch):
+    '''Slow first vendor is hedged; the faster answer is taken.'''
+    slow = xau.iloc[:5]
+
+    def getfred(code):
+        fakes.append(('fred', code))
+        time.sleep(1.0)
+        return slow
+
+    monkeypatch.setattr(fred, 'getfred', getfred)
+
+    async def timed():
+        start = time.time()
+        df = await aget('DFF', hedge=0.05)
+        return df, time.time() - start
+
+    df, secs = asyncio.run(timed())
+    #  ^asyncio.run() itself waits for the discarded slow thread.
+    assert secs < 0.9
+    assert df.equals(xau)
+    assert fakes == [('fred', 'DFF'), ('qdl', 'DFF')]
+
+
+def test_ahostess_fecon236_timeout_cancel(fakes):
+    '''Timeout raises or is returned; cancellation is immediate.'''
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(aget('DFF', timeout=0.05))
+    dfs = asyncio.run(aget_many(['DFF', 'BADCODE'], timeout=0.05,
+                                return_exceptions=True))
+    assert isinstance(dfs['DFF'], asyncio.TimeoutError)
+
+    async def cancelled():
+        task = asyncio.ensure_future(aget_many(['DFF', 'T10Y2Y']))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        start = time.time()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return time.time() - start
+
+    assert asyncio.run(cancelled()) < 0.1
+
+
+if __name__ == "__main__":
+    system.endmodule()
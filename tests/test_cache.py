@@ -0,0 +1,111 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_cache.py :: Test fecon236 cache module.
+
+- Round trip of store() and load() using local CSV data.
+- fetch() calls the download only upon cache miss or refresh.
+- Expiration by time-to-live, and LRU eviction by size.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test deferred index write upon cache hit.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import pytest
+from os import sep
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import cache
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+xau = fred.readfile('tests' + sep + 'zdata-xau-13hj-c30.csv')
+
+
+@pytest.fixture
+def tmpcache(tmpdir, monkeypatch):
+    '''Redirect cache to a temporary directory for each test.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    monkeypatch.setattr(cache, 'CACHING', True)
+    return tmpdir
+
+
+def test_cache_fecon236_freqclass():
+    '''Daily data is classified by its minimum index delta.'''
+    assert cache.freqclass(xau) == 'd'
+    assert cache.freqclass(fred.monthly(xau)) == 'm'
+
+
+def test_cache_fecon236_store_load(tmpcache):
+    '''Round trip through disk preserves the dataframe.'''
+    assert cache.load('fred', 'XAU') is None
+    cache.store('fred', 'XAU', xau)
+    df = cache.load('fred', 'XAU')
+    assert df.equals(xau)
+    assert list(cache.status().index) == ['fred_XAU']
+
+
+def test_cache_fecon236_fetch_refresh(tmpcache):
+    '''Download is called only on cache miss, or if refresh is forced.'''
+    calls = []
+
+    def download():
+        calls.append(1)
+        return xau
+
+    cache.fetch('fred', 'XAU', download)
+    cache.fetch('fred', 'XAU', download)
+    assert len(calls) == 1
+    cache.fetch('fred', 'XAU', download, refresh=True)
+    assert len(calls) == 2
+    cache.CACHING = False
+    cache.fetch('fred', 'XAU', download)
+    assert len(calls) == 3
+
+
+def test_cache_fecon236_expire(tmpcache):
+    '''Entry older than maxage is treated as a miss.'''
+    cache.store('fred', 'XAU', xau)
+    assert cache.load('fred', 'XAU', maxage=-1) is None
+    assert cache.load('fred', 'XAU', maxage=60) is not None
+
+
+def test_cache_fecon236_evict_lru(tmpcache):
+    '''Least recently used entries are evicted first.'''
+    cache.store('fred', 'A', xau)
+    cache.store('fred', 'B', xau)
+    cache.load('fred', 'A')
+    #  Now B is the least recently used, so evict down to one entry:
+    cache.evict(maxbytes=cache.status()['bytes'].max())
+    assert cache.load('fred', 'B') is None
+    assert cache.load('fred', 'A') is not None
+
+
+def test_cache_fecon236_hit_defers_index_write(tmpcache):
+    '''Cache hit does not rewrite the index until flush().'''
+    cache.store('fred', 'XAU', xau)
+    index = tmpcache.join(cache._indexfile)
+    written = index.read()
+    assert cache.load('fred', 'XAU') is not None
+    assert index.read() == written
+    accessed = cache.status().loc['fred_XAU', 'accessed']
+    cache.flush()
+    assert index.read() != written
+    cache._accessed.clear()
+    assert cache.status().loc['fred_XAU', 'accessed'] == accessed
+
+
+if __name__ == "__main__":
+    system.endmodule()
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-05-12
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  test_fred.py :: Test fecon236 fred module.
@@ -6,6 +6,9 @@ _______________|  test_fred.py :: Test fecon236 fred module.
 - Include test of index_delta_secs()
 - Indirect test of resample_main() via rewritten functions:
     daily(), monthly(), and quarterly().
+- Offline test of synthetic fredcodes resolved by getfred() via fred_nodes.
+- Offline test of incremental refresh_fred() merging revised tail.
+- Fast path readfile_fred() agrees with readfile_infer().
 
 Testing: We favor pytest over nosetests, so e.g.
     $ py.test --doctest-modules
@@ -15,6 +18,11 @@ REFERENCE
             or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test frame fresh from getfred() takes resample fast path.
+2026-10-18  Test index_delta_secs() kept by LRU, not on index.
+2026-10-18  Test fast path of readfile() against former method.
+2026-10-18  Test refresh_fred() using temporary cache directory.
+2026-10-18  Test getfred() graph of synthetic fredcodes offline.
 2018-05-12  Specify directory of zdata.
 2018-05-10  fecon236 fork. Pass flake8.
 2016-11-06  fecon235 v5.18.0312, https://git.io/fecon235
@@ -22,10 +30,13 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import absolute_import, print_function, division
 
+import io
+import pandas as pd
 from os import sep
 from fecon236 import tool
 from fecon236.util import system
 from fecon236.host import fred
+from fecon236.host import cache
 #
 #  N.B. -  In this tests directory without __init__.py,
 #          we use absolute import as if outside the fecon236 package,
@@ -141,5 +152,103 @@ def test_fred_fecon236_check_xau_resample_main():
     pass
 
 
+def test_fred_fecon236_getfred_shared_leaves(monkeypatch):
+    '''Synthetic fredcodes download each underlying series only once.'''
+    calls = []
+
+    def fakedata(fredcode, refresh=False):
+        calls.append(fredcode)
+        return tool.todf(xau / len(fredcode))
+
+    monkeypatch.setattr(fred, 'getdata_fred', fakedata)
+    df = fred.getfred(fred.m4xaueur)
+    assert sorted(calls) == [fred.d4eurusd, fred.d4xau]
+    #  Compare with the former recursive computation:
+    xauusd = fred.monthly(fakedata(fred.d4xau)).dropna()
+    eurusd = fred.monthly(fakedata(fred.d4eurusd)).dropna()
+    assert df.equals((xauusd / eurusd).dropna())
+    del calls[:]
+    fred.getfred(fred.m4gdpusr)
+    assert sorted(calls) == sorted(fred.ml_infl + [fred.q4gdpus])
+
+
+def test_fred_fecon236_refresh_fred_tail(tmpdir, monkeypatch):
+    '''Only the tail is downloaded, revising overlap and appending.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    cached = tool.todf(xau.iloc[:25].copy())
+    cache.store('fred', 'XAU', cached)
+    starts = []
+
+    def faketail(fredcode, start=None):
+        starts.append(start)
+        tail = tool.todf(xau.iloc[20:].copy())
+        tail.iloc[0, 0] = 9999.0
+        #  ^revision of an overlapping observation.
+        return tail, 100
+
+    monkeypatch.setattr(fred, 'download_fred_since', faketail)
+    report = fred.refresh_fred('XAU')
+    assert starts == [xau.index[20].strftime('%Y-%m-%d')]
+    assert report['appended'] == len(xau.index) - 25
+    assert report['revised'] == 1
+    assert report['bytes'] == 100
+    df = cache.load('fred', 'XAU')
+    assert len(df.index) == len(xau.index)
+    assert df.iloc[20, 0] == 9999.0
+    assert df.iloc[-1, 0] == xau.iloc[-1, 0]
+    report = fred.refresh_many(['XAU'], workers=1)
+    assert report.loc['XAU', 'appended'] == 0
+
+
+def test_fred_fecon236_readfile_fast_path():
+    '''FRED layout gives same result by fast path, else falls back.'''
+    zfile = 'tests' + sep + 'zdata-xau-13hj-c30.csv'
+    assert fred.readfile_fred(zfile).equals(fred.readfile_infer(zfile))
+    text = 'DATE,VALUE\n2018-01-01,.\n2018-01-02,1.5\n2018-01-03,.\n'
+    df = fred.readfile(io.StringIO(text))
+    assert df.equals(fred.readfile_infer(io.StringIO(text)))
+    assert list(df['Y'].values[1:]) == [1.5, 1.5]
+    #  Dates not in ISO format must still be read by the former method:
+    text = 'DATE,VALUE\n01/02/2018,1.5\n01/03/2018,2\n'
+    df = fred.readfile(io.BytesIO(text.encode()))
+    assert list(df.index.strftime('%Y-%m-%d')) == ['2018-01-02',
+                                                   '2018-01-03']
+
+
+def test_fred_fecon236_frequency_tag_skips_rescan():
+    '''Check index delta is cached, and tagged data is not resampled.'''
+    xaumon = fred.monthly(xau)
+    assert xaumon.index.freqstr == 'MS'
+    secs = fred.index_delta_secs(xau)
+    assert not hasattr(xau.index, '_fecon236_delta_secs')
+    assert any(index is xau.index for index, _ in fred._deltas.values())
+    assert fred.index_delta_secs(xau * 2) == secs
+    #      Derived frame shares the index, thus its cached delta.
+    again = fred.monthly(xaumon)
+    assert again.equals(xaumon)
+    assert again is not xaumon
+
+
+def test_fred_fecon236_get_frame_takes_fast_path(tmpdir, monkeypatch):
+    '''Monthly frame fresh from getfred() is tagged, not resampled.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    monkeypatch.setattr(cache, 'CACHING', True)
+    text = 'DATE,VALUE\n' + ''.join('2017-{:02d}-01,{}.5\n'.format(m, m)
+                                    for m in range(1, 13))
+    monkeypatch.setattr(fred, 'download_fred', lambda fredcode:
+                        fred.readfile(io.BytesIO(text.encode())))
+    for _ in range(2):
+        #  Cache miss, then cache hit:
+        df = fred.getfred('MONTHLY')
+        assert df.index.freqstr == 'MS'
+
+        def noresample(*args, **kwargs):
+            raise AssertionError('resample should be skipped')
+
+        with monkeypatch.context() as m:
+            m.setattr(pd.DataFrame, 'resample', noresample)
+            assert fred.monthly(df).equals(df)
+
+
 if __name__ == "__main__":
     system.endmodule()
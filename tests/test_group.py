@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-06-19
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  test_group.py :: Test fecon236 util.group module
@@ -19,6 +19,9 @@ pytest:  https://pytest.org/latest/getting-started.html
          or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test concurrent groupget() by overlap, not elapsed time.
+2026-10-18  Test groupholtf() against holtforecast() per column.
+2026-10-18  Test concurrent groupget() offline with a stand-in get().
 2018-06-18  test_group.py, fecon236 fork. Pass flake8.
                 Tests due for a spin-off are commented out.
 2018-03-10  test_fecon235.py, v5.18.0312, https://git.io/fecon235
@@ -26,9 +29,15 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 
 from __future__ import absolute_import, print_function, division
 
+import threading
+import numpy as np
+import pandas as pd
+from os import sep
+from fecon236 import tool
 from fecon236.util import system
 from fecon236.util import group
 from fecon236.host import fred
+from fecon236.tsa import holtwinters as hw
 
 
 def test_group_fecon236_groupget_groupgeoret_vSlow():
@@ -42,5 +51,52 @@ def test_group_fecon236_groupget_groupgeoret_vSlow():
                  '2010-01-01', '2015-12-31', 'EURUSD']
 
 
+def test_group_fecon236_groupget_concurrent(monkeypatch):
+    '''Test groupget() overlaps downloads, using a stand-in get().'''
+    xau = fred.readfile('tests' + sep + 'zdata-xau-13hj-c30.csv')
+    lock = threading.Lock()
+    active = [0]
+    overlap = threading.Event()
+
+    def slowget(code, maxi=0):
+        with lock:
+            active[0] += 1
+            if active[0] > 1:
+                overlap.set()
+        overlap.wait(5)
+        #  ^each call waits until another is running at the same time,
+        #   which never happens if downloads are sequential.
+        with lock:
+            active[0] -= 1
+        return tool.todf(xau * len(code))
+
+    monkeypatch.setattr(group, 'get', slowget)
+    gdic = {'A': 'DFF', 'B': 'DGS10', 'C': 'DTB3', 'D': 'DEXJPUS'}
+    gdf = group.groupget(gdic, workers=4)
+    assert overlap.is_set()
+    assert list(gdf.columns) == ['A', 'B', 'C', 'D']
+    assert gdf['D'].iloc[-1] == 1393.75 * 7
+    assert gdf.equals(group.groupget(gdic, workers=1))
+
+
+def test_group_fecon236_groupholtf_per_column():
+    '''Test groupholtf() forecasts equal holtforecast() column by column,
+       with missing values and per-column alpha.
+    '''
+    values = 100 * np.exp(np.cumsum(np.random.RandomState(236).normal(
+        0, 0.01, (200, 3)), axis=0))
+    gdf = pd.DataFrame(values, columns=['A', 'B', 'C'],
+                       index=pd.bdate_range('2018-01-01', periods=200))
+    gdf.iloc[:20, 1] = np.nan
+    gdf.iloc[-3:, 2] = np.nan
+    alphas = [0.2, 0.26, 0.5]
+    fdf = group.groupholtf(gdf, h=6, alpha=alphas)
+    assert list(fdf.columns) == ['A', 'B', 'C'] and len(fdf) == 7
+    for key, alpha in zip(gdf.columns, alphas):
+        expect = hw.holtforecast(hw.holt(tool.todf(gdf[key]), alpha), 6)
+        assert np.allclose(fdf[key].values, expect['Forecast'].values,
+                           rtol=1e-12)
+
+
 if __name__ == "__main__":
     system.endmodule()
@@ -1,9 +1,13 @@
-#  Python Module for import                           Date : 2018-08-01
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  test_holtwinters.py :: Test fecon236 holtwinters module.
 
 - Test holt() and its workout dataframe.
+- Test linear filter holt_winters_growth() against the Python loop.
+- Test batched loss over parameter grid against loss_holt() per point.
+- Test holt_many() for multiple columns against holt() per column.
+- Test online HoltState updates against holt() over full history.
 - Test ema() which is a special case of Holt-Winters.
 - Test optimize_holt(), absorbed from opt_holt module, which produces
   robust optimal estimates of alpha and beta.
@@ -20,6 +24,12 @@ REFERENCE
             or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test adaptive_holt() rejects tol <= 0 and coarse < 2.
+2026-10-18  Test optimize_holt() adaptive method against dense grid.
+2026-10-18  Test HoltState updates, forecast, and pickling.
+2026-10-18  Test holt_many() with missing values.
+2026-10-18  Test loss_holt_batch() and optimize_holt() grid method.
+2026-10-18  Test holt_winters_growth() filters against reference loop.
 2018-08-01  Import pytest for mark.xfail decorator.
 2018-06-20  Include test of foreholt() and forecast() from test_group.py.
 2018-05-31  Include test of optimize_holt().
@@ -30,6 +40,9 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 from __future__ import absolute_import, print_function, division
 
 import pytest
+import pickle
+import numpy as np
+import pandas as pd
 from os import sep
 from fecon236 import tool
 from fecon236.util import system
@@ -229,6 +242,99 @@ def test_holtwinters_fecon236_check_ema():
     pass
 
 
+@pytest.mark.parametrize('alpha, beta', [(0.26, 0.19), (0.2, 0.0),
+                                         (0.01, 0.01), (1.0, 0.0),
+                                         (0.0, 0.0), (0.9, 1.0)])
+def test_holtwinters_fecon236_growth_filter_equals_loop(alpha, beta):
+    '''Linear filters reproduce Level and Growth of the recursion.'''
+    y = 100 * np.exp(np.cumsum(np.random.RandomState(236).normal(
+        0, 0.01, 5000)))
+    level, growth = hw.holt_winters_growth(y, alpha, beta)
+    looplevel, loopgrowth = hw._holt_winters_growth_loop(y, alpha, beta)
+    assert np.allclose(level, looplevel, rtol=1e-10, atol=0)
+    assert np.allclose(growth, loopgrowth, rtol=0, atol=1e-10)
+
+
+def test_holtwinters_fecon236_batch_loss_equals_loss_holt(monkeypatch):
+    '''Batched loss agrees with single evaluations of loss_holt(),
+       also when parameter pairs are processed in chunks.
+    '''
+    y = 100 * np.exp(np.cumsum(np.random.RandomState(236).normal(
+        0.001, 0.02, 300)))
+    data = tool.todf(y)
+    alphas, betas = np.meshgrid(np.linspace(0, 1, 7), np.linspace(0, 1, 5),
+                                indexing='ij')
+    monkeypatch.setattr(hw, 'holt_batchsize', 300 * 4)
+    surface = hw.loss_holt_batch(data, alphas, betas)
+    assert surface.shape == (7, 5)
+    for i in range(7):
+        for j in range(5):
+            params = (alphas[i, j], betas[i, j])
+            assert abs(surface[i, j] - hw.loss_holt(params, data)) < 1e-9
+
+
+def test_holtwinters_fecon236_optimize_holt_grid_equals_brute():
+    '''Grid method finds the same optimum as minBrute.'''
+    assert hw.optimize_holt(xau, grids=20) == hw.optimize_holt(
+        xau, grids=20, method='brute')
+    with pytest.raises(ValueError):
+        hw.optimize_holt(xau, method='simplex')
+
+
+def test_holtwinters_fecon236_optimize_holt_adaptive():
+    '''Adaptive method matches dense grid with 10 times fewer losses.'''
+    values = 100 * np.exp(np.cumsum(np.random.RandomState(236).standard_t(
+        3, 600) * 0.01))
+    data = pd.DataFrame({'Y': values},
+                        index=pd.bdate_range('2016-01-01', periods=600))
+    alpha, beta, evaluations = hw.adaptive_holt(data)
+    assert evaluations < 250
+    dense = hw.optimize_holt(data, grids=50)
+    adaptive = hw.optimize_holt(data, method='adaptive')
+    assert adaptive[:2] == [alpha, beta]
+    assert abs(alpha - dense[0]) < 0.01 and abs(beta - dense[1]) < 0.01
+    assert adaptive[3] <= dense[3]
+    for kwargs in [{'tol': 0}, {'tol': -0.01}, {'coarse': 1}]:
+        with pytest.raises(ValueError):
+            hw.adaptive_holt(data, **kwargs)
+
+
+def test_holtwinters_fecon236_holt_many_equals_holt():
+    '''Columns are smoothed as holt() would, skipping missing values.'''
+    values = 100 * np.exp(np.cumsum(np.random.RandomState(236).normal(
+        0, 0.01, (100, 3)), axis=0))
+    gdf = pd.DataFrame(values, columns=['A', 'B', 'C'],
+                       index=pd.bdate_range('2018-01-01', periods=100))
+    gdf.iloc[:10, 1] = np.nan
+    gdf.iloc[40:45, 2] = np.nan
+    level, growth = hw.holt_many(gdf, beta=[0.19, 0.0, 0.5])
+    assert level.index.equals(gdf.index)
+    assert level['B'].isnull().sum() == 10
+    for key, beta in zip(gdf.columns, [0.19, 0.0, 0.5]):
+        l, b = hw._holt_winters_growth_loop(gdf[key].dropna().values,
+                                            hw.hw_alpha, beta)
+        assert np.array_equal(level[key].dropna().values, l)
+        assert np.array_equal(growth[key].dropna().values, b)
+
+
+def test_holtwinters_fecon236_holtstate_online_updates():
+    '''State seeded on history, then updated per tick, equals holt().'''
+    state = hw.holtstate(xau[:20].copy())
+    state.update_many(xau[20:])
+    state.update(xau['Y'].iloc[-1], xau.index[-1])
+    #     ^resent tick is ignored.
+    state.update(np.nan)
+    full = hw.holt(xau.copy())
+    assert state.last == xau.index[-1]
+    assert np.allclose([state.y, state.level, state.growth],
+                       full.values[-1], rtol=1e-12)
+    assert np.allclose(state.forecast(6).values,
+                       hw.holtforecast(full, 6).values, rtol=1e-12)
+    clone = pickle.loads(pickle.dumps(state))
+    assert repr(clone) == repr(state)
+    assert not hasattr(state, '__dict__')
+
+
 #  Very strange... this test passed from 2018-06-01 to 2018-07-27
 #                  for Travis builds 43 through 99.
 #  During that time the underlying code did not change.
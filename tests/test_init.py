@@ -0,0 +1,79 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_init.py :: Test lazy imports of fecon236 package.
+
+- "import fecon236" alone does not import the heavy dependencies;
+  checked in a fresh interpreter, since pytest itself imports them.
+- Names and aliases load upon first access, and star import
+  still gives the whole namespace.
+- Python below 3.7 is told so by ImportError.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test ImportError for Python below 3.7.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import sys
+import subprocess
+from fecon236.util import system
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+heavy = ['matplotlib', 'sympy', 'statsmodels', 'scipy.optimize',
+         'pandas_datareader']
+
+
+def fresh(script):
+    '''Run script in a fresh interpreter, return its printed output.'''
+    return subprocess.check_output([sys.executable, '-c', script],
+                                   universal_newlines=True).strip()
+
+
+def test_init_fecon236_import_is_light():
+    '''Package import defers heavy dependencies until first access.'''
+    script = ('import sys, fecon236 as fe\n'
+              'print([m for m in {} if m in sys.modules])\n'
+              'fe.diflog\n'
+              'print([m for m in {} if m in sys.modules])\n'
+              ).format(heavy, ['matplotlib', 'sympy', 'pandas_datareader'])
+    assert fresh(script).splitlines() == ['[]', '[]']
+
+
+def test_init_fecon236_lazy_names():
+    '''Aliases and functions resolve to their modules.'''
+    script = ('import fecon236 as fe\n'
+              'from fecon236.tsa import holtwinters\n'
+              'from fecon236.host import hostess, fred\n'
+              'print(fe.hw is holtwinters, fe.get is hostess.get,\n'
+              '      fe.d4xau == fred.d4xau, callable(fe.plot))\n'
+              'ns = {}\n'
+              'exec("from fecon236 import *", ns)\n'
+              'print(all(k in ns for k in ["gmix", "boltz", "getfred"]))\n')
+    assert fresh(script).splitlines() == ['True True True True', 'True']
+
+
+def test_init_fecon236_requires_python37():
+    '''Older interpreter gets an explicit ImportError.'''
+    script = ('import sys\n'
+              'sys.version_info = (3, 6, 9)\n'
+              'try:\n'
+              '    import fecon236\n'
+              'except ImportError as e:\n'
+              '    print(e)\n')
+    assert 'Python 3.7 or later' in fresh(script)
+
+
+if __name__ == "__main__":
+    system.endmodule()
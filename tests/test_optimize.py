@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-05-30
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  test_optimize.py :: Test fecon236 optimize module.
@@ -44,6 +44,7 @@ REFERENCE
             or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test minBrute() by worker processes, and by given executor.
 2018-05-30  fecon236 fork. Pass flake8, fix imports.
 2016-04-08  fecon235 v5.18.0312, https://git.io/fecon235
 '''
@@ -51,6 +52,7 @@ CHANGE LOG  For LATEST version, see https://git.io/fecon236
 from __future__ import absolute_import, print_function, division
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from fecon236.util import system
 from fecon236.oc import optimize as yop
 #  Assuming that DISPLAY=0 at optimize module.
@@ -145,6 +147,21 @@ def test_minBrute_optimize_fecon236_Adequate_boundpairs():
     assert abs(result[1] - b_true) < 1.0
 
 
+def test_minBrute_optimize_fecon236_parallel_workers():
+    '''Test minBrute by worker processes gives the serial result.'''
+    boundpairs = [(70.0, 90.0), (70.0, 90.0)]
+    serial = yop.minBrute(fun=aberror, funarg=(y_true, x_true),
+                          boundpairs=boundpairs, grids=20)
+    result = yop.minBrute(fun=aberror, funarg=(y_true, x_true),
+                          boundpairs=boundpairs, grids=20, workers=2)
+    assert np.array_equal(result, serial)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = yop.minBrute(fun=aberror, funarg=(y_true, x_true),
+                              boundpairs=boundpairs, grids=20,
+                              executor=executor)
+    assert np.array_equal(result, serial)
+
+
 def test_minNelder_optimize_fecon236_wild_startparms():
     '''Test minNelder using wild starting parameter guesses.'''
     startparms = np.array([1000.0, 1000.0])
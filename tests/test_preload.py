@@ -0,0 +1,100 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_preload.py :: Test fecon236 preload module offline.
+
+- Named codes are collected from host modules, without synonyms.
+- preload() fills the local cache from a replayed vendor, and
+  its command line interface exits nonzero upon any failure.
+- Synthetic w4cotr_* codes preload their CFTC reports to disk.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test preloaded COTR indicator is a disk-cache hit.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import pandas as pd
+from os import sep
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import qdl
+from fecon236.host import cache
+from fecon236.host import replay
+from fecon236.host import preload
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+zfile = 'tests' + sep + 'zdata-xau-13hj-c30.csv'
+with open(zfile, 'rb') as f:
+    xaucsv = f.read()
+
+
+def test_preload_fecon236_namedcodes():
+    '''All frequency prefixes are found, synonyms only once.'''
+    named = preload.namedcodes()
+    assert named['d4xau'] == fred.d4xau
+    assert 'd4xauusd' not in named
+    assert 'q4gdpus' in named and 'w4cotr_xau' in named
+    assert 'd7xbtusd' in named
+    assert len(set(named.values())) == len(named)
+
+
+def test_preload_fecon236_preload_cache(tmpdir, monkeypatch):
+    '''Named series lands in cache; a failure sets exit status.'''
+    monkeypatch.chdir(tmpdir)
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir.join('cache')))
+    rec = str(tmpdir.join('rec'))
+    replay.seed(rec, fred.makeURL(fred.d4xau), xaucsv)
+    with replay.replaying(rec, caching=True):
+        report = preload.preload(['d4xau'], workers=2)
+        assert report.loc[fred.d4xau, 'rows'] == 30
+        assert report.loc[fred.d4xau, 'membytes'] > 0
+        assert report.loc[fred.d4xau, 'error'] == ''
+        assert preload.main(['-q', 'd4xau']) == 0
+        assert preload.main(['-q', 'd4xau', 'NOTRECORDED']) == 1
+    assert cache.load('fred', fred.d4xau) is not None
+
+
+def test_preload_fecon236_cotr_disk_cache(tmpdir, monkeypatch):
+    '''Preloaded COTR indicator is served from disk in a new session.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    monkeypatch.setattr(cache, 'CACHING', True)
+    calls = []
+    dates = pd.date_range('2018-01-02', periods=4, freq='W-TUE')
+
+    def notfred(fredcode):
+        raise IOError('not a FRED series')
+
+    def fakeqget(quandlcode, **kwargs):
+        calls.append(quandlcode)
+        return pd.DataFrame({'Money Manager Longs': [1., 2., 3., 4.],
+                             'Money Manager Shorts': [1., 1., 1., 1.]},
+                            index=dates)
+
+    monkeypatch.setattr(fred, 'download_fred', notfred)
+    monkeypatch.setattr(qdl, '_qget', fakeqget)
+    qdl.qmemo_clear()
+    report = preload.preload(['w4cotr_xau'], workers=1)
+    assert report.loc[qdl.w4cotr_xau, 'error'] == ''
+    assert calls == ['CFTC/GC_FO_ALL']
+    qdl.qmemo_clear()
+    #  ^As if a new process: only the disk cache remains.
+    df = qdl.getqdl(qdl.w4cotr_xau)
+    assert list(df['Y']) == [0.5, 2 / 3, 0.75, 0.8]
+    assert calls == ['CFTC/GC_FO_ALL']
+    qdl.qmemo_clear()
+
+
+if __name__ == "__main__":
+    system.endmodule()
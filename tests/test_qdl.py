@@ -1,10 +1,14 @@
-#  Python Module for import                           Date : 2018-05-22
+#  Python Module for import                           Date : 2026-10-18
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
 '''
 _______________|  test_qdl.py :: Test fecon236 qdl module for Quandl.
 
 - Implicit test of _ex_Quandl.py imported by qdl module.
 - Test online data retrieval of Bitcoin prices.
+- Offline test of multiset get() in _ex_Quandl.py.
+- Offline test of COTR indicators sharing CFTC reports.
+- Offline test of Shiller m4spx_1871_* sharing MULTPL series.
+- Vectorized freqM2MS() agrees with per-element conversion.
 
 Testing: We favor pytest over nosetests, so e.g.
     $ py.test --doctest-modules
@@ -14,15 +18,28 @@ REFERENCE
             or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test getqdl() shares disk cache entry of qmemo_get().
+2026-10-18  Test memoized MULTPL series unchanged by callers.
+2026-10-18  Test cotr_get() copy leaves memoized report intact.
+2026-10-18  Test multiset with repeated dataset and repeated dates.
+2026-10-18  Test freqM2MS() fast path and resampling path.
+2026-10-18  Test getm4spx_1871_all() downloads each series once.
+2026-10-18  Test COTR indicators download each CFTC report once.
+2026-10-18  Test multiset alignment offline, including missing dataset.
 2018-05-23  Mark download test function with "oLocal".
 2018-05-22  First version.
 '''
 
 from __future__ import absolute_import, print_function, division
 
+import numpy as np
+import pandas as pd
 from fecon236 import tool
 from fecon236.util import system
 from fecon236.host import qdl
+from fecon236.host import fred
+from fecon236.host import cache
+from fecon236.host import _ex_Quandl as quandl
 #
 #  In this tests directory without __init__.py, we use absolute import,
 #  as if outside the fecon236 package, not relative import.
@@ -57,5 +74,149 @@ def test_qdl_fecon236_Check_xbt_prices_vSlow_oLocal():
     return
 
 
+def test_qdl_fecon236_multiset_aligned(tmpdir, monkeypatch):
+    '''List of datasets is outer joined on dates, sorted ascending.'''
+    monkeypatch.chdir(tmpdir)
+    #  ^_ex_Quandl may look for its authtoken.p file here.
+    dates = pd.to_datetime(['2018-01-01', '2018-01-02', '2018-01-03'])
+
+    def download(url, priority=None):
+        if 'MISSING' in url:
+            raise quandl.HTTPError(url, 404, 'Not Found', {}, None)
+        rows = [0, 2] if 'A/ONE' in url else [1, 2]
+        return pd.DataFrame({'Value': [float(i) for i in rows]},
+                            index=pd.Index(dates[rows], name='Date'))
+
+    monkeypatch.setattr(quandl, '_download', download)
+    df = quandl.get(['A/ONE', 'B/TWO', 'C/MISSING'])
+    assert list(df.columns) == ['A.ONE - Value', 'B.TWO - Value',
+                                'C.MISSING - NOT FOUND']
+    assert list(df.index) == list(dates)
+    assert df['A.ONE - Value'].isnull().sum() == 1
+    assert df['C.MISSING - NOT FOUND'].isnull().all()
+
+
+def test_qdl_fecon236_multiset_repeated(tmpdir, monkeypatch):
+    '''Repeated dataset gets suffixed columns; repeated dates merge.'''
+    monkeypatch.chdir(tmpdir)
+    dates = pd.to_datetime(['2018-01-01', '2018-01-02', '2018-01-02'])
+
+    def download(url, priority=None):
+        rows = [0, 1, 2] if 'D/DUP' in url else [0, 1]
+        return pd.DataFrame({'Value': [float(i) for i in rows]},
+                            index=pd.Index(dates[rows], name='Date'))
+
+    monkeypatch.setattr(quandl, '_download', download)
+    df = quandl.get(['A/ONE', 'B/TWO', 'A/ONE'])
+    assert list(df.columns) == ['A.ONE - Value', 'B.TWO - Value',
+                                'A.ONE - Value.1']
+    assert list(df['A.ONE - Value.1']) == [0.0, 1.0]
+    df = quandl.get(['A/ONE', 'D/DUP', 'A/ONE'])
+    assert list(df.columns) == ['A.ONE - Value', 'D.DUP - Value',
+                                'A.ONE - Value.1']
+    assert list(df['D.DUP - Value']) == [0.0, 1.0, 2.0]
+    assert list(df['A.ONE - Value.1']) == [0.0, 1.0, 1.0]
+
+
+def test_qdl_fecon236_cotr_shared_reports(tmpdir, monkeypatch):
+    '''Each CFTC report is downloaded once for all COTR indicators.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    #  ^Raw reports also land in the disk cache.
+    calls = []
+    dates = pd.date_range('2018-01-02', periods=4, freq='W-TUE')
+
+    def fakeqget(quandlcode, **kwargs):
+        calls.append(quandlcode)
+        n = float(len(calls))
+        if quandlcode in ['CFTC/GC_FO_ALL', 'CFTC/SI_FO_ALL']:
+            cols = ['Money Manager Longs', 'Money Manager Shorts']
+        else:
+            cols = ['Asset Manager Longs', 'Asset Manager Shorts']
+        return pd.DataFrame({cols[0]: [n, 2 * n, 3 * n, 4 * n],
+                             cols[1]: [n, n, n, n]}, index=dates)
+
+    monkeypatch.setattr(qdl, '_qget', fakeqget)
+    qdl.qmemo_clear()
+    qdl.cotr_preload([qdl.w4cotr_metals, qdl.w4cotr_usd])
+    assert sorted(calls) == ['CFTC/EC_FO_ALL', 'CFTC/GC_FO_ALL',
+                             'CFTC/JY_FO_ALL', 'CFTC/SI_FO_ALL']
+    metals = qdl.getqdl(qdl.w4cotr_metals)
+    usd = qdl.cotr_position_usd()
+    xau = qdl.getqdl(qdl.w4cotr_xau)
+    assert len(calls) == 4
+    #  Longs / (longs + shorts) is the same for every fake report:
+    expect = [0.5, 2 / 3, 0.75, 0.8]
+    assert list(metals['Y'].round(6)) == [round(x, 6) for x in expect]
+    assert list(xau['Y'].round(6)) == [round(x, 6) for x in expect]
+    assert list(usd['Y'].round(6)) == [round(1 - x, 6) for x in expect]
+    qdl.cotr_position_bonds()
+    qdl.cotr_position_equities()
+    assert len(calls) == 8
+    report = qdl.cotr_get('GC')
+    report.columns = ['A', 'B']
+    report.iloc[0, 0] = -1.0
+    assert list(qdl.cotr_get('GC').columns) == ['Money Manager Longs',
+                                                'Money Manager Shorts']
+    assert qdl.cotr_get('GC').iloc[0, 0] != -1.0
+    assert len(calls) == 8
+    qdl.qmemo_clear()
+
+
+def test_qdl_fecon236_spx_1871_shared(tmpdir, monkeypatch):
+    '''Price, earnings, dividends cost one download per series.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    calls = []
+    dates = pd.to_datetime(['2018-01-31', '2018-02-28', '2018-03-30'])
+    values = {'MULTPL/SP500_REAL_PRICE_MONTH': [2800., 2700., 2650.],
+              'MULTPL/SP500_PE_RATIO_MONTH': [28., 27., 26.5],
+              'MULTPL/SP500_DIV_YIELD_MONTH': [2., 1., 4.]}
+
+    def fakeqget(quandlcode, **kwargs):
+        calls.append(quandlcode)
+        return pd.DataFrame({'Value': values[quandlcode]}, index=dates)
+
+    monkeypatch.setattr(qdl, '_qget', fakeqget)
+    qdl.qmemo_clear()
+    df = qdl.getm4spx_1871_all()
+    assert sorted(calls) == sorted(values)
+    assert list(df.columns) == ['Price', 'Earnings', 'Dividends']
+    assert list(df['Earnings']) == [100., 100., 100.]
+    assert list(df['Dividends']) == [56., 27., 106.]
+    assert str(df.index[0].date()) == '2018-01-01'
+    qdl.getqdl(qdl.m4spx_1871_d)
+    qdl.getqdl(qdl.m4spx_1871_e)
+    assert len(calls) == 3
+    ratio = qdl._spx_1871('ratio')
+    ratio.columns = ['Y']
+    ratio *= 2
+    assert list(qdl._spx_1871('ratio')['Value']) == [28., 27., 26.5]
+    assert list(qdl.getm4spx_1871_e()['Y']) == [100., 100., 100.]
+    qdl.qmemo_clear()
+    #  ^Vanilla getqdl() is served by the disk cache of qmemo_get():
+    qdl.getqdl('MULTPL/SP500_PE_RATIO_MONTH')
+    assert len(calls) == 3
+    qdl.qmemo_clear()
+
+
+def test_qdl_fecon236_freqM2MS_vectorized():
+    '''Month start conversion equals former per-element method.'''
+    def former(dataframe):
+        df = dataframe.set_index(pd.DatetimeIndex(
+                                 [i.replace(day=1) for i in dataframe.index]))
+        df.index = df.index.normalize()
+        df.index.name = 'T'
+        return fred.monthly(df)
+
+    idx = pd.date_range('1871-01-31', periods=240, freq='M')
+    df = pd.DataFrame({'Value': np.arange(240.0)}, index=idx)
+    fast = qdl.freqM2MS(df)
+    assert fast.equals(former(df))
+    assert fast.index.freqstr == 'MS'
+    #  Missing months force the resampling path:
+    gaps = df.drop(df.index[[5, 6, 100]])
+    assert qdl.freqM2MS(gaps).equals(former(gaps))
+    assert qdl.freqM2MS(gaps).loc['1871-06-01'].isnull().all()
+
+
 if __name__ == "__main__":
     system.endmodule()
@@ -0,0 +1,95 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_quota.py :: Test fecon236 quota module.
+
+- Calls are paced so that no window of the period exceeds the limit.
+- Waiting calls of higher priority are served first.
+- Timeout, usage report, and enforcement in _ex_Quandl downloads.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import time
+import threading
+import pytest
+from fecon236.util import system
+from fecon236.host import quota
+from fecon236.host import session
+from fecon236.host import _ex_Quandl as quandl
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+@pytest.fixture
+def tiny(monkeypatch):
+    '''Limit of 20 calls per half second, restored afterwards.'''
+    monkeypatch.setattr(quota, 'ENFORCE', True)
+    quota.configure([('half', 20, 0.5)])
+    yield quota
+    quota.configure([('10min', 2000, 600), ('day', 50000, 86400)])
+
+
+def test_quota_fecon236_paced_window(tiny):
+    '''40 calls take at least a period, never over limit in a window.'''
+    stamps = []
+    for _ in range(40):
+        quota.acquire()
+        stamps.append(time.time())
+    assert stamps[-1] - stamps[0] >= 0.5
+    for t in stamps:
+        assert sum(1 for s in stamps if t <= s < t + 0.5) <= 20
+    report = quota.usage()
+    assert report['half']['used'] == 40
+    assert report['queued'] == 0
+
+
+def test_quota_fecon236_priority_timeout(tiny):
+    '''HIGH is served before earlier LOW; timeout gives up.'''
+    quota.configure([('slow', 20, 5.0)])
+    #  ^a token every 0.28 seconds, ample time for HIGH to arrive.
+    quota.exhausted()
+    order = []
+
+    def call(priority, label):
+        quota.acquire(priority)
+        order.append(label)
+
+    low = threading.Thread(target=call, args=(quota.LOW, 'low'))
+    low.start()
+    time.sleep(0.01)
+    high = threading.Thread(target=call, args=(quota.HIGH, 'high'))
+    high.start()
+    low.join()
+    high.join()
+    assert order == ['high', 'low']
+    quota.exhausted()
+    assert not quota.acquire(timeout=0.001)
+    assert quota.usage()['queued'] == 0
+
+
+def test_quota_fecon236_quandl_download(tiny, monkeypatch):
+    '''Downloads acquire quota; none available raises CallLimitExceeded.'''
+    monkeypatch.setattr(session, 'fetch', lambda url: b'Date,V\n')
+    monkeypatch.setattr(quandl, 'QUOTA_MAXWAIT', 0)
+    used = quota.usage()['half']['used']
+    quandl._download('https://example/x.csv')
+    assert quota.usage()['half']['used'] == used + 1
+    quota.exhausted()
+    with pytest.raises(quandl.CallLimitExceeded):
+        quandl._download('https://example/x.csv')
+
+
+if __name__ == "__main__":
+    system.endmodule()
@@ -0,0 +1,88 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_replay.py :: Test fecon236 replay module.
+
+- Responses seeded into a directory are replayed by the local server,
+  through the unchanged host functions, e.g. fred.getfred().
+- Recording keeps responses without authentication tokens.
+- Unrecorded requests fail as they would at the vendor.
+- Stock frames are recorded and replayed as dataframes.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import time
+import pytest
+from os import sep
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import stock
+from fecon236.host import replay
+from fecon236.host import session
+from fecon236.host import _ex_Quandl as quandl
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+zfile = 'tests' + sep + 'zdata-xau-13hj-c30.csv'
+xau = fred.readfile(zfile)
+with open(zfile, 'rb') as f:
+    xaucsv = f.read()
+
+
+def test_replay_fecon236_getfred_offline(tmpdir):
+    '''Seeded FRED response is served with latency, cache bypassed.'''
+    rec = str(tmpdir)
+    replay.seed(rec, fred.makeURL(fred.d4xau), xaucsv)
+    with replay.replaying(rec, latency=0.05):
+        start = time.time()
+        df = fred.getfred(fred.d4xau)
+        assert time.time() - start >= 0.05
+        assert df.equals(xau)
+        with pytest.raises(Exception):
+            fred.getfred('NOTRECORDED')
+    assert session.REDIRECT is None
+
+
+def test_replay_fecon236_record_without_secrets(tmpdir):
+    '''Recording, via a replay server standing in for the vendor.'''
+    source = str(tmpdir.join('source'))
+    rec = str(tmpdir.join('rec'))
+    url = quandl.QUANDL_API_URL + 'datasets/X/Y.csv?auth_token=SECRET'
+    replay.seed(source, url, xaucsv)
+    with replay.replaying(source):
+        with replay.recording(rec):
+            session.fetch(url)
+    assert replay.lookup(rec, url) == xaucsv
+    index = replay._readindex(rec)
+    assert 'SECRET' not in str(index)
+
+
+def test_replay_fecon236_stock_frames(tmpdir, monkeypatch):
+    '''Stock dataframe recorded during download is replayed later.'''
+    rec = str(tmpdir)
+    monkeypatch.setattr(stock.pddata, 'DataReader',
+                        lambda *args, **kwargs: xau.copy())
+    with replay.recording(rec):
+        stock.download_stock('s4spy', 30)
+    monkeypatch.setattr(stock.pddata, 'DataReader', None)
+    with replay.replaying(rec):
+        assert stock.download_stock('s4spy', 30).equals(xau)
+        with pytest.raises(IOError):
+            stock.download_stock('s4qqq', 30)
+
+
+if __name__ == "__main__":
+    system.endmodule()
@@ -0,0 +1,118 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_session.py :: Test fecon236 session module.
+
+- Local HTTP server on the loopback interface, so no internet is needed.
+- Repeated fetches reuse a single kept-alive connection.
+- HTTP error status raises HTTPError, as urlopen would.
+- Downloads by fred and _ex_Quandl go through the session.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import gzip
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.error import HTTPError
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import session
+from fecon236.host import _ex_Quandl as quandl
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+csvtext = b'DATE,VALUE\n2018-01-02,1.5\n2018-01-03,.\n2018-01-04,2.5\n'
+
+
+class Handler(BaseHTTPRequestHandler):
+    '''Serve csvtext gzip compressed, else 404 if path contains "missing".'''
+    protocol_version = 'HTTP/1.1'
+    #                  ^keep-alive.
+    ports = []
+
+    def do_GET(self):
+        self.ports.append(self.client_address[1])
+        if 'missing' in self.path:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = gzip.compress(csvtext)
+        self.send_response(200)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    '''Threads, so that a kept-alive connection does not block shutdown.'''
+    daemon_threads = True
+
+
+@pytest.fixture
+def server():
+    '''Local HTTP server in a thread, with fresh session.'''
+    httpd = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    del Handler.ports[:]
+    session.configure()
+    yield 'http://127.0.0.1:{}/'.format(httpd.server_address[1])
+    session.configure()
+    #  ^closes pooled connections.
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_session_fecon236_keepalive(server):
+    '''Repeated fetches are decompressed, and reuse the connection.'''
+    for i in range(5):
+        assert session.fetch(server + str(i)) == csvtext
+    assert len(Handler.ports) == 5
+    if session.requests is not None:
+        assert len(set(Handler.ports)) == 1
+
+
+def test_session_fecon236_httperror(server):
+    '''Status 404 raises HTTPError with the same message as urlopen.'''
+    with pytest.raises(HTTPError) as e:
+        session.fetch(server + 'missing')
+    assert str(e.value) == 'HTTP Error 404: Not Found'
+
+
+def test_session_fecon236_hosts(server, monkeypatch, tmpdir):
+    '''fred and _ex_Quandl download through the session.'''
+    monkeypatch.chdir(tmpdir)
+    #  ^_ex_Quandl may look for its authtoken.p file here.
+    monkeypatch.setattr(fred, 'makeURL', lambda code: server + code)
+    df = fred.download_fred('DFF')
+    assert list(df['Y'].values) == [1.5, 1.5, 2.5]
+    df = quandl._download(server + 'quandl')
+    assert list(df.columns) == ['VALUE'] and len(df.index) == 3
+    monkeypatch.setattr(quandl, 'QUANDL_API_URL', server)
+    with pytest.raises(quandl.DatasetNotFound):
+        quandl.get('missing/CODE')
+
+
+if __name__ == "__main__":
+    system.endmodule()
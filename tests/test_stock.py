@@ -0,0 +1,112 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_stock.py :: Test fecon236 stock module offline.
+
+- Hedged vendors: a slow primary is overtaken by the secondary,
+  and a failed primary falls over without waiting.
+- stock_many() downloads ALL columns once per symbol, concurrently,
+  so later stock_one() for any column is served from cache.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test hedged() with empty stock_vendors.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import time
+import threading
+import pandas as pd
+import pytest
+from fecon236.util import system
+from fecon236.host import cache
+from fecon236.host import stock
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+def ohlcv(symbol):
+    '''Small stand-in for vendor answer with ALL columns.'''
+    index = pd.date_range('2018-01-02', periods=3, name='Date')
+    return pd.DataFrame({'Open': [1., 2., 3.], 'High': [2., 3., 4.],
+                         'Low': [.5, 1., 2.], 'Close': [1.5, 2.5, 3.5],
+                         'Volume': [10., 20., 30.]}, index=index)
+
+
+@pytest.fixture
+def vendors(tmpdir, monkeypatch):
+    '''Stand-in vendors: calls are counted, delay set per source.'''
+    monkeypatch.setattr(cache, 'CACHEDIR', str(tmpdir))
+    monkeypatch.setattr(cache, 'CACHING', True)
+    calls = []
+    delays = {'yahoo': 0.0, 'google': 0.0}
+    lock = threading.Lock()
+
+    def fake(symbol, source, start, end):
+        with lock:
+            calls.append((symbol, source))
+        if delays[source] < 0:
+            raise IOError('vendor down')
+        time.sleep(delays[source])
+        return ohlcv(symbol)
+
+    monkeypatch.setattr(stock, '_datareader', fake)
+    return calls, delays
+
+
+def test_stock_fecon236_hedged_slow_primary(vendors):
+    '''Slow primary vendor is overtaken by the secondary.'''
+    calls, delays = vendors
+    delays['yahoo'] = 2.0
+    t0 = time.time()
+    df = stock.hedged('SPY', None, None, hedge=0.1)
+    assert time.time() - t0 < 1.5
+    assert list(df['Close']) == [1.5, 2.5, 3.5]
+    assert calls == [('SPY', 'yahoo'), ('SPY', 'google')]
+
+
+def test_stock_fecon236_hedged_failover(vendors):
+    '''Failed primary falls over at once; all failing raises error.'''
+    calls, delays = vendors
+    delays['yahoo'] = -1
+    t0 = time.time()
+    stock.hedged('SPY', None, None, hedge=5)
+    assert time.time() - t0 < 1.0
+    delays['google'] = -1
+    with pytest.raises(IOError):
+        stock.hedged('SPY', None, None, hedge=5)
+
+
+def test_stock_fecon236_hedged_no_vendors(vendors, monkeypatch):
+    '''Empty stock_vendors raises ValueError before any download.'''
+    calls, delays = vendors
+    monkeypatch.setattr(stock, 'stock_vendors', [])
+    with pytest.raises(ValueError, match='stock_vendors'):
+        stock.hedged('SPY', None, None)
+    assert calls == []
+
+
+def test_stock_fecon236_stock_many_cached(vendors):
+    '''ALL columns fetched once per symbol, then columns from cache.'''
+    calls, delays = vendors
+    dfs = stock.stock_many(['s4spy', 's4gld'], 30)
+    assert sorted(dfs) == ['s4gld', 's4spy']
+    assert list(dfs['s4gld'].columns) == list(ohlcv('GLD').columns)
+    assert sorted(calls) == [('GLD', 'yahoo'), ('SPY', 'yahoo')]
+    for col in ['Open', 'Close', 'Volume']:
+        df = stock.stock_one('s4spy', 30, col)
+        assert list(df.iloc[:, 0]) == list(ohlcv('SPY')[col])
+    assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    system.endmodule()
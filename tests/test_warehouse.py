@@ -0,0 +1,101 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+'''
+_______________|  test_warehouse.py :: Test fecon236 warehouse module.
+
+- Round trip of save() and load() for single and multiple columns.
+- Loaded values are memory-mapped, copy-on-write.
+- readarchive() converts a gzip CSV archive once.
+
+Testing: We favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+            or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For LATEST version, see https://git.io/fecon236
+2026-10-18  Test round trip of integer column and non-str labels.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import numpy as np
+from os import sep
+from fecon236 import tool
+from fecon236.util import system
+from fecon236.host import fred
+from fecon236.host import warehouse
+#
+#  In this tests directory without __init__.py, we use absolute import,
+#  as if outside the fecon236 package, not relative import.
+
+
+xau = fred.readfile('tests' + sep + 'zdata-xau-13hj-c30.csv')
+
+
+def test_warehouse_fecon236_roundtrip(tmpdir):
+    '''Saved dataframe loads identically, including names.'''
+    path = str(tmpdir.join('xau'))
+    assert warehouse.load(path) is None
+    warehouse.save(path, xau)
+    df = warehouse.load(path)
+    assert df.equals(xau)
+    assert df.index.name == 'T'
+    assert warehouse.nbytes(path) > 30 * 16
+
+
+def test_warehouse_fecon236_multicolumn_copy_on_write(tmpdir):
+    '''Multiple columns, and changes in memory never reach the disk.'''
+    path = str(tmpdir.join('two'))
+    two = tool.paste([tool.todf(xau.copy(), 'A'),
+                      tool.todf(xau * 2, 'B')])
+    #                           ^todf renames in place.
+    warehouse.save(path, two)
+    df = warehouse.load(path)
+    base = df.values
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert base is not None
+    #      ^zero-copy: values are backed by the memory map.
+    df.iloc[0, 0] = 0.0
+    assert warehouse.load(path).equals(two)
+    #  Saving again replaces the former files:
+    warehouse.save(path, xau)
+    assert warehouse.load(path).equals(xau)
+    assert len(tmpdir.join('two').listdir()) == 3
+
+
+def test_warehouse_fecon236_dtypes_and_labels(tmpdir):
+    '''Integer column and integer labels survive the round trip.'''
+    path = str(tmpdir.join('ints'))
+    mixed = xau.copy()
+    mixed.columns = [0]
+    mixed['Volume'] = np.arange(len(xau), dtype=np.int64) * 1000
+    warehouse.save(path, mixed)
+    df = warehouse.load(path)
+    assert df.equals(mixed)
+    assert list(df.columns) == [0, 'Volume']
+    assert df['Volume'].dtype == np.int64
+
+
+def test_warehouse_fecon236_readarchive(tmpdir):
+    '''Archive is parsed by reader only once, while unchanged.'''
+    arc = str(tmpdir.join('FRED-XAU-ARC.csv.gz'))
+    xau.to_csv(arc, compression='gzip')
+    calls = []
+
+    def reader(filename):
+        calls.append(filename)
+        return fred.readfile(filename, compress='gzip')
+
+    path = str(tmpdir.join('arc'))
+    first = warehouse.readarchive(arc, reader, path)
+    second = warehouse.readarchive(arc, reader, path)
+    assert len(calls) == 1
+    assert first.equals(xau) and second.equals(xau)
+
+
+if __name__ == "__main__":
+    system.endmodule()